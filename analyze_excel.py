@@ -1,7 +1,8 @@
-import pandas as pd
 import os
 import sys
 
+from legacy_import import list_sheets, read_sheet
+
 # Redirect stdout to a file
 sys.stdout = open('analysis_result.txt', 'w', encoding='utf-8')
 
@@ -10,14 +11,17 @@ if not os.path.exists(file_path):
     print(f"File not found: {file_path}")
 else:
     try:
-        # Read the Excel file to understand sheets and columns
-        xl = pd.ExcelFile(file_path)
-        print(f"Sheet names: {xl.sheet_names}")
+        # Open the workbook once and stream each sheet (header row detected automatically)
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        sheet_names = list_sheets(data)
+        print(f"Sheet names: {sheet_names}")
         
-        for sheet in xl.sheet_names:
+        for sheet in sheet_names:
             print(f"\n--- Sheet: {sheet} ---")
             try:
-                df = pd.read_excel(file_path, sheet_name=sheet, nrows=5)
+                df, header_row = read_sheet(data, sheet, max_rows=5)
+                print(f"Header row: {header_row}")
                 print("Columns:")
                 print(df.columns.tolist())
                 print("First 5 rows:")
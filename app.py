@@ -1,12 +1,32 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import io
+import numpy as np
+import gzip
 import os
-import re
 from datetime import date, timedelta
 
+from charts import FAST_GANTT_ROWS, GANTT_COLS, LOD_MAX_ROWS, add_delivery_line, create_s_curve_chart, create_schedule_gantt
+from diagnostics import finish_run, history_frame, history_json, new_run, stage, stage_frame
+from delay_analysis import ALERT_COLS, ALERT_DELIVERY, crash_limits_frame, crash_limits_from_frame
+from excel_gantt import gantt_excel_bytes
+from figure_cache import cached_figure, figure_html, figure_key, frame_fingerprint, new_store
+from legacy_import import list_sheets, read_sheet, to_schedule
+from monthly_report import TEMPLATE_PATH as MONTHLY_TEMPLATE, monthly_report_bytes
+from portfolio import find_workbooks, portfolio_progress, summarize_portfolio
+from progress_engine import month_bounds, overall_status
+from risk_analysis import PERCENTILES, risk_ranges_frame, risk_ranges_from_frame, simulate_risk
+from resource_leveling import CAPACITY_COLS, capacities_from_frame, capacity_frame, level_manufacturing
+from report import build_report_html, create_data_table_html, create_offline_tables, create_review_table_html, plotly_bundle_html, safe_filename, schedule_excel_bytes
+from svg_gantt import render_svg_gantt, svg_gantt_html
+from scurve import compute_s_curve, render_svg_s_curve
+from snapshot_store import apply_closed_prev, list_snapshots, load_snapshot, month_key, previous_month, save_snapshot, snapshot_delta
+from startup import record_first_paint, start_prewarm, startup_status
+from schedule_model import ALL_DATE_COLS, ALL_PROG_COLS, PHASES_INFO, PREDECESSOR_COL, VENDOR_COL, is_normalized, new_schedule, normalize_schedule, to_editor_frame
+from upload_cache import cache_summary, load_upload
+from work_calendar import DEFAULT_WEEKMASK, HOLIDAY_FILE, WEEKDAY_LABELS, load_holidays, make_calendar
+from incremental import editor_has_changes, update_derived
+from scheduler import auto_schedule, critical_path_schedule, parse_weeks
+
 # 페이지 설정
 st.set_page_config(page_title="월간 진도 보고서 (Monthly Progress Report)", layout="wide")
 
@@ -27,7 +47,40 @@ with st.sidebar:
         
     st.divider()
     uploaded_file = st.file_uploader("기존 엑셀 파일 불러오기", type=["xlsx", "csv"])
+    legacy_mode = st.checkbox("📑 기존 보고서 시트 선택 가져오기", key="legacy_mode", help="월간진도보고서 등 여러 시트로 된 파일에서 시트를 골라 항목/가중치를 가져옵니다. (스트리밍 읽기)")
     st.info("💡 팀원 배포용: 이 프로그램을 폴더째로 공유하면 됩니다.")
+    # 납품일 초과 시 단축안 계산용 단계별 최소 기간 / 1일 단축 비용
+    with st.expander("⏱️ 단축 한계 및 비용 (Crash Limits)"):
+        crash_frame = st.data_editor(crash_limits_frame(), key="crash_limits", hide_index=True, disabled=['단계 (Phase)'], use_container_width=True)
+        crash_limits = crash_limits_from_frame(crash_frame)
+    # 근무일 달력: 자동 계산 기간/간격, 지연 일수, 단축 기간을 근무일로 계산
+    work_calendar = None
+    with st.expander("📆 근무일 달력 (Working Calendar)"):
+        use_calendar = st.checkbox("근무일 기준으로 계산", value=False, key="use_calendar", help="끄면 달력일(주말/휴일 포함) 기준입니다.")
+        work_days = st.multiselect("근무 요일", WEEKDAY_LABELS, default=[d for d, m in zip(WEEKDAY_LABELS, DEFAULT_WEEKMASK) if m == '1'], key="work_days")
+        holiday_file = st.file_uploader("휴일 목록 (한 줄에 YYYY-MM-DD)", type=["csv", "txt"], key="holiday_file")
+        if use_calendar:
+            try:
+                if holiday_file is not None:
+                    holidays = load_holidays(holiday_file.getvalue())
+                else:
+                    holidays = load_holidays(HOLIDAY_FILE) if os.path.exists(HOLIDAY_FILE) else []
+                work_calendar = make_calendar(work_days, holidays)
+                st.caption(f"주 {len(work_days)}일 근무 · 휴일 {len(holidays)}일 ({holiday_file.name if holiday_file is not None else os.path.basename(HOLIDAY_FILE)})")
+            except ValueError as e:
+                st.error(f"근무일 달력 오류: {e}")
+    use_closed_prev = st.checkbox("🗄️ 전월 실적 = 직전 달 마감 스냅샷", value=True, key="use_closed_prev", help="직전 달 마감 스냅샷이 있으면 전월 실적을 날짜로 다시 계산하지 않고 마감 값으로 고정합니다.")
+    # 단계별 계측 (diagnostics): 켜면 실행(rerun)마다 단계별 시간/행/바이트(/메모리)를 기록. 결과는 스크립트 끝에서 채움
+    with st.expander("🩺 진단 (Diagnostics)"):
+        diag_on = st.checkbox("단계별 시간 기록", value=False, key="diag_on")
+        diag_memory = st.checkbox("최대 메모리 측정 (느려짐)", value=False, key="diag_memory", disabled=not diag_on)
+        diag_slot = st.container()
+
+if 'diag_history' not in st.session_state:
+    st.session_state.diag_history = []
+# 위젯 조작으로 중간에 끊긴 이전 실행은 여기서 마무리 (tracemalloc 사용 수 정리, finish_run 은 한 번만 기록)
+finish_run(st.session_state.get('diag_run'), st.session_state.diag_history)
+diag = st.session_state.diag_run = new_run(project_name, diag_memory, enabled=diag_on)
 
 # 기본 항목 리스트 및 제작 기간 정의
 default_items_map = {
@@ -70,183 +123,131 @@ default_items = list(default_items_map.keys())
 if 'data' not in st.session_state:
     st.session_state.data = None
 
+# 기존 보고서 가져오기 모드: 워크북을 한 번만 열고 선택한 시트만 스트리밍으로 읽는다
+if uploaded_file is not None and legacy_mode and uploaded_file.name.lower().endswith('.xlsx'):
+    with st.sidebar:
+        try:
+            legacy_bytes = uploaded_file.getvalue()
+            legacy_sheet = st.selectbox("시트 선택", list_sheets(legacy_bytes), key="legacy_sheet")
+            legacy_header = st.number_input("헤더 행 번호 (0 = 자동 감지)", min_value=0, max_value=100, value=0, key="legacy_header")
+            if st.button("📥 선택한 시트 가져오기"):
+                sheet_df, header_row = read_sheet(legacy_bytes, legacy_sheet, header_row=legacy_header or None)
+                st.session_state.data, legacy_issues = to_schedule(sheet_df)
+                st.session_state.derived_cache = None
+                st.session_state.cpm_result = None
+                st.session_state.leveling_result = None
+                st.session_state.loaded_file_id = uploaded_file.file_id if hasattr(uploaded_file, 'file_id') else uploaded_file.name
+                for issue in legacy_issues:
+                    st.warning(issue)
+                st.success(f"'{legacy_sheet}' 시트에서 {len(st.session_state.data)}개 항목을 가져왔습니다. (헤더 {header_row}행)")
+        except Exception as e:
+            st.error(f"시트를 가져오는 중 오류가 발생했습니다: {e}")
+
 # 파일값 변경 감지 (새 파일 업로드 시 데이터 갱신)
-if uploaded_file is not None:
+elif uploaded_file is not None:
     # 기존에 로드한 파일과 다른지 확인 (또는 최초 로드)
     curr_file_id = uploaded_file.file_id if hasattr(uploaded_file, 'file_id') else uploaded_file.name
     
     if 'loaded_file_id' not in st.session_state or st.session_state.loaded_file_id != curr_file_id:
         try:
-            if uploaded_file.name.endswith('.csv'):
-                st.session_state.data = pd.read_csv(uploaded_file)
-            else:
-                # Load Data
-                xl = pd.ExcelFile(uploaded_file)
-                st.session_state.data = xl.parse(0) # Assume data is first sheet or 'Schedule'
+            # Load Data (content-hash cache: 같은 내용의 파일은 다시 파싱하지 않음)
+            upload_bytes = uploaded_file.getvalue()
+            with stage(diag, '업로드 파싱 (Upload)') as timing:
+                schedule_df, meta_df = load_upload(upload_bytes, uploaded_file.name)
+                timing['rows'], timing['bytes'] = len(schedule_df), len(upload_bytes)
+            st.session_state.data = schedule_df # Assume data is first sheet or 'Schedule'
                 
-                # Load Metadata if exists
-                if 'ProjectInfo' in xl.sheet_names:
-                    meta_df = xl.parse('ProjectInfo')
-                    if not meta_df.empty:
-                        # Expecting columns: Key, Value or single row with col headers
-                        # Let's assume structure: Columns [ProjectName, StartDate, DeliveryDate]
-                        try:
-                            if 'ProjectName' in meta_df.columns:
-                                st.session_state['project_name'] = str(meta_df.iloc[0]['ProjectName'])
-                            if 'StartDate' in meta_df.columns:
-                                st.session_state['project_start_date'] = pd.to_datetime(meta_df.iloc[0]['StartDate']).date()
-                            if 'DeliveryDate' in meta_df.columns:
-                                st.session_state['contract_delivery_date'] = pd.to_datetime(meta_df.iloc[0]['DeliveryDate']).date()
-                            st.success(f"프로젝트 정보 복구 완료: {st.session_state.get('project_name')}")
-                        except Exception as meta_ex:
-                            st.warning(f"메타데이터 로드 중 일부 오류: {meta_ex}")
+            # Load Metadata if exists
+            if meta_df is not None and not meta_df.empty:
+                # Expecting columns: Key, Value or single row with col headers
+                # Let's assume structure: Columns [ProjectName, StartDate, DeliveryDate]
+                try:
+                    if 'ProjectName' in meta_df.columns:
+                        st.session_state['project_name'] = str(meta_df.iloc[0]['ProjectName'])
+                    if 'StartDate' in meta_df.columns:
+                        st.session_state['project_start_date'] = pd.to_datetime(meta_df.iloc[0]['StartDate']).date()
+                    if 'DeliveryDate' in meta_df.columns:
+                        st.session_state['contract_delivery_date'] = pd.to_datetime(meta_df.iloc[0]['DeliveryDate']).date()
+                    st.success(f"프로젝트 정보 복구 완료: {st.session_state.get('project_name')}")
+                except Exception as meta_ex:
+                    st.warning(f"메타데이터 로드 중 일부 오류: {meta_ex}")
 
             st.session_state.loaded_file_id = curr_file_id
+            st.session_state.derived_cache = None
             st.success(f"파일이 성공적으로 로드되었습니다: {uploaded_file.name}")
+            finish_run(diag, st.session_state.diag_history)
             st.rerun() # Rerun to apply loaded session state to widgets
         except Exception as e:
             st.error(f"파일을 읽는 중 오류가 발생했습니다: {e}")
 
+with st.sidebar:
+    st.caption(f"📦 업로드 캐시: {cache_summary()}")
+
 # 업로드된 파일이 없고 데이터도 없으면 기본 데이터 생성
 if st.session_state.data is None:
-        # 빈 데이터 프레임 생성
-        data = {
-            '항목 (Item)': default_items,
-            '금액 (Amount)': [0] * len(default_items), # New Amount Column
-            # 매핑된 제작 기간 적용, 없으면 0
-            '제작 기간 (Weeks)': [default_items_map.get(item, 0) for item in default_items], 
-            '가중치 (Weight)': [0] * len(default_items),
-            '전월 계획 (Plan Prev)': [0] * len(default_items),
-            '전월 실적 (Actual Prev)': [0] * len(default_items),
-            '금월 계획 (Plan Curr)': [0] * len(default_items),
-            '금월 실적 (Actual Curr)': [0] * len(default_items),
-        }
-        # 날짜 컬럼 추가
-        cols = [
-            '설계 계획 시작', '설계 계획 종료', '설계 실적 시작', '설계 진행률 (%)', '설계 실적 종료',
-            '구매 계획 시작', '구매 계획 종료', '구매 실적 시작', '구매 진행률 (%)', '구매 실적 종료',
-            '제작 계획 시작', '제작 계획 종료', '제작 실적 시작', '제작 진행률 (%)', '제작 실적 종료',
-            '검사 계획 시작', '검사 계획 종료', '검사 실적 시작', '검사 진행률 (%)', '검사 실적 종료',
-            '납품 계획 시작', '납품 계획 종료', '납품 실적 시작', '납품 진행률 (%)', '납품 실적 종료'
-        ]
-        for c in cols:
-            data[c] = [None] * len(default_items)
-            
-        st.session_state.data = pd.DataFrame(data)
+        # 빈 데이터 프레임 생성 (매핑된 제작 기간 적용, 없으면 0)
+        st.session_state.data = new_schedule(default_items_map)
+        st.session_state.derived_cache = None
 
 df = st.session_state.data
 
-# 자동 스케줄링 로직
-# 자동 스케줄링 로직
-def auto_schedule(df, start_date):
-    # Ensure start_date is a proper python date object
-    if isinstance(start_date, pd.Timestamp):
-        base_start = start_date.date()
-    elif isinstance(start_date, date):
-        base_start = start_date
-    else:
-        # Fallback for strings or other types
-        base_start = pd.to_datetime(start_date).date()
-
-    for i, row in df.iterrows():
-        try:
-            # 제작 기간 처리 (float conversion)
-            raw_weeks = row.get('제작 기간 (Weeks)', 0)
-            manuf_weeks = float(raw_weeks) if pd.notnull(raw_weeks) and raw_weeks != '' else 0
-            
-            # 1. 구매 (15일)
-            p_start = base_start
-            p_end = p_start + timedelta(days=15)
-            df.at[i, '구매 계획 시작'] = p_start
-            df.at[i, '구매 계획 종료'] = p_end
-
-            # 2. 설계 (120일) - 구매 종료 + 3일 후 시작
-            d_start = p_end + timedelta(days=3)
-            d_end = d_start + timedelta(days=120)
-            df.at[i, '설계 계획 시작'] = d_start
-            df.at[i, '설계 계획 종료'] = d_end
-            
-            # 3. 제작 (기간 = 주 * 7일) - 설계 종료 + 1일 후 시작
-            if manuf_weeks > 0:
-                m_start = d_end + timedelta(days=1)
-                m_end = m_start + timedelta(days=int(manuf_weeks * 7))
-            else:
-                m_start = None
-                m_end = None
-                
-            df.at[i, '제작 계획 시작'] = m_start
-            df.at[i, '제작 계획 종료'] = m_end
-            
-            # 4. 검사 (14일) - 제작 종료(없으면 설계 종료) + 1일 후 시작
-            base_for_insp = m_end if (m_end is not None) else d_end
-            
-            i_start = base_for_insp + timedelta(days=1)
-            i_end = i_start + timedelta(days=14)
-            df.at[i, '검사 계획 시작'] = i_start
-            df.at[i, '검사 계획 종료'] = i_end
-
-            # 5. 납품 (7일) - 검사 종료 + 7일 후 시작
-            del_start = i_end + timedelta(days=7)
-            del_end = del_start + timedelta(days=7)
-            df.at[i, '납품 계획 시작'] = del_start
-            df.at[i, '납품 계획 종료'] = del_end
-            
-        except Exception as ex:
-            st.error(f"Row {i} ('{row.get('항목 (Item)', 'Unknown')}') 처리 중 오류: {ex}")
-            continue
-            
-    return df
+# 제작 업체 부하 평준화: 업체별 동시 제작 한도 (Auto Plan 때 resource_leveling.level_manufacturing 적용)
+with st.sidebar:
+    with st.expander("🏭 제작 업체 능력 (Vendor Capacity)"):
+        level_vendors = st.checkbox("Auto Plan 때 업체 한도 적용", value=False, key="level_vendors", help="같은 업체에 맡긴 항목의 제작이 동시 제작 수를 넘지 않도록 늦추고, 검사/납품도 같이 미룹니다.")
+        capacity_table = st.data_editor(capacity_frame(df, st.session_state.get('vendor_capacities')), key="vendor_capacity", hide_index=True, disabled=[CAPACITY_COLS[0]], use_container_width=True)
+        st.session_state.vendor_capacities = capacities_from_frame(capacity_table)
+        if capacity_table.empty:
+            st.caption(f"'{VENDOR_COL}' 컬럼에 업체를 입력하면 목록이 나타납니다.")
 
 # 상단 툴바
 col_tool1, col_tool2 = st.columns([1, 4])
 with col_tool1:
     if st.button("📅 일정 자동 계산 (Auto Plan)"):
-        st.session_state.data = auto_schedule(st.session_state.data, project_start_date)
-        st.success("일정이 자동 계산되었습니다! (구매 15일, 설계 120일 등 설정된 규칙 적용)")
-        st.rerun()
+        # 자동 스케줄링 로직 (scheduler.auto_schedule: 전체 항목 일괄 계산)
+        # 선행 항목이 입력되어 있으면 CPM (Forward/Backward Pass) 으로 계산
+        _, weeks_valid = parse_weeks(st.session_state.data)
+        plan_df = st.session_state.data
+        has_links = PREDECESSOR_COL in plan_df.columns and plan_df[PREDECESSOR_COL].fillna('').astype(str).str.strip().ne('').any()
+        try:
+            with stage(diag, 'Auto Plan', len(plan_df)):
+                if has_links:
+                    st.session_state.data, st.session_state.cpm_result, cpm_warnings = critical_path_schedule(plan_df, project_start_date, contract_delivery_date, work_calendar)
+                    for w in cpm_warnings:
+                        st.warning(w)
+                else:
+                    st.session_state.data = auto_schedule(plan_df, project_start_date, work_calendar)
+                    st.session_state.cpm_result = None
+            st.session_state.leveling_result = None
+            if level_vendors and st.session_state.vendor_capacities:
+                with stage(diag, '업체 평준화 (Leveling)', len(plan_df)):
+                    st.session_state.data, level_table, level_summary = level_manufacturing(st.session_state.data, st.session_state.vendor_capacities, contract_delivery_date, work_calendar)
+                st.session_state.leveling_result = (level_table, level_summary)
+            for i in np.flatnonzero(~weeks_valid):
+                row = st.session_state.data.iloc[i]
+                st.error(f"Row {st.session_state.data.index[i]} ('{row.get('항목 (Item)', 'Unknown')}') 처리 중 오류: 제작 기간 값을 해석할 수 없습니다 ({row.get('제작 기간 (Weeks)')})")
+            st.session_state.derived_cache = None
+            st.success("일정이 자동 계산되었습니다! (구매 15일, 설계 120일 등 설정된 규칙 적용)")
+            finish_run(diag, st.session_state.diag_history)
+            st.rerun()
+        except ValueError as ex:
+            st.error(f"일정 계산 오류: {ex}")
 with col_tool2:
     st.info("ℹ️ 항목별 '제작 기간 (Weeks)'이 기본값으로 설정되어 있습니다. 필요시 수정한 후 자동 계산 버튼을 누르세요.")
 
+# 단계 정의 (순서 변경: 구매 -> 설계) - schedule_model.PHASES_INFO
+phases_info = PHASES_INFO
+all_date_cols = ALL_DATE_COLS
+all_prog_cols = ALL_PROG_COLS
+
+# 타입 변환 및 컬럼 순서 재정렬 (업로드/Auto Plan 등으로 새 데이터가 들어왔을 때만 변환)
+if not is_normalized(st.session_state.data):
+    with stage(diag, '정규화 (Normalize)', len(st.session_state.data)):
+        st.session_state.data, schema_issues = normalize_schedule(st.session_state.data)
+    for issue in schema_issues:
+        st.warning(issue)
 df = st.session_state.data
 
-# 단계 정의 (순서 변경: 구매 -> 설계)
-phases_info = [
-    ('구매 (Procurement)', '구매 계획 시작', '구매 계획 종료', '구매 실적 시작', '구매 진행률 (%)', '구매 실적 종료'),
-    ('설계 (Design)', '설계 계획 시작', '설계 계획 종료', '설계 실적 시작', '설계 진행률 (%)', '설계 실적 종료'),
-    ('제작 (Manufacturing)', '제작 계획 시작', '제작 계획 종료', '제작 실적 시작', '제작 진행률 (%)', '제작 실적 종료'),
-    ('검사 (Inspection)', '검사 계획 시작', '검사 계획 종료', '검사 실적 시작', '검사 진행률 (%)', '검사 실적 종료'),
-    ('납품 (Delivery)', '납품 계획 시작', '납품 계획 종료', '납품 실적 시작', '납품 진행률 (%)', '납품 실적 종료'),
-]
-all_date_cols = []
-all_prog_cols = []
-for p in phases_info:
-    all_date_cols.extend([p[1], p[2], p[3], p[5]])
-    all_prog_cols.append(p[4])
-
-# 날짜 형변환 및 컬럼 순서 재정렬 (구매 -> 설계 -> 제작...)
-# phases_info의 순서대로 날짜 컬럼을 정렬한다.
-ordered_columns = ['항목 (Item)', '금액 (Amount)', '제작 기간 (Weeks)', '가중치 (Weight)', '전월 계획 (Plan Prev)', '전월 실적 (Actual Prev)', '금월 계획 (Plan Curr)', '금월 실적 (Actual Curr)']
-for p in phases_info:
-    ordered_columns.extend([p[1], p[2], p[3], p[4], p[5]])
-
-# 데이터프레임에 없는 컬럼이 있을 수 있으므로 교집합만 사용하거나 새로 생성
-for col in ordered_columns:
-    if col not in df.columns:
-        df[col] = None 
-        # 금액 컬럼 기본값 0 처리
-        if col == '금액 (Amount)':
-             df[col] = 0
-        elif '진행률 (%)' in col:
-             df[col] = 0
-
-# 날짜 형변환
-for col in all_date_cols:
-    if col in df.columns:
-        df[col] = pd.to_datetime(df[col], errors='coerce').dt.date
-
-# 컬럼 순서 강제 적용
-df = df[ordered_columns]
-
 # 메인 입력 화면
 st.subheader(f"📝 {project_name} - 상세 진도 및 일정 입력")
 
@@ -254,6 +255,8 @@ column_config = {
     "항목 (Item)": st.column_config.TextColumn(width="medium", disabled=False),
     "금액 (Amount)": st.column_config.NumberColumn(format="%d"),
     "제작 기간 (Weeks)": st.column_config.NumberColumn(format="%d주"),
+    PREDECESSOR_COL: st.column_config.TextColumn(help="선행 항목 이름 (쉼표 구분). 예: Piping Spool, Catalyst Structure@납품"),
+    VENDOR_COL: st.column_config.TextColumn(help="제작 업체(공장) 이름. 같은 업체 항목은 업체 동시 제작 수 안에서 평준화됩니다."),
     "가중치 (Weight)": st.column_config.NumberColumn(format="%.2f%%"), # 가중치는 자동 계산되지만 필요 시 수정 가능
     "전월 계획 (Plan Prev)": st.column_config.NumberColumn(format="%d%%"),
     "전월 실적 (Actual Prev)": st.column_config.NumberColumn(format="%d%%"),
@@ -267,7 +270,7 @@ for col in all_prog_cols:
 
 with st.form("entry_form"):
     edited_df = st.data_editor(
-        df,
+        to_editor_frame(df), # 날짜 컬럼만 date 객체로 변환
         num_rows="dynamic",
         use_container_width=True,
         column_config=column_config,
@@ -276,6 +279,13 @@ with st.form("entry_form"):
     
     submitted = st.form_submit_button("💾 입력 데이터 적용 (Apply Changes)")
     
+    # 편집 내역이 있을 때만 다시 정규화 (없으면 타입이 유지된 원본 사용)
+    if editor_has_changes(st.session_state.get('data_editor_v7')):
+        with stage(diag, '편집 정규화 (Editor Normalize)', len(edited_df)):
+            edited_df, _ = normalize_schedule(edited_df)
+    else:
+        edited_df = df.copy()
+    
     if submitted:
         st.session_state.data = edited_df
         st.success("데이터가 적용되었습니다. (Data Updated)")
@@ -286,224 +296,28 @@ import traceback
 
 try:
     # Ensure columns are numeric (Handle string inputs like '50%' or '50')
-    # Ensure columns are numeric (Handle string inputs like '50%' or '50')
-    num_cols = ['가중치 (Weight)', '전월 계획 (Plan Prev)', '전월 실적 (Actual Prev)', '금월 계획 (Plan Curr)', '금월 실적 (Actual Curr)']
-    
-    # 0. Amount Cleaning
-    if '금액 (Amount)' in edited_df.columns:
-        edited_df['금액 (Amount)'] = edited_df['금액 (Amount)'].astype(str).str.replace(',', '').str.strip()
-        edited_df['금액 (Amount)'] = pd.to_numeric(edited_df['금액 (Amount)'], errors='coerce').fillna(0)
-        
-        # 1. Clean Weight Column First (Always ensure it's numeric)
-        w_col = '가중치 (Weight)'
-        if w_col in edited_df.columns:
-             edited_df[w_col] = edited_df[w_col].astype(str).str.replace('%', '').str.replace(',', '').str.strip()
-             edited_df[w_col] = pd.to_numeric(edited_df[w_col], errors='coerce').fillna(0)
-
-        # 2. Logic: Amount vs Weight
-        total_amount = edited_df['금액 (Amount)'].sum()
-        if total_amount > 0:
-             # Case A: Amount exists -> Calculate Weight % based on Amount
-             edited_df['가중치 (Weight)'] = (edited_df['금액 (Amount)'] / total_amount) * 100
-        else:
-             # Case B: Amount is 0 -> Use Manual Weight or Fallback
-             if edited_df[w_col].sum() == 0 and len(edited_df) > 0:
-                 # Fallback: All weights are 0 -> Apply Equal Weights
-                 edited_df[w_col] = 100.0 / len(edited_df)
-    
-    # 3. Clean other numeric columns
-    for c in num_cols:
-        if c == '가중치 (Weight)': continue # Already cleaned/calculated
-        
-        # Convert column to string, strip '%', then to numeric
-        if c in edited_df.columns:
-            edited_df[c] = edited_df[c].astype(str).str.replace('%', '').str.replace(',', '').str.strip()
-            edited_df[c] = pd.to_numeric(edited_df[c], errors='coerce').fillna(0)
-            
-    # --- Automatic Progress Calculation (New Request) ---
+    # Amount vs Weight, Automatic Progress Calculation, Delay Analysis
+    # -> data_editor 변경 내역(edited/added/deleted rows)에 해당하는 행만 다시 계산 (incremental.update_derived)
     # Global Phase Weights: Procurement 10, Design 20, Mfg 40, Insp 25, Delivery 5
-    # Logic: Start=50%, End=100% of Phase Weight
-    phase_ratios = {
-        '구매 (Procurement)': 10.0,
-        '설계 (Design)': 20.0,
-        '제작 (Manufacturing)': 40.0,
-        '검사 (Inspection)': 25.0,
-        '납품 (Delivery)': 5.0
-    }
+    # Logic: Start=50%, End=100% of Phase Weight (progress_engine.PHASE_RATIOS)
     
     # Reference Dates
-    now_ts = pd.Timestamp.now()
-    first_day_of_month = now_ts.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    # Last day of current month (First day of next month - 1 day)
-    next_month = (first_day_of_month + pd.DateOffset(months=1))
-    last_day_of_month = next_month - pd.Timedelta(days=1)
+    first_day_of_month, last_day_of_month = month_bounds()
     
-    curr_actual_list = []
-    prev_actual_list = []
-    curr_plan_list = []
-    prev_plan_list = []
-    
-    # Iterate over rows to calculate progress per Item
-    for index, row in edited_df.iterrows():
-        progress_accum_curr_act = 0.0
-        progress_accum_prev_act = 0.0
-        progress_accum_curr_plan = 0.0
-        progress_accum_prev_plan = 0.0
-        
-        # Calculate progress based on phase status
-        for phase_name, p_s, p_e, a_s, a_prog, a_e in phases_info:
-            weight = phase_ratios.get(phase_name, 0)
-            
-            # --- Actual Calculation ---
-            start_val = row[a_s]
-            end_val = row[a_e]
-            
-            prog = 0
-            try:
-                prog_val = row.get(a_prog, 0)
-                if pd.notnull(prog_val):
-                    if isinstance(prog_val, str):
-                        prog_val = float(prog_val.replace('%', '').strip())
-                    prog = float(prog_val) / 100.0
-            except:
-                prog = 0
-                
-            if pd.notnull(end_val):
-                prog = 1.0
-            
-            # Current Actual
-            if prog > 0:
-                progress_accum_curr_act += weight * prog
-            elif pd.notnull(start_val): # In Progress (Fallback if prog is 0)
-                progress_accum_curr_act += weight * 0.5
-                
-            # Previous Actual
-            try:
-                s_date = pd.to_datetime(start_val) if pd.notnull(start_val) else None
-                e_date = pd.to_datetime(end_val) if pd.notnull(end_val) else None
-                
-                if e_date and e_date < first_day_of_month:
-                    progress_accum_prev_act += weight * 1.0
-                elif s_date and s_date < first_day_of_month:
-                    progress_accum_prev_act += weight * 0.5
-            except: pass
-
-            # --- Plan Calculation ---
-            p_start_val = row[p_s]
-            p_end_val = row[p_e]
-            
-            try:
-                ps_date = pd.to_datetime(p_start_val) if pd.notnull(p_start_val) else None
-                pe_date = pd.to_datetime(p_end_val) if pd.notnull(p_end_val) else None
-                
-                # Previous Plan (Scheduled before this month)
-                if pe_date and pe_date < first_day_of_month:
-                    progress_accum_prev_plan += weight * 1.0
-                elif ps_date and ps_date < first_day_of_month:
-                    progress_accum_prev_plan += weight * 0.5
-                    
-                # Current Plan (Scheduled up to end of this month)
-                # Note: This is cumulative target
-                if pe_date and pe_date <= last_day_of_month:
-                    progress_accum_curr_plan += weight * 1.0
-                elif ps_date and ps_date <= last_day_of_month:
-                    progress_accum_curr_plan += weight * 0.5
-            except: pass
-        
-        curr_actual_list.append(progress_accum_curr_act)
-        prev_actual_list.append(progress_accum_prev_act)
-        curr_plan_list.append(progress_accum_curr_plan)
-        prev_plan_list.append(progress_accum_prev_plan)
-        
-    # Apply calculated progress
-    edited_df['금월 실적 (Actual Curr)'] = curr_actual_list
-    edited_df['전월 실적 (Actual Prev)'] = prev_actual_list
-    edited_df['금월 계획 (Plan Curr)'] = curr_plan_list
-    edited_df['전월 계획 (Plan Prev)'] = prev_plan_list
-    # ----------------------------------------------------
-
-    edited_df['월간 진도 (Monthly Progress)'] = edited_df['금월 실적 (Actual Curr)'] - edited_df['전월 실적 (Actual Prev)']
-    
-    total_weight = edited_df['가중치 (Weight)'].sum()
-    if total_weight > 0:
-        overall_plan = (edited_df['금월 계획 (Plan Curr)'] * edited_df['가중치 (Weight)']).sum() / total_weight
-        overall_actual = (edited_df['금월 실적 (Actual Curr)'] * edited_df['가중치 (Weight)']).sum() / total_weight
-    else:
-        overall_plan = 0; overall_actual = 0
-        
-    status_msg = "정상 (On Track)"
-    if overall_actual < overall_plan: status_msg = "지연 (Delayed)"
-    elif overall_actual > overall_plan: status_msg = "초과 달성 (Ahead)"
-
-    # 2. 지연 분석
-    delay_alerts = []
-    
-    # Contract delivery date (ensure date object)
-    if isinstance(contract_delivery_date, pd.Timestamp):
-        contract_delivery_date_obj = contract_delivery_date.date()
-    elif isinstance(contract_delivery_date, date):
-        contract_delivery_date_obj = contract_delivery_date
-    else:
-        contract_delivery_date_obj = pd.to_datetime(contract_delivery_date).date()
-    
-    for index, row in edited_df.iterrows():
-        item_name = row['항목 (Item)']
-        
-        # 단계별 지연
-        for phase_name, p_start, p_end, a_start, a_prog, a_end in phases_info:
-            plan_end = row[p_end]
-            actual_end = row[a_end]
-            
-            # Check if values are valid dates (not NaT or None)
-            if pd.notnull(plan_end) and pd.notnull(actual_end):
-                try:
-                    p_e = pd.to_datetime(plan_end).date()
-                    a_e = pd.to_datetime(actual_end).date()
-                    
-                    if a_e > p_e:
-                        days_diff = (a_e - p_e).days
-                        delay_alerts.append(f"⚠️ **{item_name}** - {phase_name}: {days_diff}일 지연 (계획: {p_e}, 실적: {a_e})")
-                except: continue
+    editor_state = st.session_state.get('data_editor_v7')
+    derived_cache, overall_plan, overall_actual, delay_alerts = update_derived(
+        st.session_state.get('derived_cache'), edited_df, editor_state,
+        phases_info, first_day_of_month, last_day_of_month, contract_delivery_date, crash_limits, work_calendar, diag
+    )
+    # 캐시는 data_editor 입력 데이터(st.session_state.data) 기준으로 유지
+    if submitted or (st.session_state.get('derived_cache') is None and not editor_has_changes(editor_state)):
+        st.session_state.derived_cache = derived_cache
+    closed_prev_items = None
+    if use_closed_prev:
+        with stage(diag, '전월 마감 값 (Closed Prev)', len(edited_df)):
+            closed_prev_items = apply_closed_prev(edited_df, project_name, date.today())
         
-        # 납품일 체크 (Smart Alert Logic)
-        last_plan_end = row['납품 계획 종료']
-        if pd.notnull(last_plan_end):
-             try:
-                 l_p_e = pd.to_datetime(last_plan_end).date()
-                 if l_p_e > contract_delivery_date_obj:
-                     delay_days = (l_p_e - contract_delivery_date_obj).days
-                     alert_msg = f"🚨 **{item_name}** - 계약 납품일({contract_delivery_date}) {delay_days}일 초과! (계획: {l_p_e})"
-                     
-                     # Smart Compression Logic
-                     solutions = []
-                     remaining_delay = delay_days
-                     
-                     # 1. Compress Design Phase
-                     d_start_val = row.get('설계 계획 시작')
-                     d_end_val = row.get('설계 계획 종료')
-                     
-                     if pd.notnull(d_start_val) and pd.notnull(d_end_val):
-                         ds = pd.to_datetime(d_start_val).date()
-                         de = pd.to_datetime(d_end_val).date()
-                         if de > ds:
-                             curr_d_days = (de - ds).days
-                             # Minimum 30 days (approx 1 month)
-                             reduceable_d = max(0, curr_d_days - 30)
-                             
-                             if reduceable_d > 0:
-                                 reduce_amount = min(remaining_delay, reduceable_d)
-                                 solutions.append(f"설계 기간 {reduce_amount}일 단축 (현재 {curr_d_days}일 -> 권장 {curr_d_days - reduce_amount}일)")
-                                 remaining_delay -= reduce_amount
-                     
-                     # 2. Compress Manufacturing Phase (If delay remains)
-                     if remaining_delay > 0:
-                         solutions.append(f"제작 기간 {remaining_delay}일 단축 필요")
-                         
-                     if solutions:
-                         alert_msg += " 👉 [제안] " + ", ".join(solutions)
-                         
-                     delay_alerts.append(alert_msg)
-             except: continue
+    status_msg = overall_status(overall_plan, overall_actual)
 
     st.markdown("---")
     st.subheader(f"📊 {project_name} 종합 리포트")
@@ -512,10 +326,93 @@ try:
     c2.metric("전체 실적 공정률", f"{overall_actual:.2f}%", delta=f"{overall_actual - overall_plan:.2f}%")
     c3.metric("종합 상태", status_msg)
     
-    if delay_alerts:
-        st.error("🚨 **주요 이슈 및 지연 알림**")
-        for alert in delay_alerts:
-            st.write(alert)
+    # 지연 알림 표 (정렬 + 페이지 단위 표시, delay_analysis.build_delay_table)
+    if len(delay_alerts):
+        overrun_alerts = delay_alerts[delay_alerts['구분 (Type)'] == ALERT_DELIVERY]
+        st.error(
+            f"🚨 **주요 이슈 및 지연 알림** {len(delay_alerts):,}건 · 납품일 초과 {len(overrun_alerts):,}개 항목"
+            f" · 단축 비용 합계 {overrun_alerts['단축 비용 (Cost)'].sum():,.1f}"
+            f" · 단축으로도 해소 불가 {int((overrun_alerts['미해소 (일)'] > 0).sum()):,}개 항목"
+        )
+        a1, a2, a3, a4 = st.columns([2, 1, 1, 1])
+        alert_sort = a1.selectbox("정렬 기준", ALERT_COLS, index=ALERT_COLS.index('지연 (일)'), key="alert_sort")
+        alert_desc = a2.toggle("내림차순", value=True, key="alert_desc")
+        alert_page_size = a3.selectbox("페이지 크기", [25, 50, 100, 500], index=1, key="alert_page_size")
+        alert_pages = max(1, -(-len(delay_alerts) // alert_page_size))
+        alert_page = a4.number_input(f"페이지 (/{alert_pages})", min_value=1, max_value=alert_pages, value=1, key="alert_page")
+        sorted_alerts = delay_alerts.sort_values(alert_sort, ascending=not alert_desc, kind='stable', na_position='last')
+        st.dataframe(
+            sorted_alerts.iloc[(alert_page - 1) * alert_page_size:alert_page * alert_page_size],
+            use_container_width=True,
+            hide_index=True,
+            column_config={'단축 비용 (Cost)': st.column_config.NumberColumn(format="%.1f")}
+        )
+
+    # 월 마감 스냅샷 (snapshot_store): 이번 달 마감 저장, 월별 조회, 직전 달 대비 변화량
+    this_month = month_key(date.today())
+    with st.expander("🗄️ 월 마감 스냅샷 (Monthly Snapshots)"):
+        if closed_prev_items is not None:
+            st.caption(f"전월 실적: {previous_month(this_month)} 마감 스냅샷 값 사용 ({closed_prev_items:,}개 항목)")
+        if st.button(f"💾 {this_month} 마감 스냅샷 저장"):
+            try:
+                save_snapshot(edited_df, project_name, date.today(), overall_plan, overall_actual)
+                st.success(f"{this_month} 스냅샷을 저장했습니다.")
+            except Exception as e:
+                st.error(f"스냅샷 저장 중 오류가 발생했습니다: {e}")
+        snapshots = list_snapshots(project_name)
+        if snapshots.empty:
+            st.info("저장된 스냅샷이 없습니다.")
+        else:
+            st.dataframe(snapshots, use_container_width=True, hide_index=True)
+            snapshot_month = st.selectbox("조회할 월", snapshots['월 (Month)'].tolist(), key="snapshot_month")
+            st.dataframe(load_snapshot(project_name, snapshot_month).drop(columns='항목 키 (Key)'), use_container_width=True, hide_index=True)
+            if previous_month(snapshot_month) in set(snapshots['월 (Month)']):
+                st.markdown(f"**{previous_month(snapshot_month)} → {snapshot_month} 변화량**")
+                st.dataframe(snapshot_delta(project_name, snapshot_month), use_container_width=True, hide_index=True)
+
+    # 주공정 분석 (선행관계 CPM 결과가 있을 때)
+    if st.session_state.get('cpm_result') is not None:
+        cpm_df = st.session_state.cpm_result
+        with st.expander(f"🔗 주공정 분석 (Critical Path) - 최소 여유 {cpm_df['Total Float (일)'].min()}일"):
+            st.dataframe(cpm_df.sort_values(['Total Float (일)', 'ES']), use_container_width=True, hide_index=True)
+
+    # 업체 부하 평준화 결과 (Auto Plan 때 계산): 업체별 요약 + 항목별 제작 지연 / 계약 납품일 대비
+    if st.session_state.get('leveling_result') is not None:
+        level_table, level_summary = st.session_state.leveling_result
+        worst_after, worst_before = level_table['계약 대비 (일)'].max(), level_table['계약 대비 전 (일)'].max()
+        level_title = "🏭 업체 부하 평준화 결과"
+        if pd.notna(worst_after):
+            level_title += f" - 계약 납품일 대비 최대 {worst_after:+.0f}일 (평준화 전 {worst_before:+.0f}일)"
+        with st.expander(level_title):
+            st.dataframe(level_summary, use_container_width=True, hide_index=True)
+            st.dataframe(level_table, use_container_width=True, hide_index=True)
+
+    # 일정 위험 분석 (risk_analysis.simulate_risk): 단계 기간 삼각분포 Monte Carlo, 버튼을 눌렀을 때만 계산
+    risk_result = st.session_state.get('risk_result')
+    with st.expander("🎲 일정 위험 분석 (Monte Carlo)", expanded=risk_result is not None):
+        r1, r2 = st.columns([3, 1])
+        with r1:
+            risk_frame = st.data_editor(risk_ranges_frame(), key="risk_ranges", hide_index=True, disabled=['단계 (Phase)'], use_container_width=True)
+        with r2:
+            risk_iterations = st.selectbox("반복 횟수", [10_000, 50_000, 100_000], format_func=lambda v: f"{v:,}", key="risk_iterations")
+            run_risk = st.button("▶️ 위험 분석 실행")
+        st.caption("최빈값 = 계획 기간, 최소/최대 = 최빈값 대비 %. 실적 종료된 단계는 실제 지연만 반영합니다.")
+        if run_risk:
+            with st.spinner(f"{risk_iterations:,}회 모의 중입니다..."):
+                risk_result = simulate_risk(edited_df, phases_info, contract_delivery_date, risk_iterations, risk_ranges_from_frame(risk_frame), calendar=work_calendar)
+            st.session_state.risk_result = risk_result
+        if risk_result is not None:
+            risk_table, risk_summary = risk_result
+            if risk_summary is None:
+                st.info("납품 계획 종료일이 있는 항목이 없습니다. Auto Plan 후 실행하세요.")
+            else:
+                cols = st.columns(len(PERCENTILES) + 2)
+                cols[0].metric("계획 완료일", str(risk_summary['plan']))
+                for col, q in zip(cols[1:], PERCENTILES):
+                    col.metric(f"P{q} 완료일", str(risk_summary[f'P{q}']))
+                cols[-1].metric("계약 납품일 준수 확률", f"{risk_summary['probability']:.1f}%")
+                st.dataframe(risk_table, use_container_width=True, hide_index=True,
+                             column_config={'계약 준수 확률 (%)': st.column_config.ProgressColumn(format="%.1f%%", min_value=0, max_value=100)})
 
     # 3. 상세 진도율 테이블 표시 (UI에 표시)
     st.markdown("---")
@@ -538,361 +435,136 @@ try:
         hide_index=True
     )
 
-    # --- Chart Generation Functions ---
-    def create_gantt_chart(df, phases, title):
-        # Prepare data for Plotly Gantt
-        plan_data = [] # For bar chart (px.timeline)
-        
-        # Color mapping (Pastel Tones for Plan)
-        phase_colors = {
-            '구매 (Procurement)': '#A0C4FF',       # Pastel Blue
-            '설계 (Design)': '#9BF6FF',            # Pastel Cyan
-            '제작 (Manufacturing)': '#FFADAD',     # Pastel Red
-            '검사 (Inspection)': '#FFD6A5',        # Pastel Orange
-            '납품 (Delivery)': '#CAFFBF'           # Pastel Green
-        }
-        
-        # Lists for the Vertical Progress Line (Actual)
-        line_dates = []
-        line_items = []
-        
-        # We need to iterate in the order they appear in the DataFrame to maintain vertical connection
-        # Ensure df is sorted if needed, but usually it's in logic order. 
-        # If we sort for Plotly Y-axis (which is reversed usually), we should match that order.
-        # Plotly draws Y axis from bottom up by default, but we use 'reversed' in update_yaxes.
-        # So top row in DF = Top row in Chart.
-        
-        for index, row in df.iterrows():
-            item_name = row['항목 (Item)']
-            if pd.isna(item_name) or str(item_name).strip() == "": continue
-            
-            # 1. Collect Plan Data
-            item_has_plan = False
-            for phase_name, p_start, p_end, a_start, a_prog, a_end in phases:
-                if pd.notnull(row[p_start]) and pd.notnull(row[p_end]):
-                    plan_data.append(dict(
-                        Item=item_name, 
-                        Y_Label=item_name,  
-                        Phase=phase_name, 
-                        Start=row[p_start], 
-                        Finish=row[p_end],
-                        Type="Plan"
-                    ))
-                    item_has_plan = True
-            
-            # 2. Find Latest Status Date (Earned Schedule) for this Item
-            # Strategy: If Actual End exists -> Plot at Plan End.
-            #           If Actual Start exists -> Plot at Plan Start.
-            #           This visualizes "How much planned work has been achieved".
-            #           Right of Today = Ahead (Completed future work).
-            #           Left of Today  = Delay (Only completed past work).
-            
-            valid_plan_dates = []
-            
-            for phase_name, p_start, p_end, a_start, a_prog, a_end in phases:
-                if pd.notnull(row[p_start]) and pd.notnull(row[p_end]):
-                    ps_dt = pd.to_datetime(row[p_start])
-                    pe_dt = pd.to_datetime(row[p_end])
-                    total_duration = (pe_dt - ps_dt).days
-                    
-                    prog = 0
-                    try:
-                        prog_val = row.get(a_prog, 0)
-                        if pd.notnull(prog_val):
-                            if isinstance(prog_val, str):
-                                prog_val = float(prog_val.replace('%', '').strip())
-                            prog = float(prog_val) / 100.0
-                    except:
-                        prog = 0
-                        
-                    if pd.notnull(row[a_end]):
-                        prog = 1.0
-                        
-                    if prog > 0:
-                        earned_days = total_duration * prog
-                        earned_date = ps_dt + pd.Timedelta(days=earned_days)
-                        valid_plan_dates.append(earned_date.date())
-                    elif pd.notnull(row[a_start]):
-                        valid_plan_dates.append(ps_dt.date())
-            
-            if valid_plan_dates:
-                # Take the latest Plan Date achieved
-                line_dates.append(max(valid_plan_dates))
-                line_items.append(item_name)
-            else:
-                pass
-
-        if not plan_data and not line_dates:
-            return None
-        
-        # --- Create Figure ---
-        fig = go.Figure()
-        
-        # 1. Add Plan Bars
-        if plan_data:
-            g_df = pd.DataFrame(plan_data)
-            g_df['Start'] = pd.to_datetime(g_df['Start'])
-            g_df['Finish'] = pd.to_datetime(g_df['Finish'])
-            
-            # Important: We want the Y-axis order to follow df order.
-            # Plotly maps categorical Y based on appearance or sort.
-            # We can force the category order.
-            
-            # Instead of separate px.timeline, let's add traces to go.Figure manually or use px and add scatter.
-            # Using px.timeline is easier for the bars.
-            fig = px.timeline(
-                g_df, x_start="Start", x_end="Finish", y="Y_Label", color="Phase", 
-                color_discrete_map=phase_colors,
-                opacity=0.5, # Background opacity
-                hover_data=["Item", "Phase", "Start", "Finish"], 
-                title=title
-            )
-        else:
-            fig = go.Figure()
-            fig.update_layout(title=title)
-
-        # 2. Add Vertical Progress Line
-        if line_dates:
-            fig.add_trace(go.Scatter(
-                x=line_dates,
-                y=line_items,
-                mode='lines+markers',
-                name='Actual Progress (Original)',
-                marker=dict(symbol='circle', size=10, color='#FF5733'), # Red-Orange dot
-                line=dict(color='#FF5733', width=3), # Connection line
-                hoverinfo='x+y+text',
-                hovertext=[f"Latest: {d}" for d in line_dates]
-            ))
-
-        # --- Layout Adjustments ---
-        fig.update_yaxes(
-            autorange="reversed", # Start from top
-            title_text="항목 (Item)",
-            type='category', # Ensure categorical
-            categoryorder='array', # Force order
-            categoryarray=df['항목 (Item)'].tolist(), # Use exact DF order
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='#888888',
-        )
-        
-        # Add 'Today' Line
-        today_ts = pd.Timestamp.now().timestamp() * 1000
-        fig.add_vline(x=today_ts, line_width=2, line_dash="solid", line_color="red", annotation_text="Today")
-        
-        fig.update_xaxes(
-            type='date', 
-            showgrid=True, 
-            gridwidth=0.5, 
-            gridcolor='#E0E0E0',
-            dtick=864000000.0, # 10 Days
-            tickformat="%m-%d"
-        )
-        
-        fig.update_layout(
-            height=max(600, len(df) * 40), 
-            template='plotly_white',
-            barmode='overlay',
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
-        
-        return fig
-
-    def create_plan_vs_actual_gantt(df, phases):
-        # Prepare data for Plan vs Actual Gantt
-        gantt_data = []
-        
-        # Color mapping for phases (Synced with Main Gantt)
-        phase_colors = {
-            '구매 (Procurement)': '#A0C4FF',       # Pastel Blue
-            '설계 (Design)': '#9BF6FF',            # Pastel Cyan
-            '제작 (Manufacturing)': '#FFADAD',     # Pastel Red
-            '검사 (Inspection)': '#FFD6A5',        # Pastel Orange
-            '납품 (Delivery)': '#CAFFBF'           # Pastel Green
-        }
-        
-        for index, row in df.iterrows():
-            item_name = row['항목 (Item)']
-            if pd.isna(item_name) or str(item_name).strip() == "": continue
-            
-            for phase_name, p_start, p_end, a_start, a_prog, a_end in phases:
-                # 1. Plan Bar (Grey)
-                if pd.notnull(row[p_start]) and pd.notnull(row[p_end]):
-                    gantt_data.append(dict(
-                        Item=item_name, 
-                        Y_Label=f"{item_name}", 
-                        Phase="Plan",
-                        Start=row[p_start], 
-                        Finish=row[p_end],
-                        ColorKey="Plan" 
-                    ))
-                
-                # 2. Actual Bar (Colored by Phase)
-                if pd.notnull(row[a_start]):
-                     start_date = row[a_start]
-                     # If end date is missing, assume it's ongoing (ends today)
-                     finish_date = row[a_end] if pd.notnull(row[a_end]) else pd.Timestamp.now().date()
-
-                     gantt_data.append(dict(
-                        Item=item_name, 
-                        Y_Label=f"{item_name}", 
-                        Phase=phase_name, 
-                        Start=start_date, 
-                        Finish=finish_date,
-                        ColorKey=phase_name 
-                    ))
-
-        if not gantt_data: return None
-        
-        g_df = pd.DataFrame(gantt_data)
-        g_df['Start'] = pd.to_datetime(g_df['Start'])
-        g_df['Finish'] = pd.to_datetime(g_df['Finish'])
-        
-        # Define color map including 'Plan'
-        color_map = {'Plan': '#d3d3d3'} # Light Grey
-        color_map.update(phase_colors)
-        
-        # To make Plan appear "behind" or clearly distinguishable, we might want to separate rows or overlap.
-        # User said "Plan Grey, Actual Color Comparison".
-        # If we share Y_Label, they overlap in 'stack' mode (not ideal) or 'group' mode.
-        # 'overlay' mode isn't standard in timeline. 
-        # Best approach for comparison: Two rows per Item? 
-        # "Item 1 (Plan)" and "Item 1 (Actual)"?
-        # User request: "Gantt차트를 이용하여 plan 차트 회색으로 실행차트는 비교하는 것으로 항목별... 날짜로 표현해줘."
-        # Let's align them on the SAME row if possible, but distinct visuals, OR separate rows.
-        # Separate rows (Plan row, Actual row) is clearest for Gantt.
-        # Let's adjust Y_Label to separate Plan/Actual.
-        
-        g_df['Y_Cat'] = g_df.apply(lambda x: x['Item'] if x['ColorKey'] != 'Plan' else x['Item'] + " (Plan)", axis=1) # Naive approach
-        # Better: Group by Item, but differentiate Plan/Actual bars.
-        # Let's try: Item Name as Y Axis.
-        # But distinguish bars by opacity or width? Plotly Express timeline is limited.
-        
-        # Let's go with: 
-        # Row 1: Item A (Plan) -> Grey Bars
-        # Row 2: Item A (Actual) -> Colored Bars
-        # This is clear.
-        
-        
-        g_df['Y_Label_Final'] = g_df.apply(lambda x: f"{x['Item']} [Plan]" if x['ColorKey'] == 'Plan' else f"<span style='color: #0000FF; font-weight: bold; font-size: 14px;'>{x['Item']} [Actual]</span>", axis=1)
-        
-        # Sorting to keep Plan/Actual together
-        g_df.sort_values(by=['Item', 'ColorKey'], ascending=[True, False], inplace=True) 
-        # Plan (P) vs Phase Name... P comes after most? 
-        # Let's force verify order.
-        
-        fig = px.timeline(
-            g_df, x_start="Start", x_end="Finish", y="Y_Label_Final", color="ColorKey",
-            color_discrete_map=color_map,
-            opacity=0.9,
-            hover_data=["Item", "Phase", "Start", "Finish"],
-            title="상세 공정 비교 (Plan vs Actual)"
-        )
-        
-        fig.update_yaxes(
-            autorange="reversed", 
-            title_text="항목 (Item)",
-            showgrid=True,
-            gridwidth=1,          # Thicker line
-            gridcolor='#888888',  # Darker grey for clear separation
-            zeroline=True,
-            zerolinewidth=2,
-            zerolinecolor='#888888'
-        )
-        fig.update_xaxes(
-            type='date',
-            showgrid=True,
-            gridwidth=0.5,
-            gridcolor='#E0E0E0',
-            dtick=864000000.0, # 10 Days
-            tickformat="%m-%d"
-        )
-        fig.update_layout(height=max(600, len(df)*50), showlegend=True, template='plotly_white') # Force white template
-        return fig
-
-    def create_data_table_html(df, phases):
-        # Select columns: Item, Weight, Prev Actual, Curr Actual, Monthly Progress, Duration
-        # Ensure these columns exist
-        base_cols = ['항목 (Item)', '가중치 (Weight)', '전월 실적 (Actual Prev)', '금월 실적 (Actual Curr)', '월간 진도 (Monthly Progress)', '제작 기간 (Weeks)']
-        cols_to_show = [c for c in base_cols if c in df.columns]
-        
-        # Add date columns from phases
-        date_cols = []
-        for p in phases:
-             # Add Plan Start/End, Actual Start/Progress/End
-             date_cols.extend([p[1], p[2], p[3], p[4], p[5]])
-        
-        # Filter only existing columns
-        existing_date_cols = [c for c in date_cols if c in df.columns]
-        final_cols = cols_to_show + existing_date_cols
-        
-        table_df = df[final_cols].copy()
-        
-        # Format Numeric Columns to 2 decimal places
-        numeric_format_cols = ['가중치 (Weight)', '전월 실적 (Actual Prev)', '금월 실적 (Actual Curr)', '월간 진도 (Monthly Progress)']
-        for col in numeric_format_cols:
-            if col in table_df.columns:
-                 # Check if numeric
-                 table_df[col] = pd.to_numeric(table_df[col], errors='coerce').fillna(0)
-                 table_df[col] = table_df[col].apply(lambda x: f"{x:.2f}")
-
-        # Format Dates
-        for col in existing_date_cols:
-            table_df[col] = pd.to_datetime(table_df[col]).dt.strftime('%Y-%m-%d').fillna('-')
-            
-        # Rename columns for better readability (Optional)
-        # e.g. remove ' (Item)' etc.
-        
-        # Convert to HTML
-        html = table_df.to_html(index=False, classes='data-table', border=0)
-        return html
+    # 차트/보고서 생성 함수: charts.py, report.py (Streamlit 비의존, pipeline.py 와 공용)
 
     # --- 4. Main Chart View (Tabs Removed) ---
     st.subheader("📅 통합 공정 스케줄 (Project Schedule Gantt)")
     
-    fig_gantt = create_gantt_chart(edited_df, phases_info, f"통합 공정 스케줄 ({project_name})")
+    # 차트 캐시 (세션 단위): 데이터/기준일/납품일이 같으면 화면 차트와 보고서가 같은 Figure·JSON 을 재사용
+    if 'figure_cache' not in st.session_state:
+        st.session_state.figure_cache = new_store()
+    as_of_day = date.today()
+    chart_fingerprint = frame_fingerprint(edited_df, GANTT_COLS)
+
+    def schedule_gantt_entry(row_start=0, row_count=None):
+        def build():
+            fig = create_schedule_gantt(edited_df, phases_info, f"통합 공정 스케줄 ({project_name})", today=as_of_day, row_start=row_start, row_count=row_count)
+            if fig:
+                add_delivery_line(fig, contract_delivery_date)
+                fig.update_layout(template='plotly_white') # Ensure white background
+            return fig
+        key = figure_key(chart_fingerprint, as_of_day, contract_delivery_date, 'gantt', project_name, row_start, row_count)
+        return cached_figure(st.session_state.figure_cache, key, build)
+
+    gantt_start, row_count = 0, None
+    if len(edited_df) > FAST_GANTT_ROWS:
+        # 대용량 간트: 행 창(시작 행 + 표시 행 수)만 그리고, 많으면 묶어서 표시
+        gc1, gc2 = st.columns(2)
+        gantt_rows = gc1.selectbox("표시 행 수", [100, 200, LOD_MAX_ROWS, "전체 (묶음 표시)"], index=1, key="gantt_rows")
+        if not isinstance(gantt_rows, str):
+            row_count = gantt_rows
+            gantt_start = int(gc2.number_input("시작 행", min_value=0, max_value=max(0, len(edited_df) - 1), value=0, step=50, key="gantt_start"))
+    with stage(diag, '간트 (Gantt)', len(edited_df)):
+        fig_gantt = schedule_gantt_entry(gantt_start, row_count)['fig']
     if fig_gantt:
-        # Add Delivery Line
-        delivery_ts = pd.to_datetime(contract_delivery_date).timestamp() * 1000
-        fig_gantt.add_vline(x=delivery_ts, line_width=2, line_dash="dash", line_color="red", annotation_text="계약 납품일")
-        fig_gantt.update_layout(template='plotly_white') # Ensure white background
         st.plotly_chart(fig_gantt, use_container_width=True)
     else:
         st.info("차트를 표시할 날짜 데이터가 부족합니다.")
+
+    # S-Curve: 계획/실적 누적 공정률 (scurve.compute_s_curve, 가중치/진도 컬럼까지 지문에 포함)
+    st.subheader("📈 누적 공정률 (S-Curve)")
+    s_curve_freqs = {"자동 (Auto)": 'auto', "일 단위 (Day)": 'day', "주 단위 (Week)": 'week'}
+    s_curve_freq = s_curve_freqs[st.selectbox("S-Curve 간격", list(s_curve_freqs), key="s_curve_freq")]
+    curve_fingerprint = frame_fingerprint(edited_df, GANTT_COLS + ['가중치 (Weight)'])
+
+    def s_curve_entry():
+        def build():
+            fig = create_s_curve_chart(compute_s_curve(edited_df, phases_info, as_of_day, s_curve_freq), f"누적 공정률 ({project_name})", today=as_of_day)
+            if fig:
+                add_delivery_line(fig, contract_delivery_date)
+            return fig
+        key = figure_key(curve_fingerprint, as_of_day, contract_delivery_date, 's_curve', project_name, s_curve_freq)
+        return cached_figure(st.session_state.figure_cache, key, build)
+
+    with stage(diag, 'S-Curve', len(edited_df)):
+        fig_curve = s_curve_entry()['fig']
+    if fig_curve:
+        st.plotly_chart(fig_curve, use_container_width=True)
+    else:
+        st.info("S-Curve 를 표시할 날짜 데이터가 부족합니다.")
         
     # 엑셀 다운로드 (자동 계산된 데이터 포함)
     st.markdown("---")
     
-    # 엑셀 다운로드 (In-Memory)
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        edited_df.to_excel(writer, index=False, sheet_name="Schedule")
-        
-        # Metadata
-        meta_data = {
-            'ProjectName': [project_name],
-            'StartDate': [project_start_date],
-            'DeliveryDate': [contract_delivery_date]
-        }
-        pd.DataFrame(meta_data).to_excel(writer, index=False, sheet_name="ProjectInfo")
-    
-    output.seek(0)
-    
-    server_filename = f"{project_name}_Schedule_Calculated.xlsx"
-    import re
-    safe_server_name = re.sub(r'[\\/*?:"<>|]', "", server_filename).strip()
-
-    st.download_button(
-        label="💾 엑셀 스케줄 다운로드 (Download Excel)",
-        data=output,
-        file_name=safe_server_name,
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    )
-    
-    # temp file for stability (optional, can keep or remove, keeping for now)
-    temp_filename = "temp_export.xlsx"
-    with pd.ExcelWriter(temp_filename, engine='openpyxl') as writer:
-        edited_df.to_excel(writer, index=False, sheet_name="Schedule")
+    # 엑셀 다운로드: 버튼을 눌렀을 때만 생성 (rerun 마다 쓰지 않음)
+    # 데이터 지문 + 프로젝트 정보가 같으면 세션에 저장된 파일을 그대로 사용
+    export_key = (frame_fingerprint(edited_df), project_name, str(project_start_date), str(contract_delivery_date))
+    excel_export = st.session_state.get('excel_export')
+    if excel_export is not None and excel_export['key'] != export_key:
+        excel_export = st.session_state.excel_export = None
+    if excel_export is None:
+        if st.button("📦 엑셀 파일 생성 (Prepare Excel)"):
+            with st.spinner("엑셀 파일을 생성 중입니다..."), stage(diag, '엑셀 저장 (Excel)', len(edited_df)) as timing:
+                data = schedule_excel_bytes(edited_df, project_name, project_start_date, contract_delivery_date)
+                timing['bytes'] = len(data)
+            excel_export = st.session_state.excel_export = {'key': export_key, 'data': data, 'seconds': timing['seconds']}
+    if excel_export is not None:
+        st.download_button(
+            label="💾 엑셀 스케줄 다운로드 (Download Excel)",
+            data=excel_export['data'],
+            file_name=safe_filename(f"{project_name}_Schedule_Calculated.xlsx"),
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
+        st.caption(f"생성 {excel_export['seconds']:.2f}s · 파일 {len(excel_export['data']) / 1024:,.0f} KB")
+
+    # 엑셀 간트 (계획/실적 막대를 조건부 서식으로 표시하는 날짜 격자 시트)
+    gantt_bucket_labels = {"자동 (Auto)": 'auto', "일 단위 (Day)": 'day', "주 단위 (Week)": 'week'}
+    gantt_bucket = gantt_bucket_labels[st.selectbox("엑셀 간트 격자 단위", list(gantt_bucket_labels))]
+    gantt_export_key = (frame_fingerprint(edited_df, GANTT_COLS), project_name, str(as_of_day), str(contract_delivery_date), gantt_bucket)
+    gantt_export = st.session_state.get('gantt_excel_export')
+    if gantt_export is not None and gantt_export['key'] != gantt_export_key:
+        gantt_export = st.session_state.gantt_excel_export = None
+    if gantt_export is None:
+        if st.button("📊 엑셀 간트 생성 (Prepare Excel Gantt)"):
+            try:
+                with st.spinner("엑셀 간트를 생성 중입니다..."), stage(diag, '엑셀 간트 (Excel Gantt)', len(edited_df)) as timing:
+                    data = gantt_excel_bytes(edited_df, phases_info, project_name, as_of_day, contract_delivery_date, gantt_bucket)
+                    timing['bytes'] = len(data)
+                gantt_export = st.session_state.gantt_excel_export = {'key': gantt_export_key, 'data': data, 'seconds': timing['seconds']}
+            except ValueError as e:
+                st.warning(f"엑셀 간트를 만들 수 없습니다: {e}")
+    if gantt_export is not None:
+        st.download_button(
+            label="💾 엑셀 간트 다운로드 (Download Excel Gantt)",
+            data=gantt_export['data'],
+            file_name=safe_filename(f"{project_name}_Gantt.xlsx"),
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
+        st.caption(f"생성 {gantt_export['seconds']:.2f}s · 파일 {len(gantt_export['data']) / 1024:,.0f} KB")
+
+    # 월간 진도 보고서 엑셀 (회사 양식 템플릿에 계산 결과 채우기)
+    if os.path.exists(MONTHLY_TEMPLATE):
+        monthly_export_key = (frame_fingerprint(edited_df), project_name, str(as_of_day))
+        monthly_export = st.session_state.get('monthly_report_export')
+        if monthly_export is not None and monthly_export['key'] != monthly_export_key:
+            monthly_export = st.session_state.monthly_report_export = None
+        if monthly_export is None:
+            if st.button("🗂️ 월간 진도 보고서 엑셀 생성 (Prepare Monthly Report)"):
+                try:
+                    with st.spinner("월간 진도 보고서를 생성 중입니다..."), stage(diag, '월간 보고서 (Monthly Report)', len(edited_df)) as timing:
+                        data = monthly_report_bytes(edited_df, phases_info, project_name, as_of_day)
+                        timing['bytes'] = len(data)
+                    monthly_export = st.session_state.monthly_report_export = {'key': monthly_export_key, 'data': data, 'seconds': timing['seconds']}
+                except ValueError as e:
+                    st.warning(f"월간 진도 보고서를 만들 수 없습니다: {e}")
+        if monthly_export is not None:
+            st.download_button(
+                label="💾 월간 진도 보고서 다운로드 (Download Monthly Report)",
+                data=monthly_export['data'],
+                file_name=safe_filename(f"{project_name}_Monthly_Progress_Report.xlsx"),
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
+            st.caption(f"생성 {monthly_export['seconds']:.2f}s · 파일 {len(monthly_export['data']) / 1024:,.0f} KB")
 
     # ... [Existing Chart Code] ...
     
@@ -915,158 +587,49 @@ try:
     if 'report_name' not in st.session_state:
         st.session_state.report_name = None
 
+    rc1, rc2 = st.columns(2)
+    offline_report = rc1.checkbox("🔌 오프라인 보고서 (plotly.js·표 데이터 내장, 인터넷 불필요)", value=True, key="offline_report")
+    svg_report = rc2.checkbox("🖨️ 인쇄용 정적 간트 (SVG, 페이지 분할)", value=False, key="svg_report")
     if st.button("🔄 종합 보고서 생성 (Generate Report)"):
-        with st.spinner("보고서를 생성 중입니다... (Generating Report...)"):
+        with st.spinner("보고서를 생성 중입니다... (Generating Report...)"), stage(diag, 'HTML 보고서 (Report)', len(edited_df)) as report_timing:
             # 1. Prepare Assets
             
             # 2. Capture Charts (Plotly to HTML div)
             
             # Chart 1: Gantt Chart
-            fig_gantt = create_gantt_chart(edited_df, phases_info, "") # Clean title for report
-            if fig_gantt:
-                # Add Delivery Line
-                delivery_ts = pd.to_datetime(contract_delivery_date).timestamp() * 1000
-                fig_gantt.add_vline(x=delivery_ts, line_width=2, line_dash="dash", line_color="red", annotation_text="계약 납품일")
-                gantt_html = fig_gantt.to_html(full_html=False, include_plotlyjs='cdn')
+            # 화면 차트와 같은 캐시 항목 사용 (전체 행, 대용량은 묶음 표시). 제목만 비움 (Clean title for report)
+            # 오프라인: plotly.js 로컬 사본을 <head> 에 한 번만 넣고, 표는 JSON 하나로 브라우저에서 렌더링
+            # 인쇄용 SVG 간트를 쓰면 plotly.js 가 필요 없다
+            if svg_report:
+                gantt_html = svg_gantt_html(render_svg_gantt(edited_df, phases_info, project_name, as_of_day, contract_delivery_date)) or "<p>일정 데이터 부족</p>"
+                s_curve_html = render_svg_s_curve(compute_s_curve(edited_df, phases_info, as_of_day, s_curve_freq), as_of_day, contract_delivery_date)
             else:
-                gantt_html = "<p>일정 데이터 부족</p>"
-
-            # 3. Data Table HTML (Existing Function)
-            data_table_html = create_data_table_html(edited_df, phases_info)
-            
-            # 4. Prepare New Sections
-            
-            # A. Overall Metrics HTML
-            diff_val = overall_actual - overall_plan
-            diff_color = "red" if diff_val < 0 else "green"
-            diff_sign = "" if diff_val < 0 else "+"
-            
-            metrics_html = f"""
-            <div class="metrics-container" style="display: flex; gap: 20px; justify-content: space-between; background: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 20px;">
-                <div class="metric-card" style="flex: 1; text-align: center; background: white; padding: 15px; border-radius: 5px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
-                    <h3 style="margin-top: 0; color: #555;">전체 계획 공정률</h3>
-                    <p style="font-size: 24px; font-weight: bold; margin: 0; color: #0056b3;">{overall_plan:.2f}%</p>
-                </div>
-                <div class="metric-card" style="flex: 1; text-align: center; background: white; padding: 15px; border-radius: 5px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
-                    <h3 style="margin-top: 0; color: #555;">전체 실적 공정률</h3>
-                    <p style="font-size: 24px; font-weight: bold; margin: 0; color: #0056b3;">{overall_actual:.2f}% <span style="font-size: 16px; color: {diff_color};">({diff_sign}{diff_val:.2f}%)</span></p>
-                </div>
-                <div class="metric-card" style="flex: 1; text-align: center; background: white; padding: 15px; border-radius: 5px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
-                    <h3 style="margin-top: 0; color: #555;">종합 상태</h3>
-                    <p style="font-size: 24px; font-weight: bold; margin: 0; color: #333;">{status_msg}</p>
-                </div>
-            </div>
-            """
-            
-            # B. Detailed Progress Review Table HTML
-            review_cols = ['항목 (Item)', '가중치 (Weight)', '전월 실적 (Actual Prev)', '금월 실적 (Actual Curr)', '월간 진도 (Monthly Progress)']
-            final_review_cols = [c for c in review_cols if c in edited_df.columns]
-            
-            # Create a copy for formatting
-            review_df = edited_df[final_review_cols].copy()
-            for col in final_review_cols:
-                if col in ['가중치 (Weight)', '전월 실적 (Actual Prev)', '금월 실적 (Actual Curr)', '월간 진도 (Monthly Progress)']:
-                     review_df[col] = pd.to_numeric(review_df[col], errors='coerce').fillna(0).apply(lambda x: f"{x:.2f}%")
-            
-            review_table_html = review_df.to_html(index=False, classes='data-table', border=0)
-
-            # 5. HTML Template
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="utf-8">
-                <title>{project_name} - Monthly Progress Report</title>
-                <style>
-                    body {{ font-family: 'Helvetica Neue', Arial, sans-serif; color: #333; line-height: 1.6; max-width: 1200px; margin: 0 auto; padding: 40px; }}
-                    .page-break {{ page-break-before: always; }}
-                    .header {{ display: flex; justify-content: space-between; align-items: center; border-bottom: 2px solid #0056b3; padding-bottom: 20px; margin-bottom: 30px; }}
-                    .logo {{ font-size: 24px; font-weight: bold; color: #0056b3; }}
-                    .title-box {{ text-align: right; }}
-                    .title {{ font-size: 28px; font-weight: bold; margin: 0; color: #2c3e50; }}
-                    .subtitle {{ font-size: 14px; color: #7f8c8d; margin-top: 5px; }}
-                    
-                    .section {{ margin-bottom: 50px; }}
-                    .section-title {{ font-size: 20px; font-weight: bold; color: #0056b3; border-bottom: 1px solid #eee; padding-bottom: 10px; margin-bottom: 20px; }}
-                    
-                    table.data-table {{ width: 100%; border-collapse: collapse; margin-top: 20px; font-size: 11px; }}
-                    table.data-table th {{ background-color: #0056b3; color: white; padding: 8px; text-align: center; border: 1px solid #ddd; }}
-                    table.data-table td {{ padding: 6px; border: 1px solid #ddd; text-align: center; }}
-                    table.data-table tr:nth-child(even) {{ background-color: #f9f9f9; }}
-                    table.data-table tr:hover {{ background-color: #f1f1f1; }}
-                    td {{ padding: 10px; border-bottom: 1px solid #ddd; }}
-                    tr:nth-child(even) {{ background-color: #f2f2f2; }}
-                    
-                    @media print {{
-                        .page-break {{ break-before: page; }}
-                        body {{ padding: 0; }}
-                    }}
-                </style>
-            </head>
-            <body>
-                <!-- Header -->
-                <div class="header">
-                    <div class="logo">EMKO</div>
-                    <div class="title-box">
-                        <div class="title">Monthly Progress Report</div>
-                        <div class="subtitle">Project: {project_name}</div>
-                        <div class="subtitle">Date: {pd.Timestamp.now().strftime('%Y-%m-%d')}</div>
-                    </div>
-                </div>
-
-                <!-- 1. Overall Metrics (New) -->
-                <div class="section">
-                    <div class="section-title">📊 종합 공정 현황 (Overall Status)</div>
-                    {metrics_html}
-                </div>
-
-                <!-- Issues & Delays -->
-                <div class="section">
-                     <div class="section-title">🚨 주요 이슈 및 지연 알림 (Major Issues)</div>
-                     <ul>
-                     {''.join([f'<li style="color:red; font-weight:bold;">{alert}</li>' for alert in delay_alerts]) if delay_alerts else '<li>No major issues found. (정상)</li>'}
-                     </ul>
-                </div>
-
-                <div class="page-break"></div>
-
-                <!-- Gantt Chart -->
-                <div class="section">
-                    <div class="section-title">📅 통합 공정 스케줄 (Project Schedule)</div>
-                    <div style="width:100%; overflow-x: auto;">
-                        {gantt_html}
-                    </div>
-                </div>
-
-                <div class="page-break"></div>
-                
-                <!-- 2. Detailed Progress Review (New) -->
-                <div class="section">
-                    <div class="section-title">📋 상세 진도율 검토 (Detailed Progress Review)</div>
-                    {review_table_html}
-                </div>
-                
-                <div class="page-break"></div>
-
-                <!-- Detailed Data (Full Table) -->
-                <div class="section">
-                    <div class="section-title">📑 전체 데이터 (Full Data)</div>
-                    {data_table_html}
-                </div>
-                
-                <div class="footer">
-                    &copy; {date.today().year} EMKO. All rights reserved. Generated by Gantt Chat Project.
-                </div>
-            </body>
-            </html>
-            """
+                s_curve_html = figure_html(s_curve_entry(), include_plotlyjs=False, clear_title=True) or ''
+            if offline_report:
+                if not svg_report:
+                    gantt_html = figure_html(schedule_gantt_entry(), include_plotlyjs=False, clear_title=True) or "<p>일정 데이터 부족</p>"
+                review_table_html, data_table_html, body_end_html = create_offline_tables(edited_df, phases_info)
+                head_html = '' if svg_report else plotly_bundle_html()
+            else:
+                if not svg_report:
+                    gantt_html = figure_html(schedule_gantt_entry(), clear_title=True) or "<p>일정 데이터 부족</p>"
+                review_table_html = create_review_table_html(edited_df)
+                data_table_html = create_data_table_html(edited_df, phases_info)
+                head_html = body_end_html = ''
+
+            # Metrics / HTML Template (report.build_report_html)
+            html_content = build_report_html(
+                project_name, pd.Timestamp.now(), overall_plan, overall_actual, status_msg, delay_alerts,
+                gantt_html, review_table_html, data_table_html, head_html, body_end_html, s_curve_html
+            )
             
             # Save to Session State
             st.session_state.report_html = html_content
+            html_bytes = html_content.encode('utf-8')
+            st.session_state.report_gz = gzip.compress(html_bytes, compresslevel=6)
+            report_timing['bytes'] = len(html_bytes)
             
-            report_filename = f"{project_name}_Progress_Report.html"
-            safe_report_name = re.sub(r'[\\/*?:"<>|]', "", report_filename).strip()
-            st.session_state.report_name = safe_report_name
+            st.session_state.report_name = safe_filename(f"{project_name}_Progress_Report.html")
             
             st.success("보고서가 생성되었습니다! 아래 다운로드 버튼을 눌러주세요.")
 
@@ -1078,7 +641,58 @@ try:
             file_name=st.session_state.report_name,
             mime="text/html"
         )
+        st.download_button(
+            label=f"🗜️ 압축 보고서 다운로드 (.html.gz, {len(st.session_state.report_gz) / 1024:,.0f} KB)",
+            data=st.session_state.report_gz,
+            file_name=st.session_state.report_name + ".gz",
+            mime="application/gzip"
+        )
+
+    # --- 6. Portfolio (여러 프로젝트 일괄 집계) ---
+    st.markdown("---")
+    st.subheader("📁 포트폴리오 현황 (Portfolio)")
+    with st.expander("프로젝트 폴더 일괄 집계", expanded=st.session_state.get('portfolio_summary') is not None):
+        portfolio_dir = st.text_input("프로젝트 워크북 폴더 경로 (<project>_Schedule_Calculated.xlsx)", key="portfolio_dir")
+        if st.button("📊 포트폴리오 집계 (Process Folder)"):
+            portfolio_paths = find_workbooks(portfolio_dir) if portfolio_dir and os.path.isdir(portfolio_dir) else []
+            if not portfolio_paths:
+                st.warning("폴더에서 엑셀 파일을 찾을 수 없습니다.")
+            else:
+                with st.spinner(f"{len(portfolio_paths)}개 프로젝트를 병렬로 계산 중입니다..."):
+                    st.session_state.portfolio_summary = summarize_portfolio(portfolio_paths)
+
+        summary_df = st.session_state.get('portfolio_summary')
+        if summary_df is not None:
+            p_plan, p_actual = portfolio_progress(summary_df)
+            pc1, pc2, pc3 = st.columns(3)
+            pc1.metric("포트폴리오 계획 공정률", f"{p_plan:.2f}%")
+            pc2.metric("포트폴리오 실적 공정률", f"{p_actual:.2f}%", delta=f"{p_actual - p_plan:.2f}%")
+            pc3.metric("프로젝트 (오류)", f"{len(summary_df)} ({summary_df['오류 (Error)'].notna().sum()})")
+            st.dataframe(summary_df, use_container_width=True, hide_index=True)
 
 except Exception as e:
     st.error(f"오류 발생: {e}")
     st.text(traceback.format_exc())
+
+# 진단 패널: 시작 시간 + 이번 실행의 단계 표 + 최근 실행 기록 (JSON 내보내기)
+finish_run(diag, st.session_state.diag_history)
+record_first_paint()
+with diag_slot:
+    startup = startup_status()
+    warmed = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in startup['prewarm'].items() if seconds is not None)
+    st.caption(f"첫 화면 {startup['first_paint']:.2f}s ({'실행' if startup['since'] == 'launch' else '스크립트'} 기준) · "
+               f"미리 읽기: {warmed or '대기 중'}{'' if startup['prewarm_done'] else ' ...'}")
+    if diag is not None:
+        st.caption(f"이번 실행 {diag['total_seconds'] * 1000:,.0f} ms · {len(diag['stages'])}단계")
+        st.dataframe(stage_frame(diag), use_container_width=True, hide_index=True,
+                     column_config={'시간 (ms)': st.column_config.NumberColumn(format="%.1f"), '최대 메모리 (MB)': st.column_config.NumberColumn(format="%.1f")})
+    if st.session_state.diag_history:
+        st.caption(f"최근 실행 {len(st.session_state.diag_history)}회 (ms)")
+        st.dataframe(history_frame(st.session_state.diag_history), use_container_width=True, hide_index=True)
+        st.download_button("📥 진단 기록 JSON", data=history_json(st.session_state.diag_history),
+                           file_name=safe_filename(f"{project_name}_diagnostics.json"), mime="application/json")
+        if st.button("🧹 진단 기록 지우기"):
+            st.session_state.diag_history = []
+
+# 첫 화면이 그려진 뒤 plotly/openpyxl 을 백그라운드에서 미리 import (프로세스당 한 번, startup.py)
+start_prewarm()
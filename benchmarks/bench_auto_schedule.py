@@ -0,0 +1,115 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+from datetime import date, timedelta
+
+# Auto Plan 벤치마크: 기존 행 단위(iterrows + df.at) 방식 vs scheduler.auto_schedule 일괄 방식
+# calendar: 근무일 달력(주 5일 + holidays.csv) 적용 시간과 달력일 대비 배수 (wd ok: 모든 계획일이 근무일인지)
+# 실행: python benchmarks/bench_auto_schedule.py [행 수 ...]
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scheduler import PLAN_COLS, auto_schedule  # noqa: E402
+from work_calendar import HOLIDAY_FILE, load_holidays, make_calendar  # noqa: E402
+
+
+def legacy_auto_schedule(df, start_date):
+    # app.py 의 기존 구현 (비교 기준)
+    base_start = start_date
+    for i, row in df.iterrows():
+        try:
+            raw_weeks = row.get('제작 기간 (Weeks)', 0)
+            manuf_weeks = float(raw_weeks) if pd.notnull(raw_weeks) and raw_weeks != '' else 0
+
+            p_start = base_start
+            p_end = p_start + timedelta(days=15)
+            df.at[i, '구매 계획 시작'] = p_start
+            df.at[i, '구매 계획 종료'] = p_end
+
+            d_start = p_end + timedelta(days=3)
+            d_end = d_start + timedelta(days=120)
+            df.at[i, '설계 계획 시작'] = d_start
+            df.at[i, '설계 계획 종료'] = d_end
+
+            if manuf_weeks > 0:
+                m_start = d_end + timedelta(days=1)
+                m_end = m_start + timedelta(days=int(manuf_weeks * 7))
+            else:
+                m_start = None
+                m_end = None
+            df.at[i, '제작 계획 시작'] = m_start
+            df.at[i, '제작 계획 종료'] = m_end
+
+            base_for_insp = m_end if (m_end is not None) else d_end
+            i_start = base_for_insp + timedelta(days=1)
+            i_end = i_start + timedelta(days=14)
+            df.at[i, '검사 계획 시작'] = i_start
+            df.at[i, '검사 계획 종료'] = i_end
+
+            del_start = i_end + timedelta(days=7)
+            del_end = del_start + timedelta(days=7)
+            df.at[i, '납품 계획 시작'] = del_start
+            df.at[i, '납품 계획 종료'] = del_end
+        except Exception:
+            continue
+    return df
+
+
+def make_items(n, seed=0):
+    rng = np.random.default_rng(seed)
+    weeks = rng.choice([0, 8, 10, 12, 16, 20, 24, 36, 54, 12.5], size=n).astype(object)
+    weeks[rng.random(n) < 0.05] = None
+    df = pd.DataFrame({'항목 (Item)': [f"Item {i}" for i in range(n)], '제작 기간 (Weeks)': weeks})
+    for col in PLAN_COLS:
+        df[col] = pd.Series([None] * n, dtype=object)
+    return df
+
+
+def same_result(a, b):
+    for col in PLAN_COLS:
+        left = pd.to_datetime(a[col], errors='coerce').to_numpy(dtype='datetime64[D]')
+        right = pd.to_datetime(b[col], errors='coerce').to_numpy(dtype='datetime64[D]')
+        if not np.array_equal(left, right, equal_nan=True):
+            return False
+    return True
+
+
+def on_workdays(df, calendar):
+    for col in PLAN_COLS:
+        values = pd.to_datetime(df[col], errors='coerce').to_numpy(dtype='datetime64[D]')
+        values = values[~np.isnat(values)]
+        if not np.is_busday(values, busdaycal=calendar).all():
+            return False
+    return True
+
+
+def run(sizes):
+    start = date(2025, 1, 1)
+    calendar = make_calendar(holidays=load_holidays(HOLIDAY_FILE))
+    print(f"{'rows':>8} {'legacy (s)':>12} {'batch (s)':>12} {'speedup':>10}  same {'calendar (s)':>13} {'x batch':>8}  wd ok")
+    for n in sizes:
+        base = make_items(n)
+
+        df_legacy = base.copy()
+        t0 = time.perf_counter()
+        legacy_auto_schedule(df_legacy, start)
+        t_legacy = time.perf_counter() - t0
+
+        df_batch = base.copy()
+        t0 = time.perf_counter()
+        auto_schedule(df_batch, start)
+        t_batch = time.perf_counter() - t0
+
+        df_cal = base.copy()
+        t0 = time.perf_counter()
+        auto_schedule(df_cal, start, calendar)
+        t_cal = time.perf_counter() - t0
+
+        print(f"{n:>8} {t_legacy:>12.4f} {t_batch:>12.4f} {t_legacy / t_batch:>9.1f}x  {same_result(df_legacy, df_batch)!s:>4} "
+              f"{t_cal:>13.4f} {t_cal / t_batch:>7.1f}x  {on_workdays(df_cal, calendar)}")
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    run(sizes)
@@ -0,0 +1,45 @@
+import io
+import os
+import sys
+from datetime import date
+
+import pandas as pd
+
+# 엑셀 내보내기 벤치마크: 기존 pd.ExcelWriter(openpyxl) vs xlsx_stream 스트리밍 작성기
+# 측정: 소요 시간, 최대 메모리 (tracemalloc), 파일 크기
+# 실행: python benchmarks/bench_excel_export.py [행 수 ...]
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_gantt import make_schedule  # noqa: E402
+from pipeline import compute_project  # noqa: E402
+from report import measured, schedule_excel_bytes  # noqa: E402
+
+START, DELIVERY = date(2025, 1, 1), date(2026, 6, 30)
+
+
+def legacy_excel_bytes(df):
+    # app.py 의 기존 구현 (비교 기준)
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='openpyxl', datetime_format='YYYY-MM-DD') as writer:
+        df.to_excel(writer, index=False, sheet_name="Schedule")
+        meta_data = {'ProjectName': ['Bench'], 'StartDate': [START], 'DeliveryDate': [DELIVERY]}
+        pd.DataFrame(meta_data).to_excel(writer, index=False, sheet_name="ProjectInfo")
+    return output.getvalue()
+
+
+def run(sizes):
+    print(f"{'rows':>8} {'legacy (s)':>11} {'legacy MB':>10} {'stream (s)':>11} {'stream MB':>10} {'file KB':>9}")
+    for n in sizes:
+        df = make_schedule(n)
+        compute_project(df, None, DELIVERY)
+        # 시간은 추적 없이, 최대 메모리는 별도 실행에서 tracemalloc 으로 측정
+        _, t_legacy, _ = measured(legacy_excel_bytes, df)
+        _, _, m_legacy = measured(legacy_excel_bytes, df, trace_memory=True)
+        data, t_stream, _ = measured(schedule_excel_bytes, df, 'Bench', START, DELIVERY)
+        _, _, m_stream = measured(schedule_excel_bytes, df, 'Bench', START, DELIVERY, trace_memory=True)
+        print(f"{n:>8} {t_legacy:>11.2f} {m_legacy / 1024 ** 2:>10.1f} {t_stream:>11.2f} {m_stream / 1024 ** 2:>10.1f} {len(data) / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [1_000, 10_000]
+    run(sizes)
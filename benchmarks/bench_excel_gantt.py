@@ -0,0 +1,41 @@
+import os
+import sys
+from datetime import date
+
+import pandas as pd
+
+# 엑셀 간트 벤치마크: 항목 수 x 격자 일수 별 생성 시간, 최대 메모리, 파일 크기
+# 실행: python benchmarks/bench_excel_gantt.py [항목 수 ...]
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_gantt import make_schedule  # noqa: E402
+from excel_gantt import gantt_excel_bytes  # noqa: E402
+from report import measured  # noqa: E402
+from schedule_model import ALL_DATE_COLS, PHASES_INFO  # noqa: E402
+
+AS_OF, DELIVERY = date(2025, 8, 31), date(2026, 2, 28)
+
+
+def fit_days(df, days):
+    # 모든 날짜를 첫 날짜 기준 days 일 안으로 압축 (격자 폭 고정)
+    dates = df[ALL_DATE_COLS].apply(pd.to_datetime)
+    d0 = dates.min().min()
+    scale = (days - 1) / (dates.max().max() - d0).days
+    for col in ALL_DATE_COLS:
+        df[col] = d0 + pd.to_timedelta(((dates[col] - d0).dt.days * scale).round(), unit='D')
+    return df
+
+
+def run(sizes, days=400):
+    print(f"{'items':>8} {'grid':>10} {'time (s)':>9} {'peak MB':>8} {'file KB':>8}")
+    for n in sizes:
+        df = fit_days(make_schedule(n), days)
+        for bucket in ('day', 'week'):
+            data, seconds, _ = measured(gantt_excel_bytes, df, PHASES_INFO, 'Bench', AS_OF, DELIVERY, bucket)
+            _, _, peak = measured(gantt_excel_bytes, df, PHASES_INFO, 'Bench', AS_OF, DELIVERY, bucket, trace_memory=True)
+            print(f"{n:>8} {bucket + ' x' + str(days):>10} {seconds:>9.2f} {peak / 1024 ** 2:>8.1f} {len(data) / 1024:>8.0f}")
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [100, 2_000, 10_000]
+    run(sizes)
@@ -0,0 +1,53 @@
+import os
+import sys
+import time
+import numpy as np
+from datetime import date
+
+# 간트 차트 벤치마크: 기본 간트(px.timeline) vs 대용량 간트(Scattergl + LOD)
+# 측정: 그림 생성 + JSON 직렬화 시간, 직렬화 크기
+# 실행: python benchmarks/bench_gantt.py [행 수 ...]
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_auto_schedule import make_items  # noqa: E402
+from charts import create_gantt_chart, create_gantt_chart_fast  # noqa: E402
+from scheduler import auto_schedule  # noqa: E402
+from schedule_model import PHASES_INFO, normalize_schedule  # noqa: E402
+
+LEGACY_MAX_ROWS = 10_000  # 이보다 크면 기본 간트는 생략 (수십 초 이상)
+
+
+def make_schedule(n, seed=0):
+    rng = np.random.default_rng(seed)
+    df, _ = normalize_schedule(auto_schedule(make_items(n, seed), date(2025, 1, 1)))
+    # 앞쪽 단계 일부에 실적 입력
+    for _, p_s, p_e, a_s, a_prog, a_e in PHASES_INFO[:3]:
+        started = rng.random(n) < 0.6
+        df.loc[started, a_s] = df.loc[started, p_s]
+        df.loc[started, a_prog] = rng.integers(0, 101, started.sum()).astype(float)
+    return df
+
+
+def measure(build, df):
+    t0 = time.perf_counter()
+    fig = build(df, PHASES_INFO, "bench")
+    payload = fig.to_json() if fig is not None else ''
+    return time.perf_counter() - t0, len(payload)
+
+
+def run(sizes):
+    print(f"{'rows':>8} {'legacy (s)':>12} {'legacy (kB)':>12} {'fast (s)':>10} {'fast (kB)':>10}")
+    for n in sizes:
+        df = make_schedule(n)
+        if n <= LEGACY_MAX_ROWS:
+            t_legacy, size_legacy = measure(create_gantt_chart, df)
+            legacy = f"{t_legacy:>12.3f} {size_legacy / 1024:>12.0f}"
+        else:
+            legacy = f"{'-':>12} {'-':>12}"
+        t_fast, size_fast = measure(create_gantt_chart_fast, df)
+        print(f"{n:>8} {legacy} {t_fast:>10.3f} {size_fast / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [500, 2_000, 10_000, 100_000]
+    run(sizes)
@@ -0,0 +1,57 @@
+import os
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+# 업체 부하 평준화 벤치마크: 항목 수 x 업체 수 별 시간, 한도 초과 여부(peak <= capacity), 최대 납품 지연
+# 실행: python benchmarks/bench_leveling.py [항목 수 ...]
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_gantt import make_schedule  # noqa: E402
+from report import measured  # noqa: E402
+from resource_leveling import level_manufacturing  # noqa: E402
+from scheduler import auto_schedule  # noqa: E402
+from schedule_model import VENDOR_COL  # noqa: E402
+
+VENDORS = 50
+START = date(2025, 1, 1)
+DELIVERY = date(2026, 6, 30)
+
+
+def make_items(n, vendors=VENDORS, seed=0):
+    rng = np.random.default_rng(seed)
+    df = make_schedule(n)
+    df['제작 실적 시작'] = pd.NaT
+    df[VENDOR_COL] = [f"Vendor {v}" for v in rng.integers(0, vendors, n)]
+    capacities = {f"Vendor {v}": int(rng.integers(5, 40)) for v in range(vendors)}
+    return auto_schedule(df, START), capacities
+
+
+def peak_over_capacity(df, capacities):
+    # 평준화 후 업체별 최대 동시 제작 수 - 한도 (0 이하면 한도 준수)
+    start = pd.to_datetime(df['제작 계획 시작']).to_numpy(dtype='datetime64[D]')
+    end = pd.to_datetime(df['제작 계획 종료']).to_numpy(dtype='datetime64[D]')
+    vendors = df[VENDOR_COL].to_numpy(dtype=object)
+    worst = -min(capacities.values())
+    for vendor, capacity in capacities.items():
+        m = (vendors == vendor) & ~np.isnat(start) & (end > start)
+        times = np.concatenate([start[m], end[m]]).astype('int64')
+        steps = np.concatenate([np.ones(m.sum()), -np.ones(m.sum())])
+        order = np.lexsort((steps, times))  # 같은 날은 종료 먼저
+        worst = max(worst, int(np.cumsum(steps[order]).max(initial=0)) - capacity)
+    return worst
+
+
+def run(sizes):
+    print(f"{'items':>8} {'vendors':>8} {'time (s)':>9} {'over cap':>9} {'max slip (d)':>13}")
+    for n in sizes:
+        df, capacities = make_items(n)
+        (df, table, _), seconds, _ = measured(level_manufacturing, df, capacities, DELIVERY)
+        print(f"{n:>8} {len(capacities):>8} {seconds:>9.3f} {peak_over_capacity(df, capacities):>9} {table['계약 대비 (일)'].max():>13.0f}")
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    run(sizes)
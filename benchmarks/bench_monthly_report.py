@@ -0,0 +1,30 @@
+import os
+import sys
+from datetime import date
+
+# 월간 진도 보고서 템플릿 채우기 벤치마크: 항목 수 별 생성 시간, 최대 메모리, 파일 크기
+# 실행: python benchmarks/bench_monthly_report.py [항목 수 ...]
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_gantt import make_schedule  # noqa: E402
+from monthly_report import monthly_report_bytes  # noqa: E402
+from pipeline import compute_project  # noqa: E402
+from report import measured  # noqa: E402
+from schedule_model import PHASES_INFO  # noqa: E402
+
+AS_OF = date(2025, 8, 31)
+
+
+def run(sizes):
+    print(f"{'items':>8} {'time (s)':>9} {'peak MB':>8} {'file KB':>8}")
+    for n in sizes:
+        df = make_schedule(n)
+        compute_project(df, AS_OF)
+        data, seconds, _ = measured(monthly_report_bytes, df, PHASES_INFO, 'Bench', AS_OF)
+        _, _, peak = measured(monthly_report_bytes, df, PHASES_INFO, 'Bench', AS_OF, trace_memory=True)
+        print(f"{n:>8} {seconds:>9.2f} {peak / 1024 ** 2:>8.1f} {len(data) / 1024:>8.0f}")
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [31, 2_000, 10_000]
+    run(sizes)
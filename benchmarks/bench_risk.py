@@ -0,0 +1,29 @@
+import os
+import sys
+from datetime import date
+
+# Monte Carlo 위험 분석 벤치마크: 항목 수 x 반복 횟수 별 시간과 프로젝트 P50/P80/P90, 계약 준수 확률
+# 실행: python benchmarks/bench_risk.py [반복 횟수 ...]  (워커 수: 환경변수 RISK_WORKERS, 기본 자동)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_gantt import make_schedule  # noqa: E402
+from report import measured  # noqa: E402
+from risk_analysis import RISK_RANGES, simulate_risk  # noqa: E402
+from schedule_model import PHASES_INFO  # noqa: E402
+
+ITEMS = 500
+DELIVERY = date(2027, 2, 15)
+
+
+def run(iterations):
+    workers = int(os.environ['RISK_WORKERS']) if os.environ.get('RISK_WORKERS') else None
+    df = make_schedule(ITEMS)
+    print(f"{'items':>6} {'iterations':>10} {'time (s)':>9} {'P50':>11} {'P80':>11} {'P90':>11} {'P(meet)':>8}")
+    for n in iterations:
+        (_, summary), seconds, _ = measured(simulate_risk, df, PHASES_INFO, DELIVERY, n, RISK_RANGES, 0, workers)
+        print(f"{ITEMS:>6} {n:>10} {seconds:>9.2f} {summary['P50']!s:>11} {summary['P80']!s:>11} {summary['P90']!s:>11} {summary['probability']:>7.1f}%")
+
+
+if __name__ == "__main__":
+    iterations = [int(a) for a in sys.argv[1:]] or [10_000, 100_000]
+    run(iterations)
@@ -0,0 +1,49 @@
+import os
+import re
+import subprocess
+import sys
+
+# 시작 시간 벤치마크: 새 프로세스에서 app.py 가 첫 화면 전에 import 하는 모듈(streamlit 제외)을 읽는 시간
+# lazy: 현재 (plotly/openpyxl 은 처음 쓸 때), eager: 기존처럼 plotly.express/graph_objects 를 함께 import
+# 이어서 startup.start_prewarm 의 백그라운드 import 시간 (첫 화면 뒤에 숨는 비용)
+# 실행: python benchmarks/bench_startup.py [반복 횟수]  (파일 캐시 영향을 줄이려면 여러 번 돌려 중앙값)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EAGER = ['plotly.express', 'plotly.graph_objects']
+HEAVY = ['plotly', 'openpyxl']
+
+
+def app_modules():
+    # app.py 최상위의 로컬 모듈 import 목록
+    with open(os.path.join(ROOT, 'app.py'), encoding='utf-8') as f:
+        names = re.findall(r'^from (\w+) import', f.read(), flags=re.M)
+    return [n for n in names if os.path.exists(os.path.join(ROOT, f'{n}.py'))]
+
+
+def import_seconds(modules):
+    # 새 프로세스에서 pandas/numpy 를 포함해 modules 를 import 하는 시간과, 그 뒤 읽혀 있는 무거운 모듈
+    code = ("import sys, time\nt = time.perf_counter()\nimport numpy, pandas\n"
+            + "".join(f"import {m}\n" for m in modules)
+            + f"print(time.perf_counter() - t, ','.join(m for m in {HEAVY!r} if m in sys.modules))")
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True).stdout.split()
+    return float(out[0]), out[1] if len(out) > 1 else '-'
+
+
+def prewarm_seconds():
+    code = ("import time, startup\nstartup.start_prewarm()\nstartup._state['thread'].join()\n"
+            "print(';'.join(f'{k}={v:.2f}' for k, v in startup.startup_status()['prewarm'].items() if v is not None))")
+    return subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def run(repeat):
+    modules = app_modules()
+    lazy = sorted(import_seconds(modules) for _ in range(repeat))
+    eager = sorted(import_seconds(EAGER + modules) for _ in range(repeat))
+    print(f"{'mode':<6} {'median (s)':>10} {'min (s)':>8}  loaded")
+    for name, times in (('lazy', lazy), ('eager', eager)):
+        print(f"{name:<6} {times[len(times) // 2][0]:>10.3f} {times[0][0]:>8.3f}  {times[0][1]}")
+    print(f"pre-warm (background, after first paint): {prewarm_seconds()}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
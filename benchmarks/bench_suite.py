@@ -0,0 +1,178 @@
+import argparse
+import csv
+import os
+import subprocess
+import sys
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+# 벤치마크 모음 (Benchmark Suite): 합성 일정 100 / 1k / 10k / 100k 항목으로 주요 경로를 한 번에 측정
+# 대상: Auto Plan, 진도 계산, 지연 분석, 간트(create_gantt_chart), 계획 대비 실적 간트, 데이터 표 HTML, 엑셀 내보내기, HTML 보고서
+# 결과(시간, 최대 메모리, 출력 크기)는 커밋 id 와 함께 CSV 에 누적 -> --compare 로 이전 커밋 대비 배수를 본다
+# 시간은 추적 없이, 최대 메모리는 별도 실행에서 tracemalloc 으로 측정 (report.measured, --no-memory 로 생략)
+# 실행: python benchmarks/bench_suite.py [--sizes 100 1000 ...] [--cases delay excel ...] [--out FILE] [--compare REV]
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_auto_schedule import make_items  # noqa: E402
+from charts import create_gantt_chart, create_plan_vs_actual_gantt  # noqa: E402
+from delay_analysis import build_delay_table  # noqa: E402
+from pipeline import compute_project, render_report  # noqa: E402
+from progress_engine import compute_progress, month_bounds  # noqa: E402
+from report import create_data_table_html, measured, schedule_excel_bytes  # noqa: E402
+from schedule_model import PHASES_INFO, normalize_schedule  # noqa: E402
+from scheduler import PLAN_COLS, auto_schedule  # noqa: E402
+
+SIZES = [100, 1_000, 10_000, 100_000]
+START, AS_OF, DELIVERY = date(2025, 1, 1), date(2025, 9, 15), date(2026, 3, 31)
+RESULTS_FILE = 'bench_results.csv'
+RESULT_COLS = ['commit', 'run_at', 'case', 'rows', 'seconds', 'peak_mb', 'bytes']
+CASES = ['auto_schedule', 'progress', 'delay', 'gantt', 'plan_vs_actual_gantt', 'data_table_html', 'excel', 'report_html']
+# 행 단위 plotly express 간트는 이보다 크면 생략 (10만 행은 수 분 이상, 화면은 대용량 간트를 씀)
+MAX_ROWS = {'gantt': 10_000, 'plan_vs_actual_gantt': 10_000}
+
+
+def make_synthetic_schedule(n, as_of=AS_OF, seed=0):
+    # Auto Plan 결과를 항목별 0~270일 분산 착수시키고, 기준일(as_of) 기준으로 실적을 채운 일정
+    # 기준일 전에 끝난 단계: 실적 시작/종료 + 100% (일부 지연), 진행 중 단계: 실적 시작 + 경과 비율 근처 진도율,
+    # 시작 전 단계: 빈 값. 5% 항목은 실적 미입력, 30% 항목은 금액 없음 (가중치 입력)
+    rng = np.random.default_rng(seed)
+    df = auto_schedule(make_items(n, seed), START)
+    offset = rng.integers(0, 271, n).astype('timedelta64[D]')
+    for col in PLAN_COLS:
+        df[col] = pd.to_datetime(df[col]).to_numpy(dtype='datetime64[D]') + offset
+
+    today = np.datetime64(as_of, 'D')
+    reported = rng.random(n) >= 0.05
+    for _, p_s, p_e, a_s, a_prog, a_e in PHASES_INFO:
+        plan_start, plan_end = df[p_s].to_numpy(dtype='datetime64[D]'), df[p_e].to_numpy(dtype='datetime64[D]')
+        start = plan_start + rng.integers(-3, 11, n).astype('timedelta64[D]')
+        slip = np.where(rng.random(n) < 0.25, rng.integers(1, 31, n), rng.integers(-5, 1, n))
+        end = np.maximum(plan_end + slip.astype('timedelta64[D]'), start)
+        started = reported & ~np.isnat(plan_start) & (start <= today)
+        finished = started & (end <= today)
+        span = np.maximum((end - start).astype(int), 1)
+        elapsed = np.clip((today - start).astype(int) / span * 100 + rng.normal(0, 10, n), 0, 99)
+        df[a_s] = np.where(started, start, np.datetime64('NaT'))
+        df[a_e] = np.where(finished, end, np.datetime64('NaT'))
+        df[a_prog] = np.where(finished, 100.0, np.where(started, np.round(elapsed), np.nan))
+
+    df['금액 (Amount)'] = np.where(rng.random(n) < 0.7, rng.integers(1, 500, n) * 1_000_000.0, np.nan)
+    df['가중치 (Weight)'] = np.where(np.isnan(df['금액 (Amount)']), rng.integers(1, 10, n), np.nan)
+    df, _ = normalize_schedule(df)
+    return df
+
+
+def _figure_json(build, df):
+    fig = build(df)
+    return fig.to_json() if fig is not None else ''
+
+
+def _report_html(df, overall_plan, overall_actual, delay_alerts):
+    return render_report(df, 'Bench', overall_plan, overall_actual, delay_alerts, AS_OF, DELIVERY)
+
+
+def prepare_cases(df):
+    # 이름 -> (함수, 인자). 측정 전에 진도/가중치 컬럼을 채운 df 를 공유 (측정 함수는 df 를 바꾸지 않음)
+    first_day_of_month, last_day_of_month = month_bounds(AS_OF)
+    overall_plan, overall_actual, delay_alerts = compute_project(df, AS_OF, DELIVERY)
+    today = pd.Timestamp(AS_OF)
+    return {
+        'auto_schedule': (lambda d: auto_schedule(d.copy(), START), (df,)),
+        'progress': (compute_progress, (df, PHASES_INFO, first_day_of_month, last_day_of_month)),
+        'delay': (build_delay_table, (df, PHASES_INFO, DELIVERY)),
+        'gantt': (_figure_json, (lambda d: create_gantt_chart(d, PHASES_INFO, 'Bench', today), df)),
+        'plan_vs_actual_gantt': (_figure_json, (lambda d: create_plan_vs_actual_gantt(d, PHASES_INFO, today), df)),
+        'data_table_html': (create_data_table_html, (df, PHASES_INFO)),
+        'excel': (schedule_excel_bytes, (df, 'Bench', START, DELIVERY)),
+        'report_html': (_report_html, (df, overall_plan, overall_actual, delay_alerts)),
+    }
+
+
+def output_size(result):
+    if isinstance(result, str):
+        return len(result.encode('utf-8'))
+    if isinstance(result, bytes):
+        return len(result)
+    return None
+
+
+def current_commit():
+    # 현재 커밋 id (작업 트리에 변경이 있으면 -dirty), git 이 없으면 'unknown'
+    try:
+        out = subprocess.run(['git', 'describe', '--always', '--dirty'], capture_output=True, text=True, check=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run(sizes, cases, memory=True):
+    commit, run_at = current_commit(), datetime.now().isoformat(timespec='seconds')
+    results = []
+    print(f"{'case':<22} {'rows':>8} {'time (s)':>9} {'peak MB':>8} {'out KB':>9}")
+    for n in sizes:
+        measure = prepare_cases(make_synthetic_schedule(n))
+        for name in cases:
+            if n > MAX_ROWS.get(name, n):
+                print(f"{name:<22} {n:>8} {'-':>9} {'-':>8} {'-':>9}")
+                continue
+            fn, args = measure[name]
+            result, seconds, _ = measured(fn, *args)
+            peak = measured(fn, *args, trace_memory=True)[2] if memory else None
+            size = output_size(result)
+            row = {'commit': commit, 'run_at': run_at, 'case': name, 'rows': n, 'seconds': round(seconds, 4),
+                   'peak_mb': None if peak is None else round(peak / 1024 ** 2, 2), 'bytes': size}
+            results.append(row)
+            peak_text = '-' if peak is None else f"{peak / 1024 ** 2:.1f}"
+            size_text = '-' if size is None else f"{size / 1024:.0f}"
+            print(f"{name:<22} {n:>8} {seconds:>9.3f} {peak_text:>8} {size_text:>9}")
+    return results
+
+
+def append_results(path, results):
+    new_file = not os.path.exists(path)
+    with open(path, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_COLS)
+        if new_file:
+            writer.writeheader()
+        writer.writerows(results)
+
+
+def compare(path, results, rev):
+    # rev 커밋의 마지막 측정과 이번 측정의 시간/메모리 배수 (1 보다 크면 느려짐). 이번 결과를 기록하기 전에 호출
+    if not os.path.exists(path):
+        print(f"\n비교할 결과 파일이 없습니다: {path}")
+        return
+    history = pd.read_csv(path, dtype={'commit': str})
+    base = history[history['commit'].str.startswith(rev)].drop_duplicates(['case', 'rows'], keep='last')
+    if base.empty:
+        print(f"\n{path} 에 '{rev}' 측정 결과가 없습니다. 기록된 커밋: {', '.join(history['commit'].unique())}")
+        return
+    merged = pd.DataFrame(results).merge(base, on=['case', 'rows'], suffixes=('', '_base'))
+    print(f"\n{'case':<22} {'rows':>8} {'time x':>8} {'peak x':>8}  (vs {base['commit'].iloc[-1]})")
+    for row in merged.itertuples(index=False):
+        time_ratio = row.seconds / row.seconds_base if row.seconds_base else float('nan')
+        peak_ratio = row.peak_mb / row.peak_mb_base if pd.notna(row.peak_mb) and row.peak_mb_base else float('nan')
+        print(f"{row.case:<22} {row.rows:>8} {time_ratio:>8.2f} {peak_ratio:>8.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 일정 벤치마크 모음 (시간/메모리 -> CSV)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help="항목 수 (기본: 100 1000 10000 100000)")
+    parser.add_argument('--cases', nargs='+', choices=CASES, default=CASES, help="측정할 경로 (기본: 전체)")
+    parser.add_argument('--out', default=RESULTS_FILE, help=f"결과 CSV (누적 기록, 기본: {RESULTS_FILE})")
+    parser.add_argument('--no-memory', dest='memory', action='store_false', help="최대 메모리 측정 생략 (실행 시간 절반)")
+    parser.add_argument('--compare', default=None, metavar='REV', help="결과 CSV 에 기록된 커밋과 비교")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.cases, args.memory)
+    if args.compare:
+        compare(args.out, results, args.compare)
+    append_results(args.out, results)
+    print(f"\n{len(results)}건 기록: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
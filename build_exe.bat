@@ -13,7 +13,34 @@ pyinstaller --noconfirm --onefile --windowed --name "SCH_SCR system" ^
  --collect-all=streamlit ^
  --collect-all=altair ^
  --collect-all=pyarrow ^
+ --collect-data=plotly ^
  --add-data "app.py;." ^
+ --add-data "schedule_model.py;." ^
+ --add-data "progress_engine.py;." ^
+ --add-data "scheduler.py;." ^
+ --add-data "delay_analysis.py;." ^
+ --add-data "incremental.py;." ^
+ --add-data "upload_cache.py;." ^
+ --add-data "legacy_import.py;." ^
+ --add-data "portfolio.py;." ^
+ --add-data "pipeline.py;." ^
+ --add-data "report.py;." ^
+ --add-data "charts.py;." ^
+ --add-data "figure_cache.py;." ^
+ --add-data "svg_gantt.py;." ^
+ --add-data "xlsx_stream.py;." ^
+ --add-data "excel_gantt.py;." ^
+ --add-data "xlsx_patch.py;." ^
+ --add-data "monthly_report.py;." ^
+ --add-data "snapshot_store.py;." ^
+ --add-data "scurve.py;." ^
+ --add-data "work_calendar.py;." ^
+ --add-data "resource_leveling.py;." ^
+ --add-data "risk_analysis.py;." ^
+ --add-data "diagnostics.py;." ^
+ --add-data "startup.py;." ^
+ --add-data "holidays.csv;." ^
+ --add-data "Target_08월 월간진도보고서.xlsx;." ^
  --add-data "requirements.txt;." ^
  run_exe.py
 
@@ -0,0 +1,398 @@
+import numpy as np
+import pandas as pd
+
+from progress_engine import compute_earned_dates, date_array
+from schedule_model import ALL_DATE_COLS, ALL_PROG_COLS, PHASE_COLORS
+
+# 차트 생성 (Chart Generation)
+# Streamlit 에 의존하지 않으므로 app.py 와 배치 리포트(pipeline.py)가 같은 함수를 사용한다.
+# today 를 지정하면 Today 선/진행 중 실적 막대의 기준일로 사용한다 (None 이면 현재 시각).
+# plotly 는 그림을 실제로 만들 때 함수 안에서 import 한다 (앱 첫 화면 전에 plotly 를 읽지 않음, startup.py 참고).
+
+# 간트 차트가 읽는 컬럼 (차트 캐시 지문 계산용)
+GANTT_COLS = ['항목 (Item)'] + ALL_DATE_COLS + ALL_PROG_COLS
+
+
+def as_of_timestamp(today=None):
+    return pd.Timestamp.now() if today is None else pd.Timestamp(today)
+
+
+def create_gantt_chart(df, phases, title, today=None):
+    # Prepare data for Plotly Gantt
+    plan_data = [] # For bar chart (px.timeline)
+
+    # Color mapping (Pastel Tones for Plan)
+    phase_colors = PHASE_COLORS
+
+    # Lists for the Vertical Progress Line (Actual)
+    line_dates = []
+    line_items = []
+
+    # Find Latest Status Date (Earned Schedule) for every Item at once
+    # Strategy: If Actual End exists -> Plot at Plan End.
+    #           If Actual Start exists -> Plot at Plan Start.
+    #           This visualizes "How much planned work has been achieved".
+    #           Right of Today = Ahead (Completed future work).
+    #           Left of Today  = Delay (Only completed past work).
+    earned_dates = compute_earned_dates(df, phases)
+
+    # We need to iterate in the order they appear in the DataFrame to maintain vertical connection
+    # Plotly draws Y axis from bottom up by default, but we use 'reversed' in update_yaxes.
+    # So top row in DF = Top row in Chart.
+
+    for pos, (index, row) in enumerate(df.iterrows()):
+        item_name = row['항목 (Item)']
+        if pd.isna(item_name) or str(item_name).strip() == "": continue
+
+        # 1. Collect Plan Data
+        for phase_name, p_start, p_end, a_start, a_prog, a_end in phases:
+            if pd.notnull(row[p_start]) and pd.notnull(row[p_end]):
+                plan_data.append(dict(
+                    Item=item_name, 
+                    Y_Label=item_name,  
+                    Phase=phase_name, 
+                    Start=row[p_start], 
+                    Finish=row[p_end],
+                    Type="Plan"
+                ))
+
+        # 2. Latest Plan Date achieved
+        if not np.isnat(earned_dates[pos]):
+            line_dates.append(pd.Timestamp(earned_dates[pos]).date())
+            line_items.append(item_name)
+
+    if not plan_data and not line_dates:
+        return None
+
+    # --- Create Figure ---
+    import plotly.express as px
+    import plotly.graph_objects as go
+    fig = go.Figure()
+
+    # 1. Add Plan Bars
+    if plan_data:
+        g_df = pd.DataFrame(plan_data)
+        g_df['Start'] = pd.to_datetime(g_df['Start'])
+        g_df['Finish'] = pd.to_datetime(g_df['Finish'])
+
+        # Important: We want the Y-axis order to follow df order.
+        # Plotly maps categorical Y based on appearance or sort.
+        # We can force the category order.
+
+        # Instead of separate px.timeline, let's add traces to go.Figure manually or use px and add scatter.
+        # Using px.timeline is easier for the bars.
+        fig = px.timeline(
+            g_df, x_start="Start", x_end="Finish", y="Y_Label", color="Phase", 
+            color_discrete_map=phase_colors,
+            opacity=0.5, # Background opacity
+            hover_data=["Item", "Phase", "Start", "Finish"], 
+            title=title
+        )
+    else:
+        fig = go.Figure()
+        fig.update_layout(title=title)
+
+    # 2. Add Vertical Progress Line
+    if line_dates:
+        fig.add_trace(go.Scatter(
+            x=line_dates,
+            y=line_items,
+            mode='lines+markers',
+            name='Actual Progress (Original)',
+            marker=dict(symbol='circle', size=10, color='#FF5733'), # Red-Orange dot
+            line=dict(color='#FF5733', width=3), # Connection line
+            hoverinfo='x+y+text',
+            hovertext=[f"Latest: {d}" for d in line_dates]
+        ))
+
+    # --- Layout Adjustments ---
+    fig.update_yaxes(
+        autorange="reversed", # Start from top
+        title_text="항목 (Item)",
+        type='category', # Ensure categorical
+        categoryorder='array', # Force order
+        categoryarray=df['항목 (Item)'].tolist(), # Use exact DF order
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='#888888',
+    )
+
+    # Add 'Today' Line
+    today_ts = as_of_timestamp(today).timestamp() * 1000
+    fig.add_vline(x=today_ts, line_width=2, line_dash="solid", line_color="red", annotation_text="Today")
+
+    fig.update_xaxes(
+        type='date', 
+        showgrid=True, 
+        gridwidth=0.5, 
+        gridcolor='#E0E0E0',
+        dtick=864000000.0, # 10 Days
+        tickformat="%m-%d"
+    )
+
+    fig.update_layout(
+        height=max(600, len(df) * 40), 
+        template='plotly_white',
+        barmode='overlay',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+
+    return fig
+
+
+def create_plan_vs_actual_gantt(df, phases, today=None):
+    # Prepare data for Plan vs Actual Gantt
+    gantt_data = []
+
+    # Color mapping for phases (Synced with Main Gantt)
+    phase_colors = PHASE_COLORS
+
+    for index, row in df.iterrows():
+        item_name = row['항목 (Item)']
+        if pd.isna(item_name) or str(item_name).strip() == "": continue
+
+        for phase_name, p_start, p_end, a_start, a_prog, a_end in phases:
+            # 1. Plan Bar (Grey)
+            if pd.notnull(row[p_start]) and pd.notnull(row[p_end]):
+                gantt_data.append(dict(
+                    Item=item_name, 
+                    Y_Label=f"{item_name}", 
+                    Phase="Plan",
+                    Start=row[p_start], 
+                    Finish=row[p_end],
+                    ColorKey="Plan" 
+                ))
+
+            # 2. Actual Bar (Colored by Phase)
+            if pd.notnull(row[a_start]):
+                 start_date = row[a_start]
+                 # If end date is missing, assume it's ongoing (ends today)
+                 finish_date = row[a_end] if pd.notnull(row[a_end]) else as_of_timestamp(today).date()
+
+                 gantt_data.append(dict(
+                    Item=item_name, 
+                    Y_Label=f"{item_name}", 
+                    Phase=phase_name, 
+                    Start=start_date, 
+                    Finish=finish_date,
+                    ColorKey=phase_name 
+                ))
+
+    if not gantt_data: return None
+
+    g_df = pd.DataFrame(gantt_data)
+    g_df['Start'] = pd.to_datetime(g_df['Start'])
+    g_df['Finish'] = pd.to_datetime(g_df['Finish'])
+
+    # Define color map including 'Plan'
+    color_map = {'Plan': '#d3d3d3'} # Light Grey
+    color_map.update(phase_colors)
+
+    # To make Plan appear "behind" or clearly distinguishable, we might want to separate rows or overlap.
+    # User said "Plan Grey, Actual Color Comparison".
+    # If we share Y_Label, they overlap in 'stack' mode (not ideal) or 'group' mode.
+    # 'overlay' mode isn't standard in timeline. 
+    # Best approach for comparison: Two rows per Item? 
+    # "Item 1 (Plan)" and "Item 1 (Actual)"?
+    # User request: "Gantt차트를 이용하여 plan 차트 회색으로 실행차트는 비교하는 것으로 항목별... 날짜로 표현해줘."
+    # Let's align them on the SAME row if possible, but distinct visuals, OR separate rows.
+    # Separate rows (Plan row, Actual row) is clearest for Gantt.
+    # Let's adjust Y_Label to separate Plan/Actual.
+
+    g_df['Y_Cat'] = g_df.apply(lambda x: x['Item'] if x['ColorKey'] != 'Plan' else x['Item'] + " (Plan)", axis=1) # Naive approach
+    # Better: Group by Item, but differentiate Plan/Actual bars.
+    # Let's try: Item Name as Y Axis.
+    # But distinguish bars by opacity or width? Plotly Express timeline is limited.
+
+    # Let's go with: 
+    # Row 1: Item A (Plan) -> Grey Bars
+    # Row 2: Item A (Actual) -> Colored Bars
+    # This is clear.
+
+
+    g_df['Y_Label_Final'] = g_df.apply(lambda x: f"{x['Item']} [Plan]" if x['ColorKey'] == 'Plan' else f"<span style='color: #0000FF; font-weight: bold; font-size: 14px;'>{x['Item']} [Actual]</span>", axis=1)
+
+    # Sorting to keep Plan/Actual together
+    g_df.sort_values(by=['Item', 'ColorKey'], ascending=[True, False], inplace=True) 
+    # Plan (P) vs Phase Name... P comes after most? 
+    # Let's force verify order.
+
+    import plotly.express as px
+    fig = px.timeline(
+        g_df, x_start="Start", x_end="Finish", y="Y_Label_Final", color="ColorKey",
+        color_discrete_map=color_map,
+        opacity=0.9,
+        hover_data=["Item", "Phase", "Start", "Finish"],
+        title="상세 공정 비교 (Plan vs Actual)"
+    )
+
+    fig.update_yaxes(
+        autorange="reversed", 
+        title_text="항목 (Item)",
+        showgrid=True,
+        gridwidth=1,          # Thicker line
+        gridcolor='#888888',  # Darker grey for clear separation
+        zeroline=True,
+        zerolinewidth=2,
+        zerolinecolor='#888888'
+    )
+    fig.update_xaxes(
+        type='date',
+        showgrid=True,
+        gridwidth=0.5,
+        gridcolor='#E0E0E0',
+        dtick=864000000.0, # 10 Days
+        tickformat="%m-%d"
+    )
+    fig.update_layout(height=max(600, len(df)*50), showlegend=True, template='plotly_white') # Force white template
+    return fig
+
+
+def add_delivery_line(fig, contract_delivery_date):
+    # Add Delivery Line
+    delivery_ts = pd.to_datetime(contract_delivery_date).timestamp() * 1000
+    fig.add_vline(x=delivery_ts, line_width=2, line_dash="dash", line_color="red", annotation_text="계약 납품일")
+    return fig
+
+
+def create_s_curve_chart(curve, title, today=None):
+    # S-Curve (scurve.compute_s_curve 결과): 계획/실적 누적 공정률 선 + Today 선
+    if curve is None or curve.empty:
+        return None
+    dates, plan, actual = (curve[c] for c in curve.columns[:3])
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=dates, y=plan, mode='lines', name='계획 (Plan)', line=dict(color='#1f77b4', width=2)))
+    fig.add_trace(go.Scatter(x=dates, y=actual, mode='lines', name='실적 (Actual)', line=dict(color='#d62728', width=2)))
+    today_ts = as_of_timestamp(today).normalize()
+    fig.add_vline(x=today_ts.timestamp() * 1000, line_width=1, line_dash="dot", line_color="gray", annotation_text="Today")
+    fig.update_layout(
+        title=title, height=420, template='plotly_white', hovermode='x unified',
+        yaxis=dict(title='누적 공정률 (%)', range=[0, 105], ticksuffix='%'),
+        xaxis=dict(title=None, tickformat='%y-%m'),
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
+    )
+    return fig
+
+
+# --- 대용량 간트 (High-Volume Gantt) ---
+# 단계별 막대를 Scattergl 선분 트레이스 하나로 합쳐 그린다 (NaN 으로 구분, 숫자 배열은 바이너리로 직렬화).
+# 행 창(row_start, row_count)만 그리고, 창 안의 행이 LOD_MAX_ROWS 를 넘으면 연속된 행을 묶어
+# 묶음별 (최소 시작 ~ 최대 종료) 구간으로 표시한다.
+
+FAST_GANTT_ROWS = 300   # 이보다 많으면 대용량 간트 사용
+LOD_MAX_ROWS = 400      # 한 화면에 그릴 최대 (묶음) 행 수
+LABEL_MAX_ROWS = 150    # 이하일 때만 모든 행에 항목명 표시
+
+
+def _to_ms(values):
+    # datetime64 -> epoch ms (float, NaT 는 NaN)
+    ms = values.astype('datetime64[ms]').astype('int64').astype(float)
+    ms[np.isnat(values)] = np.nan
+    return ms
+
+
+def _segments(starts, ends, rows):
+    # 막대 구간을 [시작, 종료, NaN] 반복 배열로 (선분 하나 = 막대 하나)
+    ok = ~np.isnan(starts) & ~np.isnan(ends)
+    gap = np.full(ok.sum(), np.nan)
+    x = np.column_stack([starts[ok], ends[ok], gap]).ravel()
+    y = np.column_stack([rows[ok], rows[ok], gap]).ravel()
+    return x, y
+
+
+def _bucket_labels(names, group):
+    if group == 1:
+        return list(names)
+    labels = []
+    for i in range(0, len(names), group):
+        chunk = names[i:i + group]
+        labels.append(f"{chunk[0]} ~ {chunk[-1]} ({len(chunk)})")
+    return labels
+
+
+def create_gantt_chart_fast(df, phases, title, today=None, row_start=0, row_count=None, max_rows=LOD_MAX_ROWS):
+    names = df['항목 (Item)']
+    valid = (names.notna() & (names.astype(str).str.strip() != '')).to_numpy()
+    view = df[valid]
+    stop = len(view) if row_count is None else row_start + row_count
+    view = view.iloc[row_start:stop]
+    n = len(view)
+    if n == 0:
+        return None
+
+    # Level of detail: 연속된 group 개 행을 한 줄로 묶음
+    group = max(1, -(-n // max_rows))
+    bucket_starts = np.arange(0, n, group)
+    n_rows = len(bucket_starts)
+    rows = np.arange(n_rows, dtype=float)
+
+    def reduce(values, ufunc, fill):
+        if group == 1:
+            return values
+        filled = np.where(np.isnan(values), fill, values)
+        out = ufunc.reduceat(filled, bucket_starts)
+        out[np.isinf(out)] = np.nan
+        return out
+
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    plot_height = min(max(600, n_rows * 24), 1400)
+    bar_width = max(1.0, min(18.0, 0.6 * (plot_height - 150) / n_rows))
+    has_bars = False
+    for phase_name, p_start, p_end, a_start, a_prog, a_end in phases:
+        starts = reduce(_to_ms(date_array(view, p_start)), np.minimum, np.inf)
+        ends = reduce(_to_ms(date_array(view, p_end)), np.maximum, -np.inf)
+        x, y = _segments(starts, ends, rows)
+        if len(x) == 0:
+            continue
+        has_bars = True
+        fig.add_trace(go.Scattergl(
+            x=x, y=y, mode='lines', name=phase_name,
+            line=dict(color=PHASE_COLORS.get(phase_name, '#BBBBBB'), width=bar_width),
+            opacity=0.7, hovertemplate=f"{phase_name}<br>%{{x|%Y-%m-%d}}<extra></extra>",
+        ))
+
+    # Earned Schedule 진행선 (묶음은 가장 늦은 달성일)
+    earned = reduce(_to_ms(compute_earned_dates(view, phases)), np.maximum, -np.inf)
+    has_line = ~np.isnan(earned)
+    if has_line.any():
+        fig.add_trace(go.Scattergl(
+            x=earned[has_line], y=rows[has_line], mode='lines+markers', name='Actual Progress (Original)',
+            marker=dict(size=6 if n_rows > LABEL_MAX_ROWS else 10, color='#FF5733'), line=dict(color='#FF5733', width=2),
+            hovertemplate="Latest: %{x|%Y-%m-%d}<extra></extra>",
+        ))
+    if not has_bars and not has_line.any():
+        return None
+
+    labels = _bucket_labels(view['항목 (Item)'].astype(str).tolist(), group)
+    tick_step = max(1, -(-n_rows // LABEL_MAX_ROWS))
+    fig.update_yaxes(
+        autorange="reversed",
+        title_text="항목 (Item)" if group == 1 else f"항목 (Item) · {group}개씩 묶음",
+        tickmode='array',
+        tickvals=rows[::tick_step],
+        ticktext=labels[::tick_step],
+        showgrid=False,
+        zeroline=False,
+    )
+
+    today_ts = as_of_timestamp(today).timestamp() * 1000
+    fig.add_vline(x=today_ts, line_width=2, line_dash="solid", line_color="red", annotation_text="Today")
+
+    fig.update_xaxes(type='date', showgrid=True, gridwidth=0.5, gridcolor='#E0E0E0', tickformat="%y-%m-%d")
+    fig.update_layout(
+        title=title,
+        height=plot_height,
+        template='plotly_white',
+        hovermode='closest',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+def create_schedule_gantt(df, phases, title, today=None, row_start=0, row_count=None):
+    # 항목 수에 따라 기본 간트 / 대용량 간트 선택
+    if len(df) > FAST_GANTT_ROWS or row_start or row_count is not None:
+        return create_gantt_chart_fast(df, phases, title, today, row_start, row_count)
+    return create_gantt_chart(df, phases, title, today)
@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+from datetime import date
+
+from progress_engine import date_array
+from work_calendar import day_count
+
+# 지연 분석 (Delay Analysis)
+# 단계별 지연(실적 종료 > 계획 종료)과 계약 납품일 초과를 모든 항목에 대해 배열 연산으로 계산하고,
+# 납품일을 맞추기 위한 최소 비용 단축안(crash plan)을 만든다. 결과는 알림 표(DataFrame) 한 장.
+# calendar(work_calendar.make_calendar)를 주면 지연/초과/단계 기간을 근무일로 센다 (np.busday_count).
+
+# 단계별 단축 한계: 최소 기간(일), 1일 단축 비용 (상대 단위, 화면에서 변경 가능)
+# 설계 최소 30일은 기존 권장 규칙(설계 30일까지 단축 후 제작 단축)을 따른다
+CRASH_LIMITS = {
+    '구매 (Procurement)': {'min_days': 7, 'cost_per_day': 1.5},
+    '설계 (Design)': {'min_days': 30, 'cost_per_day': 1.0},
+    '제작 (Manufacturing)': {'min_days': 14, 'cost_per_day': 3.0},
+    '검사 (Inspection)': {'min_days': 5, 'cost_per_day': 2.0},
+    '납품 (Delivery)': {'min_days': 3, 'cost_per_day': 5.0},
+}
+
+ALERT_PHASE = '단계 지연'
+ALERT_DELIVERY = '납품일 초과'
+ALERT_COLS = ['No.', '항목 (Item)', '구분 (Type)', '단계 (Phase)', '계획 (Plan)', '실적/기준 (Actual/Target)',
+              '지연 (일)', '단축 제안 (Crash Plan)', '단축 비용 (Cost)', '미해소 (일)']
+
+
+def to_date(value):
+    # Contract delivery date (ensure date object)
+    if isinstance(value, pd.Timestamp):
+        return value.date()
+    elif isinstance(value, date):
+        return value
+    return pd.to_datetime(value).date()
+
+
+def crash_limits_frame(limits=CRASH_LIMITS):
+    # 화면 편집용 표 (단계, 최소 기간, 1일 비용)
+    return pd.DataFrame([
+        {'단계 (Phase)': phase, '최소 기간 (일)': v['min_days'], '1일 단축 비용': v['cost_per_day']}
+        for phase, v in limits.items()
+    ])
+
+
+def crash_limits_from_frame(frame):
+    limits = {}
+    for phase, min_days, cost in frame[['단계 (Phase)', '최소 기간 (일)', '1일 단축 비용']].itertuples(index=False):
+        min_days, cost = pd.to_numeric(pd.Series([min_days, cost]), errors='coerce').fillna(0)
+        limits[phase] = {'min_days': max(0, int(min_days)), 'cost_per_day': max(0.0, float(cost))}
+    return limits
+
+
+def _days(values):
+    return values.astype('datetime64[D]')
+
+
+def phase_slippage(df, phases, calendar=None):
+    # 단계별 지연 일수 (항목 x 단계, 지연 없음/날짜 없음은 0). 반환: (지연 일수, 계획 종료일, 실적 종료일)
+    plan_end = np.stack([_days(date_array(df, p[2])) for p in phases], axis=1)
+    actual_end = np.stack([_days(date_array(df, p[5])) for p in phases], axis=1)
+    slip = day_count(plan_end, actual_end, calendar)
+    return np.maximum(slip, 0), plan_end, actual_end
+
+
+def delivery_overrun(df, contract_delivery_date, calendar=None):
+    # 납품 계획 종료일의 계약 납품일 초과 일수 (초과 없음/날짜 없음은 0)
+    plan_end = _days(date_array(df, '납품 계획 종료'))
+    target = np.datetime64(to_date(contract_delivery_date), 'D')
+    return np.maximum(day_count(target, plan_end, calendar), 0)
+
+
+def crash_plan(df, phases, overrun, limits=CRASH_LIMITS, calendar=None):
+    # 최소 비용 단축안. 반환: (단계별 단축 일수 [항목 x 단계], 현재 기간 [항목 x 단계], 비용, 미해소 일수)
+    # 단계는 순차(앞 단계 종료 후 다음 단계 시작)이므로 어느 단계를 x일 줄여도 납품일이 x일 당겨진다.
+    # 비용이 기간에 비례하면 1일 비용이 싼 단계부터 최소 기간까지 채우는 것이 최적 (한 제약 LP).
+    # 이미 종료(실적 종료일)된 단계는 단축 대상에서 제외.
+    n = len(df)
+    duration = np.zeros((n, len(phases)), dtype='int64')
+    slack = np.zeros((n, len(phases)), dtype='int64')
+    cost = np.zeros(len(phases))
+    for k, (phase_name, p_start, p_end, _, _, a_end) in enumerate(phases):
+        p_s, p_e = _days(date_array(df, p_start)), _days(date_array(df, p_end))
+        ok = ~np.isnat(p_s) & ~np.isnat(p_e)
+        duration[:, k] = np.maximum(day_count(p_s, p_e, calendar), 0)
+        limit = limits.get(phase_name)
+        if limit is None:
+            continue
+        open_phase = ok & np.isnat(date_array(df, a_end))
+        slack[open_phase, k] = np.maximum(duration[open_phase, k] - limit['min_days'], 0)
+        cost[k] = limit['cost_per_day']
+
+    order = np.argsort(cost, kind='stable')
+    capacity = slack[:, order]
+    before = np.cumsum(capacity, axis=1) - capacity
+    take = np.clip(overrun[:, None] - before, 0, capacity)
+    reduction = np.zeros_like(take)
+    reduction[:, order] = take
+    return reduction, duration, reduction @ cost, overrun - reduction.sum(axis=1)
+
+
+def _crash_text(phases, reduction, duration, remaining):
+    # 항목별 제안 문장 (단축이 있는 단계만, 비용 순서가 아닌 단계 순서)
+    texts = []
+    for red, dur, left in zip(reduction, duration, remaining):
+        parts = [f"{phases[k][0].split(' (')[0]} 기간 {red[k]}일 단축 (현재 {dur[k]}일 -> 권장 {dur[k] - red[k]}일)"
+                 for k in np.flatnonzero(red)]
+        if left > 0:
+            parts.append(f"최소 기간으로도 {left}일 부족")
+        texts.append(", ".join(parts))
+    return texts
+
+
+def build_delay_table(df, phases, contract_delivery_date, limits=CRASH_LIMITS, calendar=None):
+    # 지연 알림 표: 항목 순서대로 단계 지연 행, 그 다음 납품일 초과 행 (ALERT_COLS)
+    names = df['항목 (Item)'].to_numpy(dtype=object) if '항목 (Item)' in df.columns else np.full(len(df), None, dtype=object)
+    slip, plan_end, actual_end = phase_slippage(df, phases, calendar)
+    rows, cols = np.nonzero(slip)
+    phase_part = pd.DataFrame({
+        'No.': rows + 1,
+        '항목 (Item)': names[rows],
+        '구분 (Type)': ALERT_PHASE,
+        '단계 (Phase)': np.array([p[0] for p in phases], dtype=object)[cols],
+        '계획 (Plan)': plan_end[rows, cols],
+        '실적/기준 (Actual/Target)': actual_end[rows, cols],
+        '지연 (일)': slip[rows, cols],
+        '_order': 0,
+    })
+
+    overrun = delivery_overrun(df, contract_delivery_date, calendar)
+    over = np.flatnonzero(overrun)
+    reduction, duration, cost, remaining = crash_plan(df.iloc[over], phases, overrun[over], limits, calendar)
+    delivery_part = pd.DataFrame({
+        'No.': over + 1,
+        '항목 (Item)': names[over],
+        '구분 (Type)': ALERT_DELIVERY,
+        '단계 (Phase)': '납품 (Delivery)',
+        '계획 (Plan)': _days(date_array(df, '납품 계획 종료'))[over],
+        '실적/기준 (Actual/Target)': np.datetime64(to_date(contract_delivery_date), 'D'),
+        '지연 (일)': overrun[over],
+        '단축 제안 (Crash Plan)': _crash_text(phases, reduction, duration, remaining),
+        '단축 비용 (Cost)': cost,
+        '미해소 (일)': remaining,
+        '_order': 1,
+    })
+
+    table = pd.concat([phase_part, delivery_part], ignore_index=True) if len(delivery_part) else phase_part
+    table = table.sort_values(['No.', '_order'], kind='stable').drop(columns='_order').reset_index(drop=True)
+    for col in ['계획 (Plan)', '실적/기준 (Actual/Target)']:
+        table[col] = pd.to_datetime(table[col]).dt.date
+    return table.reindex(columns=ALERT_COLS)
+
+
+def alert_messages(table):
+    # 알림 표 -> 보고서용 문장 목록
+    messages = []
+    for row in table.itertuples(index=False):
+        item, kind, phase, plan, actual, days, crash = row[1], row[2], row[3], row[4], row[5], row[6], row[7]
+        if kind == ALERT_PHASE:
+            messages.append(f"⚠️ **{item}** - {phase}: {days}일 지연 (계획: {plan}, 실적: {actual})")
+        else:
+            msg = f"🚨 **{item}** - 계약 납품일({actual}) {days}일 초과! (계획: {plan})"
+            if isinstance(crash, str) and crash:
+                msg += " 👉 [제안] " + crash
+            messages.append(msg)
+    return messages
@@ -0,0 +1,112 @@
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+# 단계별 계측 (Stage Diagnostics)
+# 화면 실행(rerun) 한 번의 단계별 소요 시간, 처리 행 수, 생성 바이트, 최대 메모리를 기록한다.
+# run 이 None 이면 아무것도 재지 않는다 (진단 패널을 끈 경우 오버헤드 없음).
+# 메모리는 trace_memory=True 일 때만 tracemalloc 으로 잰다 (켜면 전체 실행이 느려짐, report.measured 와 같은 이유).
+# 단계는 중첩하지 않는다 (tracemalloc 최대값을 단계마다 초기화하므로).
+# tracemalloc 은 프로세스 전체 상태이고 Streamlit 세션은 같은 프로세스의 스레드에서 돈다. 그래서 메모리를 재는 실행 수를 세어
+# 첫 실행이 켜고(이미 켜져 있으면 그대로) 마지막 실행이 finish_run 에서 끈다 (직접 켠 경우만). 추적을 끈 실행은 건드리지 않는다.
+# 최근 실행 기록(rolling history)은 호출 측(session_state)의 list 에 두고 JSON 으로 내보낸다.
+
+HISTORY_SIZE = 30
+STAGE_COLS = ['단계 (Stage)', '시간 (ms)', '행 (Rows)', '바이트 (Bytes)', '최대 메모리 (MB)']
+_trace_lock = threading.Lock()
+_trace = {'users': 0, 'started': False}  # 메모리를 재는 진행 중 실행 수, 이 모듈이 tracemalloc 을 켰는지
+
+
+def _acquire_trace():
+    with _trace_lock:
+        _trace['users'] += 1
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _trace['started'] = True
+
+
+def _release_trace():
+    with _trace_lock:
+        _trace['users'] -= 1
+        if _trace['users'] == 0 and _trace['started']:
+            tracemalloc.stop()
+            _trace['started'] = False
+
+
+def new_run(label='', trace_memory=False, enabled=True):
+    # 실행 기록 시작 (enabled=False 면 None). trace_memory 면 tracemalloc 을 켠다 (finish_run 에서 정리)
+    if not enabled:
+        return None
+    if trace_memory:
+        _acquire_trace()
+    return {
+        'started': datetime.now().isoformat(timespec='seconds'),
+        'label': label,
+        'trace_memory': trace_memory,
+        'stages': [],
+        '_t0': time.perf_counter(),
+        '_traced': trace_memory,
+    }
+
+
+@contextmanager
+def stage(run, name, rows=None):
+    # with stage(run, '엑셀 저장', len(df)) as s: data = ...; s['bytes'] = len(data)
+    entry = {'stage': name, 'seconds': 0.0, 'rows': rows, 'bytes': None, 'peak_mb': None}
+    tracing = run is not None and run['trace_memory'] and tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    try:
+        yield entry
+    finally:
+        entry['seconds'] = time.perf_counter() - started
+        if run is not None:
+            if tracing:
+                entry['peak_mb'] = (tracemalloc.get_traced_memory()[1] - base) / 1024 ** 2
+            run['stages'].append(entry)
+
+
+def finish_run(run, history, size=HISTORY_SIZE):
+    # 전체 시간 기록 후 history 에 추가 (최근 size 개만 유지). st.rerun() 직전에도 호출해 중간 실행을 남긴다
+    if run is None or '_t0' not in run:
+        return run
+    run['total_seconds'] = time.perf_counter() - run.pop('_t0')
+    if run.pop('_traced'):
+        _release_trace()
+    history.append(run)
+    del history[:-size]
+    return run
+
+
+def stage_frame(run):
+    # 한 실행의 단계 표 (STAGE_COLS)
+    stages = run['stages'] if run else []
+    return pd.DataFrame({
+        STAGE_COLS[0]: [s['stage'] for s in stages],
+        STAGE_COLS[1]: [s['seconds'] * 1000 for s in stages],
+        STAGE_COLS[2]: pd.array([s['rows'] for s in stages], dtype='Int64'),
+        STAGE_COLS[3]: pd.array([s['bytes'] for s in stages], dtype='Int64'),
+        STAGE_COLS[4]: pd.array([s['peak_mb'] for s in stages], dtype='Float64'),
+    })
+
+
+def history_frame(history):
+    # 실행별 한 행: 시작 시각, 전체 시간, 단계별 시간(ms). 같은 단계가 여러 번이면 합계
+    rows = []
+    for run in history:
+        row = {'시작 (Started)': run['started'], '구분 (Label)': run['label'], '전체 (ms)': run.get('total_seconds', 0.0) * 1000}
+        for s in run['stages']:
+            row[s['stage']] = row.get(s['stage'], 0.0) + s['seconds'] * 1000
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def history_json(history):
+    return json.dumps(history, ensure_ascii=False, indent=1, default=str)
@@ -0,0 +1,219 @@
+import io
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+
+from progress_engine import date_array
+from schedule_model import PHASE_COLORS
+from xlsx_stream import EXCEL_EPOCH, STYLE_DATE, STYLE_HEADER, WORKSHEET_OPEN, column_letter, text_cell, write_rows, write_xlsx
+
+# 엑셀 간트 내보내기 (Excel Gantt Export)
+# 'Sample_엑셀 간트차트 자동화 양식' 처럼 엑셀 안에서 보는 간트 시트를 만든다.
+# 항목마다 계획/실적 2행, 단계별 시작/종료 날짜 컬럼 + 일/주 단위 날짜 격자.
+# 격자 셀은 하나도 쓰지 않고 막대/Today/납품일 표시는 전부 조건부 서식 규칙(범위 단위)으로 처리하므로
+# 파일 크기와 작성 시간은 항목 수 x 단계 수에만 비례한다 (격자 크기와 무관). 행은 xlsx_stream 으로 스트리밍 기록.
+
+MAX_DAY_BUCKETS = 400   # 기간이 이보다 길면 주 단위 격자
+MAX_BUCKETS = 2000
+TITLE_ROW = 1
+HEADER_ROW = 2
+FIRST_DATA_ROW = 3
+AS_OF_CELL = '$D$1'
+DELIVERY_CELL = '$F$1'
+PLAN_LABEL = '계획'
+ACTUAL_LABEL = '실적'
+
+# cellXfs 인덱스: 0~2 는 xlsx_stream.STYLES 와 동일 (같은 _cells 코드 사용), 3 격자 날짜 헤더, 4 제목
+STYLE_BUCKET = 3
+STYLE_TITLE = 4
+# dxfs 인덱스: 0 Today 선, 1 계약 납품일 선, 2 Today 헤더, 3 + 2k 단계 k 계획, 4 + 2k 단계 k 실적
+DXF_TODAY, DXF_DELIVERY, DXF_TODAY_HEADER, DXF_PHASE = 0, 1, 2, 3
+
+GANTT_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<numFmts count="2"><numFmt numFmtId="164" formatCode="YYYY-MM-DD"/><numFmt numFmtId="165" formatCode="MM-DD"/></numFmts>'
+    '<fonts count="3"><font><sz val="11"/><name val="Calibri"/></font><font><b/><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="14"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="5"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1" applyAlignment="1">'
+    '<alignment horizontal="center" textRotation="90"/></xf>'
+    '<xf numFmtId="0" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '<dxfs count="{count}">{dxfs}</dxfs>'
+    '</styleSheet>'
+)
+
+
+def _fill_dxf(rgb, font_rgb=None):
+    font = f'<font><b/><color rgb="FF{font_rgb}"/></font>' if font_rgb else ''
+    return f'<dxf>{font}<fill><patternFill patternType="solid"><fgColor rgb="FF{rgb}"/><bgColor rgb="FF{rgb}"/></patternFill></fill></dxf>'
+
+
+def _border_dxf(rgb, style):
+    side = f'<color rgb="FF{rgb}"/>'
+    return f'<dxf><border><left style="{style}">{side}</left><right style="{style}">{side}</right></border></dxf>'
+
+
+def _shade(color, factor=0.7):
+    # '#A0C4FF' -> 실적 막대용 진한 색 'RRGGBB'
+    rgb = np.array([int(color[i:i + 2], 16) for i in (1, 3, 5)]) * factor
+    return ''.join(f'{int(v):02X}' for v in rgb)
+
+
+def gantt_styles(phases):
+    dxfs = [_border_dxf('FF0000', 'thin'), _border_dxf('C00000', 'dashed'), _fill_dxf('FF0000', 'FFFFFF')]
+    for phase in phases:
+        color = PHASE_COLORS.get(phase[0], '#BBBBBB')
+        dxfs.extend([_fill_dxf(color[1:].upper()), _fill_dxf(_shade(color))])
+    return GANTT_STYLES.format(count=len(dxfs), dxfs=''.join(dxfs))
+
+
+def _day(value):
+    if value is None or pd.isna(value):
+        return np.datetime64('NaT', 'D')
+    return np.datetime64(pd.Timestamp(value).normalize(), 'D')
+
+
+def gantt_frame(df, phases):
+    # 항목마다 계획/실적 2행으로 펼친 표. 반환: (DataFrame, 단계별 (시작, 종료) 컬럼 이름 목록)
+    # 실적 종료가 없는 진행 중 단계는 조건부 서식에서 기준일까지 막대를 그린다
+    names = df['항목 (Item)']
+    valid = (names.notna() & (names.astype(str).str.strip() != '')).to_numpy()
+    view = df[valid]
+    n = len(view)
+
+    columns = {'항목 (Item)': np.repeat(view['항목 (Item)'].astype(str).to_numpy(), 2),
+               '구분 (Type)': np.tile(np.array([PLAN_LABEL, ACTUAL_LABEL], dtype=object), n)}
+    phase_cols = []
+    for phase_name, p_start, p_end, a_start, a_prog, a_end in phases:
+        label = phase_name.split(' (')[0]
+        for suffix, plan_col, actual_col in (('시작', p_start, a_start), ('종료', p_end, a_end)):
+            values = np.empty(2 * n, dtype='datetime64[D]')
+            values[0::2] = date_array(view, plan_col)
+            values[1::2] = date_array(view, actual_col)
+            columns[f'{label} {suffix}'] = values
+        phase_cols.append((f'{label} 시작', f'{label} 종료'))
+    return pd.DataFrame(columns), phase_cols
+
+
+def gantt_buckets(frame, phase_cols, today=None, contract_delivery_date=None, bucket='auto'):
+    # 격자 날짜 (각 칸의 시작일) 와 칸 길이(일). bucket: 'day', 'week', 'auto'
+    values = [frame[c].to_numpy(dtype='datetime64[D]') for pair in phase_cols for c in pair]
+    values.append(np.array([_day(today), _day(contract_delivery_date)], dtype='datetime64[D]'))
+    values = np.concatenate(values)
+    values = values[~np.isnat(values)]
+    if len(values) == 0:
+        return np.array([], dtype='datetime64[D]'), 1
+    d0, d1 = values.min(), values.max()
+    if bucket == 'auto':
+        bucket = 'day' if (d1 - d0).astype(int) + 1 <= MAX_DAY_BUCKETS else 'week'
+    if bucket == 'week':
+        # 월요일 시작 (1970-01-01 은 목요일)
+        d0 = d0 - ((d0.astype('int64') + 3) % 7)
+        step = 7
+    elif bucket == 'day':
+        step = 1
+    else:
+        raise ValueError(f"알 수 없는 격자 단위: {bucket}")
+    starts = np.arange(d0, d1 + 1, step)
+    if len(starts) > MAX_BUCKETS:
+        raise ValueError(f"격자 칸 수 {len(starts)} 가 최대 {MAX_BUCKETS} 를 넘습니다. 주 단위(week)를 사용하세요.")
+    return starts, step
+
+
+def _serial(value):
+    return int((value - EXCEL_EPOCH).astype('int64'))
+
+
+def _rule(sqref, dxf_id, priority, formula):
+    return (f'<conditionalFormatting sqref="{sqref}"><cfRule type="expression" dxfId="{dxf_id}" priority="{priority}">'
+            f'<formula>{escape(formula)}</formula></cfRule></conditionalFormatting>')
+
+
+def gantt_sheet_writer(frame, phase_cols, buckets, step, title, today=None, contract_delivery_date=None):
+    # write_xlsx 용 시트 작성 함수
+    n_fixed = len(frame.columns)
+    first_grid = column_letter(n_fixed)
+    last_grid = column_letter(n_fixed + max(len(buckets), 1) - 1)
+    last_row = max(FIRST_DATA_ROW + len(frame) - 1, FIRST_DATA_ROW)
+    grid = f'{first_grid}{FIRST_DATA_ROW}:{last_grid}{last_row}'
+    g = f'{first_grid}${HEADER_ROW}'  # 격자 칸 시작일 (열 고정 상대 참조)
+    r = FIRST_DATA_ROW
+
+    # 조건부 서식: 기준선(테두리) 먼저, 막대(채우기)는 단계 순서대로
+    rules = [
+        _rule(grid, DXF_TODAY, 1, f'AND({AS_OF_CELL}<>"",{AS_OF_CELL}>={g},{AS_OF_CELL}<{g}+{step})'),
+        _rule(grid, DXF_DELIVERY, 2, f'AND({DELIVERY_CELL}<>"",{DELIVERY_CELL}>={g},{DELIVERY_CELL}<{g}+{step})'),
+        _rule(f'{first_grid}{HEADER_ROW}:{last_grid}{HEADER_ROW}', DXF_TODAY_HEADER, 3,
+              f'AND({AS_OF_CELL}<>"",{AS_OF_CELL}>={g},{AS_OF_CELL}<{g}+{step})'),
+    ]
+    priority = 4
+    for k, (start_col, end_col) in enumerate(phase_cols):
+        s = '$' + column_letter(frame.columns.get_loc(start_col)) + str(r)
+        e = '$' + column_letter(frame.columns.get_loc(end_col)) + str(r)
+        kind = f'$B{r}'
+        rules.append(_rule(grid, DXF_PHASE + 2 * k, priority,
+                           f'AND({kind}="{PLAN_LABEL}",{s}<>"",{e}<>"",{s}<{g}+{step},{e}>={g})'))
+        rules.append(_rule(grid, DXF_PHASE + 2 * k + 1, priority + 1,
+                           f'AND({kind}="{ACTUAL_LABEL}",{s}<>"",{s}<{g}+{step},IF({e}="",{AS_OF_CELL},{e})>={g})'))
+        priority += 2
+
+    def write(stream):
+        stream.write((WORKSHEET_OPEN
+                      + '<sheetViews><sheetView workbookViewId="0"><pane xSplit="2" ySplit="2" topLeftCell="C3" activePane="bottomRight" state="frozen"/>'
+                      '</sheetView></sheetViews>'
+                      f'<cols><col min="1" max="1" width="30" customWidth="1"/><col min="2" max="2" width="8" customWidth="1"/>'
+                      f'<col min="3" max="{n_fixed}" width="11" customWidth="1"/>'
+                      f'<col min="{n_fixed + 1}" max="{n_fixed + max(len(buckets), 1)}" width="{3 if step == 1 else 4.5}" customWidth="1"/></cols>'
+                      '<sheetData>').encode('utf-8'))
+
+        # 1행: 제목, 기준일, 계약 납품일 (조건부 서식이 D1/F1 을 참조)
+        top = [text_cell(f'A{TITLE_ROW}', title, STYLE_TITLE), text_cell(f'C{TITLE_ROW}', '기준일 (As of)', STYLE_HEADER)]
+        as_of = _day(today)
+        if not np.isnat(as_of):
+            top.append(f'<c r="D{TITLE_ROW}" s="{STYLE_DATE}"><v>{_serial(as_of)}</v></c>')
+        top.append(text_cell(f'E{TITLE_ROW}', '계약 납품일', STYLE_HEADER))
+        delivery = _day(contract_delivery_date)
+        if not np.isnat(delivery):
+            top.append(f'<c r="F{TITLE_ROW}" s="{STYLE_DATE}"><v>{_serial(delivery)}</v></c>')
+        stream.write(f'<row r="{TITLE_ROW}" ht="24" customHeight="1">{"".join(top)}</row>'.encode('utf-8'))
+
+        # 2행: 헤더 + 격자 칸 시작일
+        header = [text_cell(f'{column_letter(i)}{HEADER_ROW}', col, STYLE_HEADER) for i, col in enumerate(frame.columns)]
+        serials = (buckets - EXCEL_EPOCH).astype('int64')
+        header.extend(f'<c r="{column_letter(n_fixed + i)}{HEADER_ROW}" s="{STYLE_BUCKET}"><v>{v}</v></c>'
+                      for i, v in enumerate(serials.tolist()))
+        stream.write(f'<row r="{HEADER_ROW}" ht="40" customHeight="1">{"".join(header)}</row>'.encode('utf-8'))
+
+        write_rows(stream, frame, first_row=FIRST_DATA_ROW)
+        stream.write(('</sheetData>' + ''.join(rules) + '</worksheet>').encode('utf-8'))
+
+    return write
+
+
+def write_gantt_excel(target, df, phases, project_name, today=None, contract_delivery_date=None, bucket='auto'):
+    # 엑셀 간트 파일 (Gantt + ProjectInfo 시트). target: 파일 경로 또는 file-like
+    today = pd.Timestamp.now() if today is None else today
+    frame, phase_cols = gantt_frame(df, phases)
+    buckets, step = gantt_buckets(frame, phase_cols, today, contract_delivery_date, bucket)
+    title = f"{project_name} 공정 간트 ({'일' if step == 1 else '주'} 단위)"
+    meta = pd.DataFrame({
+        'ProjectName': [project_name],
+        'AsOf': [pd.Timestamp(_day(today))],
+        'DeliveryDate': [pd.Timestamp(contract_delivery_date) if contract_delivery_date is not None else pd.NaT],
+    })
+    write_xlsx(target, [("Gantt", gantt_sheet_writer(frame, phase_cols, buckets, step, title, today, contract_delivery_date)),
+                        ("ProjectInfo", meta)], styles=gantt_styles(phases))
+
+
+def gantt_excel_bytes(df, phases, project_name, today=None, contract_delivery_date=None, bucket='auto'):
+    output = io.BytesIO()
+    write_gantt_excel(output, df, phases, project_name, today, contract_delivery_date, bucket)
+    return output.getvalue()
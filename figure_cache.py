@@ -0,0 +1,70 @@
+import hashlib
+import uuid
+from collections import OrderedDict
+
+import pandas as pd
+
+# 차트 캐시 (Figure Cache)
+# 일정 데이터 지문 + 기준일 + 계약 납품일(+ 차트 종류/행 창)을 키로 만든 Figure 와 직렬화 JSON 을 저장한다.
+# 화면 차트, 보고서, 내보내기가 같은 Figure / 같은 JSON 을 사용한다.
+# 저장소(store)는 st.session_state 에 두므로 세션이 끝나면 함께 사라진다. 세션 안에서는 최근 FIGURE_CACHE_MAX 개만 유지.
+
+FIGURE_CACHE_MAX = 4
+
+
+def frame_fingerprint(df, columns=None):
+    # DataFrame 내용 지문 (컬럼 이름 + 값 해시, 행 순서 포함)
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
+    h = hashlib.sha1('\x1f'.join(map(str, df.columns)).encode('utf-8'))
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def figure_key(fingerprint, as_of, contract_delivery_date, *extra):
+    return (fingerprint, str(pd.Timestamp(as_of).date()), str(contract_delivery_date)) + extra
+
+
+def cached_figure(store, key, build):
+    # 반환: {'fig': Figure 또는 None, 'json': 직렬화 문자열(처음 요청 시 생성)}
+    if key in store:
+        store.move_to_end(key)
+        return store[key]
+    entry = {'fig': build(), 'json': None}
+    store[key] = entry
+    while len(store) > FIGURE_CACHE_MAX:
+        store.popitem(last=False)
+    return entry
+
+
+def new_store():
+    return OrderedDict()
+
+
+def figure_json(entry):
+    if entry['json'] is None and entry['fig'] is not None:
+        entry['json'] = entry['fig'].to_json()
+    return entry['json']
+
+
+def figure_html(entry, include_plotlyjs='cdn', clear_title=False):
+    # fig.to_html(full_html=False) 와 같은 div 를 캐시된 JSON 으로 생성 (다시 직렬화하지 않음)
+    fig_json = figure_json(entry)
+    if fig_json is None:
+        return None
+    div_id = str(uuid.uuid4())
+    script = ''
+    if include_plotlyjs == 'cdn':
+        from plotly.offline import get_plotlyjs_version
+        script = f'<script charset="utf-8" src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>'
+    title_js = 'fig.layout.title = {text: ""};' if clear_title else ''
+    return f"""<div style="height:100%; width:100%;">{script}
+    <div id="{div_id}" class="plotly-graph-div" style="height:100%; width:100%;"></div>
+    <script>
+        (function() {{
+            var fig = {fig_json};
+            {title_js}
+            Plotly.newPlot("{div_id}", fig.data, fig.layout, {{"responsive": true}});
+        }})();
+    </script>
+</div>"""
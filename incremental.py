@@ -0,0 +1,141 @@
+import numpy as np
+import pandas as pd
+
+from delay_analysis import CRASH_LIMITS, build_delay_table
+from diagnostics import stage
+from progress_engine import PROGRESS_COLS, compute_progress
+
+# 증분 재계산 (Incremental Recomputation)
+# data_editor 의 변경 내역(edited/added/deleted rows)으로 영향받은 행만 다시 계산하고,
+# 나머지 행은 캐시된 항목별 결과(진도율, 지연 알림 행)를 재사용한다.
+# 금액/가중치는 캐시하지 않고 매번 현재 데이터의 컬럼 전체를 정리한다 (적용 후 데이터에 계산된 가중치가 저장되므로
+# 캐시 값과 달라질 수 있음). 금액 비율/균등 가중치는 행 전체에 걸린 값이라 정리 뒤 매번 다시 구한다.
+# 지연 알림은 행별로 독립이므로 유지된 행의 알림은 번호(No.)만 새 위치로 옮기고, 변경된 행만 다시 만든다.
+# (계약 납품일/단축 한계/달력이 바뀌면 알림은 전체 재계산)
+# 캐시는 data_editor 에 입력된 데이터(st.session_state.data) 기준이며, 데이터가 통째로
+# 바뀌는 경우(파일 업로드, Auto Plan)에는 호출 측에서 캐시를 None 으로 초기화한다.
+
+
+def clean_numeric(series, strip_percent=True):
+    # '1,000' / '50%' 같은 입력을 숫자로 변환 (해석 불가 시 0)
+    if pd.api.types.is_float_dtype(series):
+        return series.fillna(0).to_numpy(dtype=float)
+    s = series.astype(str)
+    if strip_percent:
+        s = s.str.replace('%', '')
+    s = s.str.replace(',', '').str.strip()
+    return pd.to_numeric(s, errors='coerce').fillna(0).to_numpy(dtype=float)
+
+
+def editor_has_changes(editor_state):
+    # 아직 입력 데이터에 반영되지 않은 편집 내역이 있는지
+    if not editor_state:
+        return False
+    return bool(editor_state.get('edited_rows') or editor_state.get('added_rows') or editor_state.get('deleted_rows'))
+
+
+def editor_delta_rows(editor_state, n_base):
+    # 편집기 변경 내역 -> (유지된 기존 행 위치, 다시 계산할 새 행 위치, 추가된 행 수)
+    deleted = {int(p) for p in editor_state.get('deleted_rows', [])}
+    kept = np.array([p for p in range(n_base) if p not in deleted], dtype=int)
+    new_pos = {p: i for i, p in enumerate(kept)}
+
+    dirty = {new_pos[int(p)] for p in editor_state.get('edited_rows', {}) if int(p) in new_pos}
+    n_added = len(editor_state.get('added_rows', []))
+    dirty.update(range(len(kept), len(kept) + n_added))
+    return kept, np.array(sorted(dirty), dtype=int), n_added
+
+
+def _alert_key(phases, contract_delivery_date, crash_limits, calendar):
+    # 알림 캐시를 재사용할 수 있는 조건 (행 데이터 외 입력)
+    limits = tuple(sorted((phase, tuple(sorted(v.items()))) for phase, v in crash_limits.items()))
+    cal = None if calendar is None else (calendar.weekmask.tobytes(), calendar.holidays.tobytes())
+    return tuple(phases), str(contract_delivery_date), limits, cal
+
+
+def _merge_alerts(cached, kept, dirty, n_old, fresh):
+    # 유지된 행의 캐시 알림(번호를 새 위치로) + 변경 행의 새 알림(부분 표 번호 -> 변경 행 위치), 항목 순서 정렬
+    new_pos = np.full(n_old, -1, dtype=int)
+    new_pos[kept] = np.arange(len(kept))
+    moved = new_pos[cached['No.'].to_numpy(dtype=int) - 1]
+    keep = (moved >= 0) & ~np.isin(moved, dirty)
+    cached = cached[keep].assign(**{'No.': moved[keep] + 1})
+    fresh = fresh.assign(**{'No.': dirty[fresh['No.'].to_numpy(dtype=int) - 1] + 1})
+    parts = [part for part in (cached, fresh) if len(part)]
+    if not parts:
+        return cached.reset_index(drop=True)
+    table = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+    return table.sort_values('No.', kind='stable').reset_index(drop=True)
+
+
+def update_derived(cache, edited_df, editor_state, phases, first_day_of_month, last_day_of_month, contract_delivery_date, crash_limits=CRASH_LIMITS, calendar=None, diag=None):
+    # edited_df 의 금액/가중치/진도율 컬럼을 갱신하고 (새 캐시, 전체 계획, 전체 실적, 지연 알림 표) 반환
+    # diag(diagnostics.new_run)를 주면 숫자 정리/진도 계산/지연 분석 단계 시간을 기록
+    n = len(edited_df)
+    key = (pd.Timestamp(first_day_of_month), pd.Timestamp(last_day_of_month))
+
+    alert_key = _alert_key(phases, contract_delivery_date, crash_limits, calendar)
+
+    delta = None
+    if cache is not None and cache['key'] == key and editor_state is not None:
+        kept, dirty, n_added = editor_delta_rows(editor_state, cache['n'])
+        if len(kept) + n_added == n:
+            delta = (kept, dirty, n_added)
+
+    with stage(diag, '숫자 정리 (Numeric)', n):
+        amount = clean_numeric(edited_df['금액 (Amount)'], strip_percent=False)
+        weight = clean_numeric(edited_df['가중치 (Weight)'])
+
+    if delta is None:
+        # 전체 계산
+        with stage(diag, '진도 계산 (Progress)', n):
+            progress_df = compute_progress(edited_df, phases, first_day_of_month, last_day_of_month)
+        progress = {col: progress_df[col].to_numpy(dtype=float) for col in PROGRESS_COLS}
+    else:
+        # 변경된 행만 계산
+        kept, dirty, n_added = delta
+        pad = lambda arr: np.concatenate([arr[kept], np.zeros(n_added)])
+        progress = {col: pad(cache['progress'][col]) for col in PROGRESS_COLS}
+
+        if len(dirty):
+            sub = edited_df.iloc[dirty]
+            with stage(diag, '진도 계산 (Progress)', len(dirty)):
+                sub_progress = compute_progress(sub, phases, first_day_of_month, last_day_of_month)
+            for col in PROGRESS_COLS:
+                progress[col][dirty] = sub_progress[col].to_numpy(dtype=float)
+
+    # Logic: Amount vs Weight
+    total_amount = amount.sum()
+    if total_amount > 0:
+        # Case A: Amount exists -> Calculate Weight % based on Amount
+        weight = amount / total_amount * 100
+    elif weight.sum() == 0 and n > 0:
+        # Case B: Amount is 0 and all weights are 0 -> Apply Equal Weights
+        weight = np.full(n, 100.0 / n)
+
+    edited_df['금액 (Amount)'] = amount
+    edited_df['가중치 (Weight)'] = weight
+    for col in PROGRESS_COLS:
+        edited_df[col] = progress[col]
+    edited_df['월간 진도 (Monthly Progress)'] = progress['금월 실적 (Actual Curr)'] - progress['전월 실적 (Actual Prev)']
+
+    # 전체 공정률: 캐시된 항목별 기여도(가중치 x 진도율)의 합
+    total_weight = weight.sum()
+    if total_weight > 0:
+        overall_plan = float(np.dot(progress['금월 계획 (Plan Curr)'], weight) / total_weight)
+        overall_actual = float(np.dot(progress['금월 실적 (Actual Curr)'], weight) / total_weight)
+    else:
+        overall_plan = 0; overall_actual = 0
+
+    if delta is not None and cache.get('alert_key') == alert_key:
+        kept, dirty, _ = delta
+        with stage(diag, '지연 분석 (Delay)', len(dirty)):
+            fresh = build_delay_table(edited_df.iloc[dirty], phases, contract_delivery_date, crash_limits, calendar)
+            delay_alerts = _merge_alerts(cache['alerts'], kept, dirty, cache['n'], fresh)
+    else:
+        with stage(diag, '지연 분석 (Delay)', n):
+            delay_alerts = build_delay_table(edited_df, phases, contract_delivery_date, crash_limits, calendar)
+
+    new_cache = {'key': key, 'n': n, 'progress': progress,
+                 'alert_key': alert_key, 'alerts': delay_alerts}
+    return new_cache, overall_plan, overall_actual, delay_alerts
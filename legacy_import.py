@@ -0,0 +1,288 @@
+import io
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from schedule_model import normalize_schedule
+
+# 기존 월간진도보고서(.xlsx) 스트리밍 가져오기 (Legacy Workbook Import)
+# 워크북을 한 번만 열고 선택한 시트의 XML 만 행 단위로 읽는다.
+# openpyxl 은 read_only 모드에서도 styles.xml 전체(수만 개의 셀 스타일)를 읽기 때문에,
+# 날짜 판별에 필요한 cellXfs 의 numFmtId 만 읽고 나머지 스타일/다른 시트는 건드리지 않는다.
+
+NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+HEADER_SCAN_ROWS = 15
+CHUNK_ROWS = 20000
+
+# 날짜 내장 서식 (Excel built-in / 동아시아 로캘)
+BUILTIN_DATE_FORMATS = set(range(14, 23)) | set(range(27, 37)) | {45, 46, 47} | set(range(50, 59))
+EXCEL_EPOCH = datetime(1899, 12, 30)
+
+# 항목/가중치 컬럼 추정 (앞쪽이 우선)
+ITEM_HEADERS = ['항목', 'item name', 'item', 'part name', 'description']
+WEIGHT_HEADERS = ['가중치', 'weight factor']
+
+
+def _open(source):
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    return zipfile.ZipFile(source)
+
+
+def _sheet_paths(zf):
+    # 시트 이름 -> 워크시트 XML 경로 (workbook 순서 유지)
+    rels = {}
+    with zf.open('xl/_rels/workbook.xml.rels') as f:
+        for _, el in ET.iterparse(f):
+            if el.tag == PKG_REL_NS + 'Relationship':
+                target = el.get('Target').lstrip('/')
+                rels[el.get('Id')] = target if target.startswith('xl/') else 'xl/' + target
+    paths = {}
+    with zf.open('xl/workbook.xml') as f:
+        for _, el in ET.iterparse(f):
+            if el.tag == NS + 'sheet':
+                paths[el.get('name')] = rels.get(el.get(REL_NS + 'id'))
+            elif el.tag == NS + 'sheets':
+                break
+    return paths
+
+
+def _shared_strings(zf):
+    if 'xl/sharedStrings.xml' not in zf.namelist():
+        return []
+    strings = []
+    with zf.open('xl/sharedStrings.xml') as f:
+        for _, el in ET.iterparse(f):
+            if el.tag == NS + 'si':
+                strings.append(''.join(t.text or '' for t in el.iter(NS + 't')))
+                el.clear()
+    return strings
+
+
+def _is_date_format(code):
+    code = re.sub(r'"[^"]*"|\[[^\]]*\]|\\.', '', code or '')
+    return bool(re.search(r'[dmyhs]', code, re.IGNORECASE))
+
+
+def _xml_section(raw, tag):
+    # styles.xml 에서 <tag ...>...</tag> 구간만 잘라 파싱 (없으면 None)
+    m = re.search(rb'<(?:(\w+):)?' + tag + rb'[\s>/]', raw)
+    if not m:
+        return None
+    prefix = m.group(1)
+    close = b'</' + (prefix + b':' if prefix else b'') + tag + b'>'
+    end = raw.find(close, m.start())
+    if end < 0:
+        return None
+    # 잘라낸 구간은 루트의 네임스페이스 선언이 없으므로 감싸서 선언해 준다
+    ns = NS[1:-1].encode()
+    declare = b' xmlns:' + prefix + b'="' + ns + b'"' if prefix else b''
+    wrapper = b'<root xmlns="' + ns + b'"' + declare + b'>' + raw[m.start():end + len(close)] + b'</root>'
+    return ET.fromstring(wrapper)[0]
+
+
+def _date_styles(zf):
+    # cellXfs 인덱스 중 날짜 서식인 것. 수 MB 짜리 셀 스타일(cellStyleXfs/cellStyles)은 파싱하지 않는다
+    if 'xl/styles.xml' not in zf.namelist():
+        return set()
+    raw = zf.read('xl/styles.xml')
+    custom_dates = set()
+    num_fmts = _xml_section(raw, b'numFmts')
+    if num_fmts is not None:
+        for el in num_fmts.iter(NS + 'numFmt'):
+            if _is_date_format(el.get('formatCode')):
+                custom_dates.add(int(el.get('numFmtId')))
+    date_styles = set()
+    cell_xfs = _xml_section(raw, b'cellXfs')
+    if cell_xfs is not None:
+        for i, el in enumerate(cell_xfs.findall(NS + 'xf')):
+            fmt_id = int(el.get('numFmtId', 0))
+            if fmt_id in BUILTIN_DATE_FORMATS or fmt_id in custom_dates:
+                date_styles.add(i)
+    return date_styles
+
+
+_col_cache = {}
+
+
+def _col_index(ref):
+    # 'AB12' -> 27
+    letters = ref.rstrip('0123456789')
+    idx = _col_cache.get(letters)
+    if idx is None:
+        idx = 0
+        for ch in letters:
+            idx = idx * 26 + (ord(ch.upper()) - 64)
+        idx = _col_cache[letters] = idx - 1
+    return idx
+
+
+def _iter_rows(zf, path, strings, date_styles):
+    # 시트 XML 을 행 단위로 읽어 값 리스트를 생성 (처리한 행은 즉시 해제)
+    c_tag, v_tag, t_tag, row_tag = NS + 'c', NS + 'v', NS + 't', NS + 'row'
+    with zf.open(path) as f:
+        for _, el in ET.iterparse(f):
+            if el.tag != row_tag:
+                continue
+            row = []
+            for c in el.iter(c_tag):
+                t = c.get('t', 'n')
+                value = None
+                if t == 'inlineStr':
+                    value = ''.join(x.text or '' for x in c.iter(t_tag))
+                else:
+                    v = c.find(v_tag)
+                    text = v.text if v is not None else None
+                    if text is not None:
+                        if t == 's':
+                            value = strings[int(text)]
+                        elif t in ('str', 'e'):
+                            value = text
+                        elif t == 'b':
+                            value = text == '1'
+                        else:
+                            num = float(text)
+                            if int(c.get('s', 0)) in date_styles:
+                                value = EXCEL_EPOCH + timedelta(days=num)
+                            else:
+                                value = int(num) if num.is_integer() else num
+                ref = c.get('r')
+                col = _col_index(ref) if ref else len(row)
+                if col >= len(row):
+                    row.extend([None] * (col - len(row) + 1))
+                row[col] = value
+            yield row
+            el.clear()
+
+
+def list_sheets(source):
+    with _open(source) as zf:
+        return list(_sheet_paths(zf).keys())
+
+
+def _is_label(value):
+    return isinstance(value, str) and value.strip() != '' and not re.fullmatch(r'[-\d.,\s%]*', value)
+
+
+def detect_header_row(rows):
+    # 상단 행 중 문자열(라벨) 셀이 가장 많은 행 (0-based). 라벨이 2개 미만이면 0
+    best, best_score = 0, 1
+    for i, row in enumerate(rows):
+        score = sum(1 for v in row if _is_label(v))
+        if score > best_score:
+            best, best_score = i, score
+    return best
+
+
+def _is_sub_header(row):
+    # 헤더 바로 아래 'LAST MONTH / THIS MONTH' 같은 하위 헤더 행 (라벨만 있고 숫자/날짜 없음)
+    values = [v for v in row if v is not None and str(v).strip() != '']
+    return len(values) >= 2 and all(isinstance(v, str) for v in values) and (not row or row[0] is None)
+
+
+def _header_names(top, sub):
+    names = []
+    last_top = ''
+    width = max(len(top), len(sub or []))
+    for i in range(width):
+        t = top[i] if i < len(top) else None
+        s = sub[i] if sub and i < len(sub) else None
+        t = ' '.join(str(t).split()) if t is not None else ''
+        s = ' '.join(str(s).split()) if s is not None else ''
+        if t:
+            last_top = t
+        elif s:
+            t = last_top  # 병합 셀: 상위 헤더를 이어받음
+        name = f"{t} {s}".strip() or f"Column {i + 1}"
+        base, k = name, 2
+        while name in names:
+            name = f"{base} ({k})"
+            k += 1
+        names.append(name)
+    return names
+
+
+def read_sheet(source, sheet_name, header_row=None, max_rows=None):
+    # 반환: (DataFrame, 헤더 행 번호 1-based). header_row 는 1-based, None 이면 자동 감지
+    with _open(source) as zf:
+        paths = _sheet_paths(zf)
+        if sheet_name not in paths:
+            raise ValueError(f"시트를 찾을 수 없습니다: {sheet_name}")
+        rows = _iter_rows(zf, paths[sheet_name], _shared_strings(zf), _date_styles(zf))
+
+        head = []
+        for row in rows:
+            head.append(row)
+            if len(head) >= HEADER_SCAN_ROWS:
+                break
+        h = detect_header_row(head) if header_row is None else max(0, header_row - 1)
+        sub = head[h + 1] if h + 1 < len(head) and _is_sub_header(head[h + 1]) else None
+        columns = _header_names(head[h] if h < len(head) else [], sub)
+        data_start = h + (2 if sub else 1)
+
+        chunks, chunk, count = [], [], 0
+
+        def flush():
+            if chunk:
+                width = len(columns)
+                chunks.append(pd.DataFrame([r[:width] + [None] * (width - len(r)) for r in chunk], columns=columns))
+                chunk.clear()
+
+        def consume(row):
+            nonlocal count
+            if any(v is not None and str(v).strip() != '' for v in row):
+                if len(row) > len(columns):
+                    columns.extend(f"Column {i + 1}" for i in range(len(columns), len(row)))
+                chunk.append(row)
+                count += 1
+                if len(chunk) >= CHUNK_ROWS:
+                    flush()
+
+        for row in head[data_start:]:
+            if max_rows is not None and count >= max_rows:
+                break
+            consume(row)
+        for row in rows:
+            if max_rows is not None and count >= max_rows:
+                break
+            consume(row)
+        flush()
+
+    if not chunks:
+        return pd.DataFrame(columns=columns), h + 1
+    frame = pd.concat([c.reindex(columns=columns) for c in chunks], ignore_index=True)
+    return frame.infer_objects(), h + 1
+
+
+def _find_column(columns, candidates):
+    lowered = {c: c.lower() for c in columns}
+    for cand in candidates:
+        for col, low in lowered.items():
+            if low.startswith(cand):
+                return col
+    return None
+
+
+def to_schedule(sheet_df):
+    # 가져온 시트 -> 일정 DataFrame (항목/가중치 컬럼만 매핑, 항목명이 없는 행은 제외)
+    item_col = _find_column(sheet_df.columns, ITEM_HEADERS)
+    if item_col is None:
+        raise ValueError("항목(Item/Description) 컬럼을 찾을 수 없습니다. 헤더 행 번호를 확인하세요.")
+    names = sheet_df[item_col]
+    mask = names.notna() & (names.astype(str).str.strip() != '')
+    out = pd.DataFrame({'항목 (Item)': names[mask].astype(str).str.strip().to_numpy()})
+
+    weight_col = _find_column(sheet_df.columns, WEIGHT_HEADERS)
+    if weight_col is not None:
+        weights = pd.to_numeric(sheet_df.loc[mask, weight_col], errors='coerce').to_numpy()
+        # 0~1 비율로 기록된 가중치는 % 로 환산
+        if len(weights) and pd.Series(weights).abs().max() <= 1.0:
+            weights = weights * 100
+        out['가중치 (Weight)'] = weights
+    return normalize_schedule(out)
@@ -0,0 +1,273 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+
+from progress_engine import PHASE_RATIOS, date_array, phase_actual_ratio, progress_events
+from xlsx_patch import block_extra_rows, column_range, patch_workbook
+
+# 월간 진도 보고서 엑셀 (Monthly Progress Report Template)
+# 'Target_08월 월간진도보고서.xlsx' 양식에 앱 계산 결과(가중치, 전월/금월 실적, 단계별 진도, 일정)를 채운다.
+# 템플릿은 한 번만 읽고, 값이 바뀌는 시트만 xlsx_patch 로 고쳐 쓴다 (스타일/다른 시트는 그대로 복사).
+# 합계/누계 등 템플릿 수식은 그대로 두고 엑셀이 열 때 다시 계산한다.
+# update_derived (또는 pipeline.compute_project) 로 가중치/진도율 컬럼을 채운 DataFrame 을 넘겨야 한다.
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Target_08월 월간진도보고서.xlsx')
+
+# 시트 이름 -> (첫 행, 칸 수, 칸당 행 수): 템플릿의 항목 블록
+MONTHLY_SHEET = '1. Monthly Progress'
+OVERALL_SHEET = '2. Overall Project Progress'
+DETAIL_SHEET = '3. Detail Works Schedule'
+FABRICATION_SHEET = '4. Fabrication Status'
+SHIPPING_SHEET = '6. Shipping Plan'
+BLOCKS = {
+    MONTHLY_SHEET: (5, 15, 1),
+    OVERALL_SHEET: (6, 15, 1),
+    DETAIL_SHEET: (15, 10, 2),
+    FABRICATION_SHEET: (4, 15, 2),
+    SHIPPING_SHEET: (5, 11, 1),
+}
+
+# 2. Overall Project Progress 의 공정 컬럼 (F~K, 6개) 에 앱의 5단계를 배치 (J 는 비움)
+OVERALL_PHASE_COLS = ['F', 'G', 'H', 'I', 'K']
+OVERALL_PROCESS_COLS = column_range('F', 'K')
+
+# 3. Detail Works Schedule 의 순(旬, 10일) 격자: I~AL, 3칸씩 10개월 그룹
+DETAIL_GRID = column_range('I', 'AL')
+DETAIL_GROUPS = 10
+DETAIL_SECOND_SECTION = (35, 45)   # 템플릿의 두 번째 공종([I&C]) 구간: 비움
+DETAIL_TOTAL_ROW = 46
+DETAIL_ACC_ROW = 47
+DETAIL_ACTUAL_TOTAL_ROW = 48
+
+PROCUREMENT, MANUFACTURING, DELIVERY = '구매 (Procurement)', '제작 (Manufacturing)', '납품 (Delivery)'
+
+
+def _text_date(values):
+    # datetime64 배열 -> 'YYYY-MM-DD' 문자열 (템플릿이 날짜를 문자열로 적는 시트용, NaT 는 None)
+    days = values.astype('datetime64[D]')
+    return [None if np.isnat(d) else str(d) for d in days]
+
+
+def _report_items(df, phases):
+    names = df['항목 (Item)']
+    valid = (names.notna() & (names.astype(str).str.strip() != '')).to_numpy()
+    view = df[valid]
+    weight = pd.to_numeric(view['가중치 (Weight)'], errors='coerce').fillna(0).to_numpy(dtype=float)
+    total = weight.sum()
+    items = {
+        'view': view,
+        'n': len(view),
+        'name': view['항목 (Item)'].astype(str).tolist(),
+        'amount': pd.to_numeric(view['금액 (Amount)'], errors='coerce').fillna(0).to_numpy(dtype=float),
+        'weight': weight / total if total > 0 else weight,  # 분수 (합계 1)
+        'prev': view['전월 실적 (Actual Prev)'].to_numpy(dtype=float) / 100.0,
+        'curr': view['금월 실적 (Actual Curr)'].to_numpy(dtype=float) / 100.0,
+        'phases': {p[0]: p for p in phases},
+    }
+    return items
+
+
+def _rows(block, n_items):
+    # 항목 블록의 (항목 번호 또는 None, 행 번호) 목록. 칸이 남으면 None 으로 비운다
+    first_row, slots, step = block
+    return [(i if i < n_items else None, first_row + i * step) for i in range(max(n_items, slots))]
+
+
+def monthly_progress_cells(items, as_of):
+    cells = {'G1': pd.Timestamp(as_of)}
+    n = items['n']
+    for i, r in _rows(BLOCKS[MONTHLY_SHEET], n):
+        if i is None:
+            cells.update({f'{c}{r}': None for c in 'ABCDFG'})
+            continue
+        w = items['weight'][i]
+        cells.update({
+            f'A{r}': i + 1,
+            f'B{r}': items['name'][i],
+            f'C{r}': w,
+            f'D{r}': w * items['prev'][i],   # LAST MONTH (누계)
+            f'F{r}': w * items['curr'][i],   # ACC. (THIS MONTH = F - D 는 템플릿 수식)
+            f'G{r}': None,
+        })
+    return cells
+
+
+def overall_progress_cells(items, phases):
+    # 공정 라벨(3행)/비율(5행)을 앱 단계로 바꾸고 4행 보조 라벨은 비운다
+    cells = {f'{col}4': None for col in OVERALL_PROCESS_COLS}
+    cells.update({'J3': None, 'J5': 0})
+    for col, phase in zip(OVERALL_PHASE_COLS, phases):
+        cells[f'{col}3'] = phase[0].split('(')[-1].rstrip(')').upper()
+        cells[f'{col}5'] = PHASE_RATIOS.get(phase[0], 0) / 100.0
+
+    view = items['view']
+    contributions = [PHASE_RATIOS.get(p[0], 0) / 100.0 * phase_actual_ratio(view, p[3], p[4], p[5]) for p in phases]
+    has_amount = items['amount'].sum() > 0
+    for i, r in _rows(BLOCKS[OVERALL_SHEET], items['n']):
+        if i is None:
+            cells.update({f'{c}{r}': None for c in ['A', 'B', 'C', 'D', 'E'] + OVERALL_PROCESS_COLS})
+            continue
+        cells.update({f'A{r}': f'{i + 1}.', f'B{r}': items['name'][i],
+                      f'C{r}': items['amount'][i] if has_amount else None,
+                      f'D{r}': items['weight'][i], f'E{r}': None, f'J{r}': None})
+        for col, values in zip(OVERALL_PHASE_COLS, contributions):
+            cells[f'{col}{r}'] = float(values[i])
+    return cells
+
+
+def dekad_periods(d0, d1, as_of, groups=DETAIL_GROUPS):
+    # 격자 그룹(3칸) 구성: 기간이 groups 개월 이하이면 월별, 길면 앞부분을 2개 구간으로 묶고 기준월 부근은 월별.
+    # 반환: (그룹 라벨, 칸 표시 ['10','20','30' 또는 '-'], 칸 경계 날짜 (3 * groups + 1))
+    m0, m1 = d0.astype('datetime64[M]'), d1.astype('datetime64[M]')
+    n_months = int((m1 - m0).astype(int)) + 1
+    if n_months <= groups:
+        spans = [(m, m) for m in np.arange(m0, m0 + groups)]
+    else:
+        n_single = groups - 2
+        s = np.clip(as_of.astype('datetime64[M]') - 3, m0 + 2, m1 - n_single + 1)
+        mid = m0 + (s - m0) // 2
+        spans = [(m0, mid - 1), (mid, s - 1)] + [(m, m) for m in np.arange(s, s + n_single)]
+        if spans[-1][1] < m1:
+            spans[-1] = (spans[-1][0], m1)
+
+    labels, markers, edges = [], [], []
+    for a, b in spans:
+        start = a.astype('datetime64[D]')
+        if a == b:
+            labels.append(str(a).replace('-', '. '))
+            markers.extend([10, 20, 30])
+            edges.extend([start, start + 10, start + 20])
+        else:
+            labels.append(f"{str(a).replace('-', '. ')} ~ {str(b).replace('-', '. ')}")
+            markers.extend(['-'] * 3)
+            length = ((b + 1).astype('datetime64[D]') - start).astype(int)
+            edges.extend([start + int(round(length * k / 3)) for k in range(3)])
+    edges.append((spans[-1][1] + 1).astype('datetime64[D]'))
+    return labels, markers, np.array(edges, dtype='datetime64[D]')
+
+
+def _rasterize(events, edges, n):
+    # 이벤트를 (항목 x 칸) 격자에 더한다 (칸 밖 이벤트는 양 끝 칸으로)
+    grid = np.zeros((n, len(edges) - 1))
+    idx = np.arange(n)
+    for dates, values in events:
+        ok = ~np.isnat(dates) & (values != 0)
+        cols = np.clip(np.searchsorted(edges, dates[ok], side='right') - 1, 0, len(edges) - 2)
+        np.add.at(grid, (idx[ok], cols), values[ok])
+    return grid
+
+
+def detail_schedule_cells(items, phases, project_name, as_of):
+    view, n = items['view'], items['n']
+    as_of_d = np.datetime64(pd.Timestamp(as_of).normalize(), 'D')
+    plan_events, actual_events = progress_events(view, phases, as_of_d)
+    dates = np.concatenate([d for d, _ in plan_events + actual_events] + [np.array([as_of_d])])
+    dates = dates[~np.isnat(dates)]
+    labels, markers, edges = dekad_periods(dates.min(), dates.max(), as_of_d)
+
+    # 격자 값: 전체 공정 대비 % (항목 진도 증가 x 가중치) -> AM(=SUM/100) 은 항목 기여도, 합계 행은 기간별/누계 공정률
+    weight = items['weight'][:, None]
+    plan_grid = np.round(_rasterize(plan_events, edges, n) * weight, 4)
+    actual_grid = np.round(_rasterize(actual_events, edges, n) * weight, 4)
+
+    as_of_text = pd.Timestamp(as_of).strftime('%Y. %m. %d')
+    cells = {'C2': project_name, 'C5': as_of_text, 'AH4': as_of_text}
+    for k, label in enumerate(labels):
+        cells[f'{DETAIL_GRID[3 * k]}7'] = label
+    cells.update({f'{col}8': marker for col, marker in zip(DETAIL_GRID, markers)})
+    # ENGINEERING (템플릿 예시 행) 은 비움: 설계 단계는 항목별 행에 포함
+    for r in range(10, 14):
+        cells.update({f'{col}{r}': None for col in ['G'] + DETAIL_GRID})
+
+    first_row = BLOCKS[DETAIL_SHEET][0]
+    cells[f'B{first_row}'] = project_name
+    for i, r in _rows(BLOCKS[DETAIL_SHEET], n):
+        if i is None:
+            for row in (r, r + 1):
+                cells.update({f'{col}{row}': None for col in ['D', 'G', 'AN'] + DETAIL_GRID})
+            continue
+        cells.update({f'D{r}': items['name'][i], f'G{r}': float(items['weight'][i]), f'AN{r}': None, f'AN{r + 1}': None})
+        for col, p, a in zip(DETAIL_GRID, plan_grid[i], actual_grid[i]):
+            cells[f'{col}{r}'] = float(p) if p else None
+            cells[f'{col}{r + 1}'] = float(a) if a else None
+
+    # 템플릿 수식 보정: AM(공정율)과 누계 행이 첫 칸(I)을 빠뜨리던 것, 합계 행은 PLAN/ACTUAL 구분으로
+    # (템플릿의 PLAN 합계 행은 실적 행을 더하고, ACTUAL 합계 행은 #REF! 가 섞여 있어 두 행 모두 SUMIF 로 다시 쓴다)
+    extra = block_extra_rows(BLOCKS[DETAIL_SHEET] + (n,))
+    cells[f'AM{first_row}'] = f'=SUM(I{first_row}:AL{first_row})/100'
+    second_first, second_last = (r + extra for r in DETAIL_SECOND_SECTION)
+    for r in range(second_first, second_last + 1):
+        cells.update({f'{col}{r}': None for col in ['A', 'B', 'D', 'F', 'G', 'H', 'AN'] + DETAIL_GRID})
+    total_row, acc_row, last = DETAIL_TOTAL_ROW + extra, DETAIL_ACC_ROW + extra, second_last
+    actual_row = DETAIL_ACTUAL_TOTAL_ROW + extra
+    cells[f'G{total_row}'] = f'=SUMIF($F$10:$F${last},"PLAN",G10:G{last})'
+    for row, kind in ((total_row, 'PLAN'), (actual_row, 'ACTUAL')):
+        cells.update({f'{col}{row}': f'=SUMIF($F$10:$F${last},"{kind}",{col}10:{col}{last})' for col in DETAIL_GRID})
+    cells[f'J{acc_row}'] = f'=I{acc_row}+J{total_row}'
+    return cells
+
+
+def fabrication_cells(items):
+    view, phase = items['view'], items['phases']
+    proc, mfg, dlv = phase.get(PROCUREMENT), phase.get(MANUFACTURING), phase.get(DELIVERY)
+
+    def dates(p, k):
+        return _text_date(date_array(view, p[k])) if p else [None] * items['n']
+
+    plan = {'G': dates(proc, 1), 'H': dates(proc, 2), 'I': dates(mfg, 1), 'J': dates(mfg, 2), 'L': dates(dlv, 2)}
+    actual = {'G': dates(proc, 3), 'H': dates(proc, 5), 'I': dates(mfg, 3), 'J': dates(mfg, 5), 'L': dates(dlv, 5)}
+    progress = phase_actual_ratio(view, mfg[3], mfg[4], mfg[5]) if mfg else np.zeros(items['n'])
+
+    cells = {}
+    for i, r in _rows(BLOCKS[FABRICATION_SHEET], items['n']):
+        cleared = {f'{c}{row}': None for row in (r, r + 1) for c in 'ABCEFGHIJKLMN'}
+        cells.update(cleared)
+        if i is None:
+            continue
+        cells.update({f'A{r}': i + 1, f'B{r}': items['name'][i], f'K{r}': float(progress[i])})
+        for col in plan:
+            cells[f'{col}{r}'] = plan[col][i]
+            cells[f'{col}{r + 1}'] = actual[col][i]
+    return cells
+
+
+def shipping_cells(items):
+    dlv = items['phases'].get(DELIVERY)
+    delivery = _text_date(date_array(items['view'], dlv[2])) if dlv else [None] * items['n']
+    # 선적 차수(L~N 열): 서로 다른 납품 계획일 중 빠른 3개
+    shipments = sorted({d for d in delivery if d})[:3]
+    cells = {f'{col}4': shipments[k] if k < len(shipments) else None for k, col in enumerate('LMN')}
+    for i, r in _rows(BLOCKS[SHIPPING_SHEET], items['n']):
+        cells.update({f'{c}{r}': None for c in 'ABCDEFGHIJKO'})
+        if i is not None:
+            cells.update({f'A{r}': i + 1, f'B{r}': items['name'][i], f'K{r}': delivery[i]})
+    return cells
+
+
+def monthly_report_sheets(df, phases, project_name, as_of=None):
+    # patch_workbook 용 {시트 이름: (셀 dict, 항목 블록)}
+    as_of = pd.Timestamp.now() if as_of is None else pd.Timestamp(as_of)
+    items = _report_items(df, phases)
+    if items['n'] == 0:
+        raise ValueError("보고서에 넣을 항목이 없습니다.")
+    builders = {
+        MONTHLY_SHEET: monthly_progress_cells(items, as_of),
+        OVERALL_SHEET: overall_progress_cells(items, phases),
+        DETAIL_SHEET: detail_schedule_cells(items, phases, project_name, as_of),
+        FABRICATION_SHEET: fabrication_cells(items),
+        SHIPPING_SHEET: shipping_cells(items),
+    }
+    return {name: (cells, BLOCKS[name] + (items['n'],)) for name, cells in builders.items()}
+
+
+def write_monthly_report(target, df, phases, project_name, as_of=None, template=TEMPLATE_PATH):
+    # target: 파일 경로 또는 file-like
+    patch_workbook(template, target, monthly_report_sheets(df, phases, project_name, as_of))
+
+
+def monthly_report_bytes(df, phases, project_name, as_of=None, template=TEMPLATE_PATH):
+    output = io.BytesIO()
+    write_monthly_report(output, df, phases, project_name, as_of, template)
+    return output.getvalue()
@@ -0,0 +1,218 @@
+import argparse
+import glob
+import gzip
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import pandas as pd
+
+from charts import add_delivery_line, create_s_curve_chart, create_schedule_gantt
+from excel_gantt import write_gantt_excel
+from figure_cache import figure_html
+from incremental import update_derived
+from legacy_import import list_sheets, read_sheet
+from monthly_report import write_monthly_report
+from progress_engine import month_bounds, overall_status
+from report import build_report_html, create_data_table_html, create_offline_tables, create_review_table_html, plotly_bundle_html, safe_filename, write_schedule_excel
+from schedule_model import PHASES_INFO, normalize_schedule
+from scurve import compute_s_curve, render_svg_s_curve
+from snapshot_store import apply_closed_prev, save_snapshot
+from svg_gantt import render_svg_gantt, svg_gantt_html
+from work_calendar import DEFAULT_WEEKMASK, load_holidays, make_calendar
+
+# 배치 리포트 파이프라인 (Headless Pipeline)
+# Streamlit 없이 워크북 -> 진도/지연 계산 -> 엑셀 + HTML 보고서를 만든다 (야간 배치, cron 용).
+# 사용 예: python pipeline.py 프로젝트폴더/ --as-of 2025-08-31 --out reports --workers 4
+
+WORKBOOK_PATTERN = '*.xlsx'
+
+
+def find_workbooks(folder, pattern=WORKBOOK_PATTERN):
+    # 엑셀 임시 잠금 파일(~$...)은 제외
+    paths = glob.glob(os.path.join(folder, pattern))
+    return sorted(p for p in paths if not os.path.basename(p).startswith('~$'))
+
+
+def load_project(path):
+    # 앱에서 내보낸 워크북(Schedule + ProjectInfo 시트) 읽기. 반환: (일정 DataFrame, 프로젝트 정보 dict)
+    sheets = list_sheets(path)
+    schedule_df, _ = read_sheet(path, 'Schedule' if 'Schedule' in sheets else sheets[0], header_row=1)
+    meta_df = read_sheet(path, 'ProjectInfo', header_row=1)[0] if 'ProjectInfo' in sheets else None
+    df, _ = normalize_schedule(schedule_df)
+
+    info = {
+        'project_name': os.path.splitext(os.path.basename(path))[0].replace('_Schedule_Calculated', ''),
+        'start_date': None,
+        'delivery_date': None,
+    }
+    if meta_df is not None and not meta_df.empty:
+        first = meta_df.iloc[0]
+        if 'ProjectName' in meta_df.columns and pd.notnull(first['ProjectName']):
+            info['project_name'] = str(first['ProjectName'])
+        if 'StartDate' in meta_df.columns and pd.notnull(first['StartDate']):
+            info['start_date'] = pd.to_datetime(first['StartDate']).date()
+        if 'DeliveryDate' in meta_df.columns and pd.notnull(first['DeliveryDate']):
+            info['delivery_date'] = pd.to_datetime(first['DeliveryDate']).date()
+    return df, info
+
+
+def project_calendar(weekmask=None, holidays=None):
+    # 근무일 달력 (둘 다 없으면 None = 달력일). holidays: 휴일 파일 경로
+    if weekmask is None and holidays is None:
+        return None
+    return make_calendar(weekmask or DEFAULT_WEEKMASK, load_holidays(holidays) if holidays else ())
+
+
+def compute_project(df, as_of=None, contract_delivery_date=None, calendar=None):
+    # 금액/가중치/진도율 컬럼을 df 에 채우고 (전체 계획, 전체 실적, 지연 알림) 반환
+    first_day_of_month, last_day_of_month = month_bounds(as_of)
+    _, overall_plan, overall_actual, delay_alerts = update_derived(
+        None, df, None, PHASES_INFO, first_day_of_month, last_day_of_month, contract_delivery_date or date.max,
+        calendar=calendar
+    )
+    return overall_plan, overall_actual, delay_alerts
+
+
+def render_report(df, project_name, overall_plan, overall_actual, delay_alerts, as_of=None, contract_delivery_date=None, offline=False, svg=False):
+    # offline: plotly.js 로컬 사본과 표 데이터(JSON)를 내장해 인터넷 없이 열리는 보고서
+    # svg: 간트를 인쇄용 정적 SVG 로 (plotly.js 불필요)
+    report_date = pd.Timestamp.now() if as_of is None else pd.Timestamp(as_of)
+    curve = compute_s_curve(df, PHASES_INFO, report_date)
+    if svg:
+        gantt_html = svg_gantt_html(render_svg_gantt(df, PHASES_INFO, project_name, report_date, contract_delivery_date))
+        s_curve_html = render_svg_s_curve(curve, report_date, contract_delivery_date)
+    else:
+        fig_gantt = create_schedule_gantt(df, PHASES_INFO, "", today=report_date)  # Clean title for report
+        if fig_gantt and contract_delivery_date is not None:
+            add_delivery_line(fig_gantt, contract_delivery_date)
+        gantt_html = figure_html({'fig': fig_gantt, 'json': None}, include_plotlyjs=False if offline else 'cdn')
+        # plotly.js 는 간트 div 가 이미 불러온다
+        fig_curve = create_s_curve_chart(curve, "", today=report_date)
+        if fig_curve and contract_delivery_date is not None:
+            add_delivery_line(fig_curve, contract_delivery_date)
+        s_curve_html = figure_html({'fig': fig_curve, 'json': None}, include_plotlyjs=False) or ''
+    if offline:
+        review_table_html, data_table_html, body_end_html = create_offline_tables(df, PHASES_INFO)
+        head_html = '' if svg else plotly_bundle_html()
+    else:
+        review_table_html, data_table_html = create_review_table_html(df), create_data_table_html(df, PHASES_INFO)
+        head_html = body_end_html = ''
+    return build_report_html(
+        project_name, report_date, overall_plan, overall_actual, overall_status(overall_plan, overall_actual), delay_alerts,
+        gantt_html or "<p>일정 데이터 부족</p>", review_table_html, data_table_html, head_html, body_end_html, s_curve_html
+    )
+
+
+def run_project(path, out_dir, as_of=None, contract_delivery_date=None, excel=True, html=True, offline=False, compress=False, svg=False, gantt=False, monthly=False, snapshot=None, weekmask=None, holidays=None):
+    # 워크북 하나 처리. 반환: 결과 dict (outputs: 작성한 파일 경로 목록)
+    # snapshot: 월 마감 스냅샷 DB 경로 -> 전월 실적을 직전 달 마감 값으로 고정하고 이번 달 스냅샷 저장
+    # weekmask/holidays: 근무일 달력 (지연/초과 일수를 근무일로). busdaycalendar 는 pickle 이 안 돼 워커에서 만든다
+    started = time.perf_counter()
+    df, info = load_project(path)
+    delivery_date = contract_delivery_date or info['delivery_date']
+    overall_plan, overall_actual, delay_alerts = compute_project(df, as_of, delivery_date, project_calendar(weekmask, holidays))
+    if snapshot:
+        snapshot_as_of = pd.Timestamp.now() if as_of is None else as_of
+        apply_closed_prev(df, info['project_name'], snapshot_as_of, snapshot)
+        save_snapshot(df, info['project_name'], snapshot_as_of, overall_plan, overall_actual, snapshot)
+
+    os.makedirs(out_dir, exist_ok=True)
+    outputs = []
+    if excel:
+        excel_path = os.path.join(out_dir, safe_filename(f"{info['project_name']}_Schedule_Calculated.xlsx"))
+        write_schedule_excel(excel_path, df, info['project_name'], info['start_date'], delivery_date)
+        outputs.append(excel_path)
+    if gantt:
+        gantt_path = os.path.join(out_dir, safe_filename(f"{info['project_name']}_Gantt.xlsx"))
+        write_gantt_excel(gantt_path, df, PHASES_INFO, info['project_name'], pd.Timestamp.now() if as_of is None else as_of, delivery_date)
+        outputs.append(gantt_path)
+    if monthly:
+        monthly_path = os.path.join(out_dir, safe_filename(f"{info['project_name']}_Monthly_Progress_Report.xlsx"))
+        write_monthly_report(monthly_path, df, PHASES_INFO, info['project_name'], as_of)
+        outputs.append(monthly_path)
+    if html:
+        html_path = os.path.join(out_dir, safe_filename(f"{info['project_name']}_Progress_Report.html"))
+        html_bytes = render_report(df, info['project_name'], overall_plan, overall_actual, delay_alerts, as_of, delivery_date, offline, svg).encode('utf-8')
+        if compress:
+            html_path += '.gz'
+            html_bytes = gzip.compress(html_bytes, compresslevel=6)
+        with open(html_path, 'wb') as f:
+            f.write(html_bytes)
+        outputs.append(html_path)
+
+    return {
+        'path': path,
+        'project_name': info['project_name'],
+        'items': len(df),
+        'overall_plan': overall_plan,
+        'overall_actual': overall_actual,
+        'alerts': len(delay_alerts),
+        'outputs': outputs,
+        'seconds': time.perf_counter() - started,
+    }
+
+
+def _run_safe(path, out_dir, as_of, contract_delivery_date, excel, html, offline, compress, svg, gantt, monthly, snapshot, weekmask, holidays):
+    # 워커용: 실패한 파일은 error 를 담아 돌려준다 (배치 전체를 멈추지 않음)
+    try:
+        return run_project(path, out_dir, as_of, contract_delivery_date, excel, html, offline, compress, svg, gantt, monthly, snapshot, weekmask, holidays)
+    except Exception as e:
+        return {'path': path, 'error': f"{type(e).__name__}: {e}"}
+
+
+def run_batch(paths, out_dir, as_of=None, contract_delivery_date=None, excel=True, html=True, workers=1, offline=False, compress=False, svg=False, gantt=False, monthly=False, snapshot=None, weekmask=None, holidays=None):
+    args = (out_dir, as_of, contract_delivery_date, excel, html, offline, compress, svg, gantt, monthly, snapshot, weekmask, holidays)
+    if workers <= 1 or len(paths) <= 1:
+        return [_run_safe(p, *args) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_safe, paths, *[[a] * len(paths) for a in args]))
+
+
+def _expand_inputs(inputs):
+    paths = []
+    for item in inputs:
+        paths.extend(find_workbooks(item) if os.path.isdir(item) else [item])
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="월간 진도 보고서 배치 생성 (엑셀 + HTML)")
+    parser.add_argument('inputs', nargs='+', help="프로젝트 워크북(.xlsx) 또는 워크북이 있는 폴더")
+    parser.add_argument('--as-of', dest='as_of', type=date.fromisoformat, default=None, help="기준일 YYYY-MM-DD (기본: 오늘)")
+    parser.add_argument('--out', default='reports', help="출력 폴더 (기본: reports)")
+    parser.add_argument('--delivery', type=date.fromisoformat, default=None, help="계약 납품일 YYYY-MM-DD (기본: ProjectInfo 시트 값)")
+    parser.add_argument('--workers', type=int, default=1, help="병렬 프로세스 수")
+    parser.add_argument('--no-excel', dest='excel', action='store_false', help="엑셀 출력 생략")
+    parser.add_argument('--no-html', dest='html', action='store_false', help="HTML 보고서 출력 생략")
+    parser.add_argument('--offline', action='store_true', help="plotly.js 와 표 데이터를 내장한 오프라인 보고서")
+    parser.add_argument('--svg', action='store_true', help="간트를 인쇄용 정적 SVG 로 (페이지 분할)")
+    parser.add_argument('--gantt-xlsx', dest='gantt', action='store_true', help="엑셀 간트 시트(_Gantt.xlsx) 추가 출력")
+    parser.add_argument('--monthly-xlsx', dest='monthly', action='store_true', help="월간 진도 보고서 양식(_Monthly_Progress_Report.xlsx) 추가 출력")
+    parser.add_argument('--snapshot', default=None, metavar='DB', help="월 마감 스냅샷 SQLite 경로 (전월 실적 고정 + 이번 달 저장)")
+    parser.add_argument('--weekmask', default=None, help="근무 요일 월~일 7자리 (예: 1111100). 지정하면 지연 일수를 근무일로 계산")
+    parser.add_argument('--holidays', default=None, metavar='FILE', help="휴일 목록 파일 (한 줄에 YYYY-MM-DD, 예: holidays.csv)")
+    parser.add_argument('--gzip', dest='compress', action='store_true', help="HTML 보고서를 .html.gz 로 압축 저장")
+    args = parser.parse_args(argv)
+
+    paths = _expand_inputs(args.inputs)
+    if not paths:
+        parser.error("처리할 워크북이 없습니다.")
+
+    started = time.perf_counter()
+    results = run_batch(paths, args.out, args.as_of, args.delivery, args.excel, args.html, args.workers, args.offline, args.compress, args.svg, args.gantt, args.monthly, args.snapshot, args.weekmask, args.holidays)
+    failed = 0
+    for r in results:
+        if 'error' in r:
+            failed += 1
+            print(f"[FAIL] {r['path']}: {r['error']}", file=sys.stderr)
+        else:
+            print(f"[OK] {r['project_name']}: 계획 {r['overall_plan']:.2f}% / 실적 {r['overall_actual']:.2f}% · 알림 {r['alerts']}건 ({r['seconds']:.2f}s)")
+    print(f"{len(results) - failed}/{len(results)} 완료 ({time.perf_counter() - started:.1f}s) -> {os.path.abspath(args.out)}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
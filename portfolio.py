@@ -0,0 +1,75 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from pipeline import compute_project, find_workbooks, load_project
+from progress_engine import overall_status
+
+# 포트폴리오 (Portfolio)
+# 폴더 안의 프로젝트 워크북(<project>_Schedule_Calculated.xlsx: Schedule + ProjectInfo 시트)을
+# 프로세스 풀에서 병렬로 읽고 프로젝트별 전체 계획/실적 공정률과 지연 알림 수를 집계한다.
+# 워크북 읽기/계산은 배치 파이프라인(pipeline.py)과 같은 함수를 사용한다.
+
+SUMMARY_COLS = ['파일 (File)', '프로젝트 (Project)', '납품일 (Delivery)', '항목 수 (Items)', '금액 (Amount)',
+                '계획 공정률 (Plan)', '실적 공정률 (Actual)', '차이 (Gap)', '상태 (Status)', '지연 알림 (Alerts)', '오류 (Error)']
+
+
+def summarize_project(path, as_of=None):
+    # 워크북 하나를 계산해 요약 dict 반환. 실패해도 예외 대신 오류 메시지를 담아 돌려준다
+    result = dict.fromkeys(SUMMARY_COLS)
+    result['파일 (File)'] = os.path.basename(path)
+    try:
+        df, info = load_project(path)
+        project_name, delivery_date = info['project_name'], info['delivery_date']
+        overall_plan, overall_actual, delay_alerts = compute_project(df, as_of, delivery_date)
+        result.update({
+            '프로젝트 (Project)': project_name,
+            '납품일 (Delivery)': delivery_date,
+            '항목 수 (Items)': len(df),
+            '금액 (Amount)': float(df['금액 (Amount)'].sum()),
+            '계획 공정률 (Plan)': overall_plan,
+            '실적 공정률 (Actual)': overall_actual,
+            '차이 (Gap)': overall_actual - overall_plan,
+            '상태 (Status)': overall_status(overall_plan, overall_actual),
+            '지연 알림 (Alerts)': len(delay_alerts),
+        })
+    except Exception as e:
+        result['오류 (Error)'] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def summarize_portfolio(paths, as_of=None, max_workers=None):
+    # 프로세스 풀에서 병렬 계산 (파일 하나의 실패나 워커 비정상 종료가 전체를 멈추지 않음)
+    rows = []
+    if not paths:
+        return pd.DataFrame(columns=SUMMARY_COLS)
+    if max_workers == 1 or len(paths) == 1:
+        rows = [summarize_project(p, as_of) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(summarize_project, p, as_of): p for p in paths}
+            for future in as_completed(futures):
+                try:
+                    rows.append(future.result())
+                except Exception as e:
+                    row = dict.fromkeys(SUMMARY_COLS)
+                    row['파일 (File)'] = os.path.basename(futures[future])
+                    row['오류 (Error)'] = f"{type(e).__name__}: {e}"
+                    rows.append(row)
+    order = {os.path.basename(p): i for i, p in enumerate(paths)}
+    rows.sort(key=lambda r: order.get(r['파일 (File)'], 0))
+    return pd.DataFrame(rows, columns=SUMMARY_COLS)
+
+
+def portfolio_progress(summary_df):
+    # 포트폴리오 가중 공정률: 프로젝트 금액 가중 (금액이 모두 0 이면 단순 평균). 반환: (계획, 실적)
+    ok = summary_df[summary_df['오류 (Error)'].isna()]
+    if ok.empty:
+        return 0.0, 0.0
+    weights = ok['금액 (Amount)'].astype(float)
+    if weights.sum() <= 0:
+        weights = pd.Series(1.0, index=ok.index)
+    plan = float((ok['계획 공정률 (Plan)'].astype(float) * weights).sum() / weights.sum())
+    actual = float((ok['실적 공정률 (Actual)'].astype(float) * weights).sum() / weights.sum())
+    return plan, actual
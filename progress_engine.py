@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+
+# 진도율 계산 엔진 (Columnar Progress Kernel)
+# 모든 항목/단계의 진도율을 한 번에 배열 연산으로 계산한다.
+# 기존 app.py 의 행 단위(iterrows) 계산과 동일한 규칙을 따른다.
+
+# Global Phase Weights: Procurement 10, Design 20, Mfg 40, Insp 25, Delivery 5
+# Logic: Start=50%, End=100% of Phase Weight
+PHASE_RATIOS = {
+    '구매 (Procurement)': 10.0,
+    '설계 (Design)': 20.0,
+    '제작 (Manufacturing)': 40.0,
+    '검사 (Inspection)': 25.0,
+    '납품 (Delivery)': 5.0
+}
+
+PROGRESS_COLS = ['금월 실적 (Actual Curr)', '전월 실적 (Actual Prev)', '금월 계획 (Plan Curr)', '전월 계획 (Plan Prev)']
+
+
+def month_bounds(ref_ts=None):
+    # 기준일이 속한 달의 1일 00:00 과 말일 00:00 을 반환
+    ref_ts = pd.Timestamp.now() if ref_ts is None else pd.Timestamp(ref_ts)
+    first_day_of_month = ref_ts.replace(day=1, hour=0, minute=0, second=0, microsecond=0, nanosecond=0)
+    next_month = (first_day_of_month + pd.DateOffset(months=1))
+    last_day_of_month = next_month - pd.Timedelta(days=1)
+    return first_day_of_month, last_day_of_month
+
+
+def overall_status(overall_plan, overall_actual):
+    status_msg = "정상 (On Track)"
+    if overall_actual < overall_plan: status_msg = "지연 (Delayed)"
+    elif overall_actual > overall_plan: status_msg = "초과 달성 (Ahead)"
+    return status_msg
+
+
+def date_array(df, col):
+    # 컬럼 -> datetime64[ns] 배열 (결측/잘못된 값은 NaT)
+    if col not in df.columns:
+        return np.full(len(df), np.datetime64('NaT'), dtype='datetime64[ns]')
+    s = df[col]
+    if not pd.api.types.is_datetime64_any_dtype(s):
+        s = pd.to_datetime(s, errors='coerce')
+    return s.to_numpy(dtype='datetime64[ns]')
+
+
+def ratio_array(df, col):
+    # 진행률 컬럼 ('50', '50%', 50 ...) -> 0~1 비율 배열 (해석 불가 시 0)
+    if col not in df.columns:
+        return np.zeros(len(df))
+    s = df[col]
+    if not pd.api.types.is_numeric_dtype(s):
+        s = s.astype(str).str.replace('%', '').str.strip()
+    return pd.to_numeric(s, errors='coerce').fillna(0).to_numpy(dtype=float) / 100.0
+
+
+def actual_ratio(df, a_prog, a_end):
+    # 실적 진행률: 실적 종료일이 있으면 100%
+    prog = ratio_array(df, a_prog)
+    return np.where(~np.isnat(date_array(df, a_end)), 1.0, prog)
+
+
+def phase_actual_ratio(df, a_s, a_prog, a_e):
+    # 단계 실적 달성률 (0~1): 실적 종료일이 있으면 100%, 진행률이 0이면 시작 여부로 50% 처리
+    prog = actual_ratio(df, a_prog, a_e)
+    return np.where(prog > 0, prog, np.where(~np.isnat(date_array(df, a_s)), 0.5, 0.0))
+
+
+def compute_progress(df, phases, first_day_of_month, last_day_of_month, phase_ratios=PHASE_RATIOS):
+    # 금월/전월 실적 및 계획 누적 진도율 (항목별, %)
+    n = len(df)
+    fdm = np.datetime64(pd.Timestamp(first_day_of_month), 'ns')
+    ldm = np.datetime64(pd.Timestamp(last_day_of_month), 'ns')
+
+    curr_act = np.zeros(n)
+    prev_act = np.zeros(n)
+    curr_plan = np.zeros(n)
+    prev_plan = np.zeros(n)
+
+    for phase_name, p_s, p_e, a_s, a_prog, a_e in phases:
+        weight = phase_ratios.get(phase_name, 0)
+
+        # --- Actual Calculation ---
+        a_start = date_array(df, a_s)
+        a_end = date_array(df, a_e)
+
+        # Current Actual
+        curr_act += weight * phase_actual_ratio(df, a_s, a_prog, a_e)
+
+        # Previous Actual (NaT 비교는 항상 False)
+        prev_act += np.where(a_end < fdm, weight, np.where(a_start < fdm, weight * 0.5, 0.0))
+
+        # --- Plan Calculation ---
+        p_start = date_array(df, p_s)
+        p_end = date_array(df, p_e)
+
+        # Previous Plan (Scheduled before this month)
+        prev_plan += np.where(p_end < fdm, weight, np.where(p_start < fdm, weight * 0.5, 0.0))
+        # Current Plan (Scheduled up to end of this month, cumulative target)
+        curr_plan += np.where(p_end <= ldm, weight, np.where(p_start <= ldm, weight * 0.5, 0.0))
+
+    return pd.DataFrame({
+        '금월 실적 (Actual Curr)': curr_act,
+        '전월 실적 (Actual Prev)': prev_act,
+        '금월 계획 (Plan Curr)': curr_plan,
+        '전월 계획 (Plan Prev)': prev_plan,
+    }, index=df.index)
+
+
+def progress_events(df, phases, as_of, phase_ratios=PHASE_RATIOS):
+    # 진도 증가 이벤트 (날짜 datetime64[D], 진도 % 증가) 목록: (계획, 실적). 모든 배열은 항목 수 길이
+    # compute_progress 와 같은 규칙 -> 날짜별 누적하면 해당 날짜의 계획/실적 누적 진도율
+    # 계획: 시작일에 단계 비율의 50%, 종료일에 나머지. 실적: 종료된 단계는 시작/종료일에 50%씩,
+    # 진행 중인 단계는 시작일에 최대 50%, 나머지 진행분은 기준일(as_of)에.
+    as_of = np.datetime64(pd.Timestamp(as_of).normalize(), 'D')
+    plan, actual = [], []
+    for phase_name, p_s, p_e, a_s, a_prog, a_e in phases:
+        weight = phase_ratios.get(phase_name, 0)
+        ps, pe = date_array(df, p_s).astype('datetime64[D]'), date_array(df, p_e).astype('datetime64[D]')
+        half = np.where(~np.isnat(ps), weight / 2, 0.0)
+        plan += [(ps, half), (pe, np.where(~np.isnat(pe), weight - half, 0.0))]
+
+        a_start, a_end = date_array(df, a_s).astype('datetime64[D]'), date_array(df, a_e).astype('datetime64[D]')
+        done = weight * phase_actual_ratio(df, a_s, a_prog, a_e)
+        at_start = np.where(~np.isnat(a_start), np.minimum(done, weight / 2), 0.0)
+        actual += [(a_start, at_start), (np.where(~np.isnat(a_end), a_end, as_of), done - at_start)]
+    return plan, actual
+
+
+def compute_earned_dates(df, phases):
+    # Earned Schedule: 항목별로 달성한 계획 날짜 중 가장 늦은 날짜 (datetime64[D], 없으면 NaT)
+    # 실적 진행률만큼 계획 기간을 진행시킨 날짜, 진행률이 0 이고 실적 시작만 있으면 계획 시작일
+    n = len(df)
+    latest = np.full(n, np.datetime64('NaT'), dtype='datetime64[D]')
+
+    for phase_name, p_s, p_e, a_s, a_prog, a_e in phases:
+        ps = date_array(df, p_s)
+        pe = date_array(df, p_e)
+        has_plan = ~np.isnat(ps) & ~np.isnat(pe)
+
+        # (pe - ps).days, 계획이 없는 행은 0일로 두고 아래에서 제외
+        total_duration = np.where(has_plan, (pe - ps).astype('timedelta64[D]').view('int64'), 0)
+        prog = actual_ratio(df, a_prog, a_e)
+
+        earned_ns = np.round(total_duration * prog * 86400e9).astype('int64').astype('timedelta64[ns]')
+        earned = (ps + earned_ns).astype('datetime64[D]')
+        started = ~np.isnat(date_array(df, a_s))
+
+        cand = np.where(prog > 0, earned, np.where(started, ps.astype('datetime64[D]'), np.datetime64('NaT')))
+        cand = np.where(has_plan, cand, np.datetime64('NaT'))
+
+        # np.fmax 는 NaT 를 무시하고 최대값을 취한다
+        latest = np.fmax(latest, cand.astype('datetime64[D]'))
+
+    return latest
@@ -0,0 +1,343 @@
+import io
+import json
+import re
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from delay_analysis import alert_messages
+from xlsx_stream import write_xlsx
+
+# 보고서/내보내기 (Report & Export)
+# 종합 보고서 HTML 과 엑셀 스케줄 파일을 만든다. Streamlit 에 의존하지 않는다 (app.py, pipeline.py 공용).
+
+NUMERIC_FORMAT_COLS = ['가중치 (Weight)', '전월 실적 (Actual Prev)', '금월 실적 (Actual Curr)', '월간 진도 (Monthly Progress)']
+REVIEW_COLS = ['항목 (Item)', '가중치 (Weight)', '전월 실적 (Actual Prev)', '금월 실적 (Actual Curr)', '월간 진도 (Monthly Progress)']
+
+
+def safe_filename(name):
+    return re.sub(r'[\\/*?:"<>|]', "", name).strip()
+
+
+def write_schedule_excel(target, df, project_name, project_start_date, contract_delivery_date):
+    # 엑셀 스케줄 파일 (Schedule + ProjectInfo 시트). target: 파일 경로 또는 file-like
+    # xlsx_stream: 행을 나눠 바로 기록하는 스트리밍 작성기 (메모리 일정)
+    meta_data = {
+        'ProjectName': [project_name],
+        'StartDate': [pd.Timestamp(project_start_date) if project_start_date is not None else pd.NaT],
+        'DeliveryDate': [pd.Timestamp(contract_delivery_date) if contract_delivery_date is not None else pd.NaT]
+    }
+    write_xlsx(target, [("Schedule", df), ("ProjectInfo", pd.DataFrame(meta_data))])
+
+
+def schedule_excel_bytes(df, project_name, project_start_date, contract_delivery_date):
+    # 엑셀 다운로드 (In-Memory)
+    output = io.BytesIO()
+    write_schedule_excel(output, df, project_name, project_start_date, contract_delivery_date)
+    return output.getvalue()
+
+
+def measured(fn, *args, trace_memory=False):
+    # 반환: (결과, 소요 시간 초, 최대 메모리 bytes 또는 None)
+    # tracemalloc 은 실행을 크게 느리게 하므로 trace_memory=True 일 때만 메모리를 잰다
+    if not trace_memory:
+        started = time.perf_counter()
+        result = fn(*args)
+        return result, time.perf_counter() - started, None
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    try:
+        result = fn(*args)
+        return result, time.perf_counter() - started, tracemalloc.get_traced_memory()[1] - base
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+
+def create_data_table_html(df, phases):
+    # Select columns: Item, Weight, Prev Actual, Curr Actual, Monthly Progress, Duration
+    # Ensure these columns exist
+    base_cols = ['항목 (Item)', '가중치 (Weight)', '전월 실적 (Actual Prev)', '금월 실적 (Actual Curr)', '월간 진도 (Monthly Progress)', '제작 기간 (Weeks)']
+    cols_to_show = [c for c in base_cols if c in df.columns]
+
+    # Add date columns from phases
+    date_cols = []
+    for p in phases:
+         # Add Plan Start/End, Actual Start/Progress/End
+         date_cols.extend([p[1], p[2], p[3], p[4], p[5]])
+
+    # Filter only existing columns
+    existing_date_cols = [c for c in date_cols if c in df.columns]
+    final_cols = cols_to_show + existing_date_cols
+
+    table_df = df[final_cols].copy()
+
+    # Format Numeric Columns to 2 decimal places
+    numeric_format_cols = ['가중치 (Weight)', '전월 실적 (Actual Prev)', '금월 실적 (Actual Curr)', '월간 진도 (Monthly Progress)']
+    for col in numeric_format_cols:
+        if col in table_df.columns:
+             # Check if numeric
+             table_df[col] = pd.to_numeric(table_df[col], errors='coerce').fillna(0)
+             table_df[col] = table_df[col].apply(lambda x: f"{x:.2f}")
+
+    # Format Dates
+    for col in existing_date_cols:
+        table_df[col] = pd.to_datetime(table_df[col]).dt.strftime('%Y-%m-%d').fillna('-')
+
+    # Rename columns for better readability (Optional)
+    # e.g. remove ' (Item)' etc.
+
+    # Convert to HTML
+    html = table_df.to_html(index=False, classes='data-table', border=0)
+    return html
+
+
+def create_metrics_html(overall_plan, overall_actual, status_msg):
+    # A. Overall Metrics HTML
+    diff_val = overall_actual - overall_plan
+    diff_color = "red" if diff_val < 0 else "green"
+    diff_sign = "" if diff_val < 0 else "+"
+
+    metrics_html = f"""
+    <div class="metrics-container" style="display: flex; gap: 20px; justify-content: space-between; background: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 20px;">
+        <div class="metric-card" style="flex: 1; text-align: center; background: white; padding: 15px; border-radius: 5px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
+            <h3 style="margin-top: 0; color: #555;">전체 계획 공정률</h3>
+            <p style="font-size: 24px; font-weight: bold; margin: 0; color: #0056b3;">{overall_plan:.2f}%</p>
+        </div>
+        <div class="metric-card" style="flex: 1; text-align: center; background: white; padding: 15px; border-radius: 5px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
+            <h3 style="margin-top: 0; color: #555;">전체 실적 공정률</h3>
+            <p style="font-size: 24px; font-weight: bold; margin: 0; color: #0056b3;">{overall_actual:.2f}% <span style="font-size: 16px; color: {diff_color};">({diff_sign}{diff_val:.2f}%)</span></p>
+        </div>
+        <div class="metric-card" style="flex: 1; text-align: center; background: white; padding: 15px; border-radius: 5px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
+            <h3 style="margin-top: 0; color: #555;">종합 상태</h3>
+            <p style="font-size: 24px; font-weight: bold; margin: 0; color: #333;">{status_msg}</p>
+        </div>
+    </div>
+    """
+    return metrics_html
+
+
+def create_review_table_html(df):
+    # B. Detailed Progress Review Table HTML
+    final_review_cols = [c for c in REVIEW_COLS if c in df.columns]
+
+    # Create a copy for formatting
+    review_df = df[final_review_cols].copy()
+    for col in final_review_cols:
+        if col in ['가중치 (Weight)', '전월 실적 (Actual Prev)', '금월 실적 (Actual Curr)', '월간 진도 (Monthly Progress)']:
+             review_df[col] = pd.to_numeric(review_df[col], errors='coerce').fillna(0).apply(lambda x: f"{x:.2f}%")
+
+    review_table_html = review_df.to_html(index=False, classes='data-table', border=0)
+    return review_table_html
+
+
+# --- 오프라인 보고서 (Offline Report) ---
+# plotly.js 는 설치된 plotly 패키지의 로컬 사본을 한 번만 읽어 <head> 에 한 번만 넣고,
+# 표 데이터는 컬럼 단위 JSON 하나로 넣어 브라우저에서 표(검토 표 + 전체 표)를 그린다.
+
+_plotly_bundle = None
+
+TABLE_RENDER_JS = """
+(function() {
+    var P = JSON.parse(document.getElementById('report-data').textContent);
+    var ESC = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'};
+    function esc(s) { return String(s).replace(/[&<>"]/g, function(c) { return ESC[c]; }); }
+    function fmt(v, t, pct) {
+        if (v === null) return t === 'date' ? '-' : '';
+        if (t === 'date') return new Date(v * 864e5).toISOString().slice(0, 10);
+        if (t === 'num2') return v.toFixed(2) + (pct ? '%' : '');
+        return esc(v);
+    }
+    document.querySelectorAll('[data-report-table]').forEach(function(el) {
+        var spec = P.tables[el.getAttribute('data-report-table')];
+        var h = ['<table class="data-table"><thead><tr>'];
+        spec.cols.forEach(function(i) { h.push('<th>' + esc(P.columns[i]) + '</th>'); });
+        h.push('</tr></thead><tbody>');
+        for (var r = 0; r < P.rows; r++) {
+            h.push('<tr>');
+            spec.cols.forEach(function(i) { h.push('<td>' + fmt(P.data[i][r], P.types[i], spec.pct) + '</td>'); });
+            h.push('</tr>');
+        }
+        h.push('</tbody></table>');
+        el.innerHTML = h.join('');
+    });
+})();
+"""
+
+
+def plotly_bundle_html():
+    global _plotly_bundle
+    if _plotly_bundle is None:
+        from plotly.offline import get_plotlyjs
+        _plotly_bundle = get_plotlyjs()
+    return f'<script type="text/javascript">window.PlotlyConfig = {{MathJaxConfig: "local"}};</script>\n<script type="text/javascript">{_plotly_bundle}</script>'
+
+
+def _column_values(s, kind):
+    # JSON 용 값 리스트 (결측은 null). date: 1970-01-01 기준 일수, num2: 소수 2자리 (결측 0)
+    if kind == 'date':
+        if not pd.api.types.is_datetime64_any_dtype(s):
+            s = pd.to_datetime(s, errors='coerce')
+        days = s.to_numpy(dtype='datetime64[D]')
+        out = days.astype('int64').astype(object)
+        out[np.isnat(days)] = None
+        return out.tolist()
+    if kind == 'num2':
+        return np.round(pd.to_numeric(s, errors='coerce').fillna(0).to_numpy(dtype=float), 2).tolist()
+    if kind == 'num':
+        values = pd.to_numeric(s, errors='coerce').to_numpy(dtype=float)
+        out = values.astype(object)
+        out[np.isnan(values)] = None
+        return out.tolist()
+    return s.astype(object).where(s.notna(), None).tolist()
+
+
+def create_table_payload(df, phases):
+    # 검토 표/전체 표가 공유하는 컬럼 단위 JSON (create_data_table_html 과 같은 컬럼 구성)
+    base_cols = ['항목 (Item)', '가중치 (Weight)', '전월 실적 (Actual Prev)', '금월 실적 (Actual Curr)', '월간 진도 (Monthly Progress)', '제작 기간 (Weeks)']
+    columns, types = [], []
+    for col in base_cols:
+        if col in df.columns:
+            columns.append(col)
+            types.append('num2' if col in NUMERIC_FORMAT_COLS else 'num' if col == '제작 기간 (Weeks)' else 'text')
+    for p in phases:
+        for col, kind in zip(p[1:], ['date', 'date', 'date', 'num', 'date']):
+            if col in df.columns:
+                columns.append(col)
+                types.append(kind)
+
+    payload = {
+        'rows': len(df),
+        'columns': columns,
+        'types': types,
+        'data': [_column_values(df[col], kind) for col, kind in zip(columns, types)],
+        'tables': {
+            'review': {'cols': [columns.index(c) for c in REVIEW_COLS if c in columns], 'pct': True},
+            'data': {'cols': list(range(len(columns))), 'pct': False},
+        },
+    }
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+
+
+def create_offline_tables(df, phases):
+    # 반환: (검토 표 자리, 전체 표 자리, </body> 앞에 넣을 데이터 + 렌더링 스크립트)
+    body_end_html = (f'<script type="application/json" id="report-data">{create_table_payload(df, phases)}</script>\n'
+                     f'<script>{TABLE_RENDER_JS}</script>')
+    return '<div data-report-table="review"></div>', '<div data-report-table="data"></div>', body_end_html
+
+
+def build_report_html(project_name, report_date, overall_plan, overall_actual, status_msg, delay_alerts, gantt_html, review_table_html, data_table_html, head_html='', body_end_html='', s_curve_html=''):
+    # delay_alerts: 지연 알림 표 (delay_analysis.build_delay_table)
+    metrics_html = create_metrics_html(overall_plan, overall_actual, status_msg)
+    report_date = pd.Timestamp(report_date)
+    alerts = alert_messages(delay_alerts)
+
+    html_content = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="utf-8">
+        <title>{project_name} - Monthly Progress Report</title>
+        <style>
+            body {{ font-family: 'Helvetica Neue', Arial, sans-serif; color: #333; line-height: 1.6; max-width: 1200px; margin: 0 auto; padding: 40px; }}
+            .page-break {{ page-break-before: always; }}
+            .svg-gantt-page svg {{ width: 100%; height: auto; }}
+            .header {{ display: flex; justify-content: space-between; align-items: center; border-bottom: 2px solid #0056b3; padding-bottom: 20px; margin-bottom: 30px; }}
+            .logo {{ font-size: 24px; font-weight: bold; color: #0056b3; }}
+            .title-box {{ text-align: right; }}
+            .title {{ font-size: 28px; font-weight: bold; margin: 0; color: #2c3e50; }}
+            .subtitle {{ font-size: 14px; color: #7f8c8d; margin-top: 5px; }}
+
+            .section {{ margin-bottom: 50px; }}
+            .section-title {{ font-size: 20px; font-weight: bold; color: #0056b3; border-bottom: 1px solid #eee; padding-bottom: 10px; margin-bottom: 20px; }}
+
+            table.data-table {{ width: 100%; border-collapse: collapse; margin-top: 20px; font-size: 11px; }}
+            table.data-table th {{ background-color: #0056b3; color: white; padding: 8px; text-align: center; border: 1px solid #ddd; }}
+            table.data-table td {{ padding: 6px; border: 1px solid #ddd; text-align: center; }}
+            table.data-table tr:nth-child(even) {{ background-color: #f9f9f9; }}
+            table.data-table tr:hover {{ background-color: #f1f1f1; }}
+            td {{ padding: 10px; border-bottom: 1px solid #ddd; }}
+            tr:nth-child(even) {{ background-color: #f2f2f2; }}
+
+            @media print {{
+                .page-break {{ break-before: page; }}
+                body {{ padding: 0; }}
+            }}
+        </style>
+        {head_html}
+    </head>
+    <body>
+        <!-- Header -->
+        <div class="header">
+            <div class="logo">EMKO</div>
+            <div class="title-box">
+                <div class="title">Monthly Progress Report</div>
+                <div class="subtitle">Project: {project_name}</div>
+                <div class="subtitle">Date: {report_date.strftime('%Y-%m-%d')}</div>
+            </div>
+        </div>
+
+        <!-- 1. Overall Metrics (New) -->
+        <div class="section">
+            <div class="section-title">📊 종합 공정 현황 (Overall Status)</div>
+            {metrics_html}
+        </div>
+
+        <!-- Issues & Delays -->
+        <div class="section">
+             <div class="section-title">🚨 주요 이슈 및 지연 알림 (Major Issues)</div>
+             <ul>
+             {''.join([f'<li style="color:red; font-weight:bold;">{alert}</li>' for alert in alerts]) if alerts else '<li>No major issues found. (정상)</li>'}
+             </ul>
+        </div>
+
+        <div class="page-break"></div>
+
+        <!-- Gantt Chart -->
+        <div class="section">
+            <div class="section-title">📅 통합 공정 스케줄 (Project Schedule)</div>
+            <div style="width:100%; overflow-x: auto;">
+                {gantt_html}
+            </div>
+        </div>
+
+        {f'''<div class="page-break"></div>
+
+        <!-- S-Curve -->
+        <div class="section">
+            <div class="section-title">📈 누적 공정률 (S-Curve)</div>
+            <div style="width:100%; overflow-x: auto;">
+                {s_curve_html}
+            </div>
+        </div>''' if s_curve_html else ''}
+
+        <div class="page-break"></div>
+
+        <!-- 2. Detailed Progress Review (New) -->
+        <div class="section">
+            <div class="section-title">📋 상세 진도율 검토 (Detailed Progress Review)</div>
+            {review_table_html}
+        </div>
+
+        <div class="page-break"></div>
+
+        <!-- Detailed Data (Full Table) -->
+        <div class="section">
+            <div class="section-title">📑 전체 데이터 (Full Data)</div>
+            {data_table_html}
+        </div>
+
+        <div class="footer">
+            &copy; {report_date.year} EMKO. All rights reserved. Generated by Gantt Chat Project.
+        </div>
+        {body_end_html}
+    </body>
+    </html>
+    """
+    return html_content
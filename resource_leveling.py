@@ -0,0 +1,153 @@
+import heapq
+
+import numpy as np
+import pandas as pd
+
+from delay_analysis import to_date
+from progress_engine import date_array
+from schedule_model import VENDOR_COL
+from scheduler import write_plan_columns
+from work_calendar import day_count, day_index, index_day
+
+# 제작 업체 부하 평준화 (Resource Leveling)
+# 같은 제작 업체(공장)에 맡긴 항목들의 제작 단계를 업체별 동시 제작 한도(capacity, 주마다 동시에 제작 가능한 항목 수)
+# 안에서 다시 배치한다. 업체별로 우선순위 큐(heap) 두 개를 쓰는 리스트 스케줄러:
+#   제작 가능 시점(계획 제작 시작)이 된 항목을 ready 힙에 넣고, 가장 먼저 비는 작업대(slot 힙)에
+#   남은 기간(제작 ~ 납품 종료)이 긴 항목부터 배정한다 (같은 납기에서는 최소 여유 우선). 업체당 O(m log m).
+# 제작이 밀린 만큼 검사/납품 계획을 같이 미루고, 계약 납품일 대비 납품 지연을 보고한다.
+# 계획 컬럼에 대해 동작하므로 Auto Plan / CPM 어느 결과에도 적용할 수 있다 (선행관계 후속 항목은 다시 전파하지 않음).
+# 업체가 비어 있거나 한도가 없는 항목은 그대로 두고, 제작 실적 시작일이 있는 항목(진행 중)은 옮기지 않고 작업대만 차지한다.
+
+DEFAULT_CAPACITY = 1
+CAPACITY_COLS = ['제작 업체 (Vendor)', '동시 제작 수 (Capacity)']
+LEVEL_COLS = ['No.', '항목 (Item)', '제작 업체 (Vendor)', '제작 시작 (평준화 전)', '제작 시작 (평준화)', '제작 지연 (일)',
+              '납품 종료 (평준화)', '계약 대비 전 (일)', '계약 대비 (일)']
+VENDOR_SUMMARY_COLS = ['제작 업체 (Vendor)', '동시 제작 수 (Capacity)', '항목 수', '지연 항목 수', '최대 제작 지연 (일)', '계약 초과 항목 수']
+SHIFTED_COLS = ['제작 계획 시작', '제작 계획 종료', '검사 계획 시작', '검사 계획 종료', '납품 계획 시작', '납품 계획 종료']
+_NEVER = -(1 << 62)
+
+
+def vendor_names(df):
+    # 항목별 업체 이름 (빈 값은 '')
+    if VENDOR_COL not in df.columns:
+        return np.full(len(df), '', dtype=object)
+    return df[VENDOR_COL].fillna('').astype(str).str.strip().to_numpy(dtype=object)
+
+
+def capacity_frame(df, capacities=None):
+    # 화면 편집용 표: 일정에 입력된 업체 목록 + 동시 제작 수 (기본 DEFAULT_CAPACITY)
+    capacities = capacities or {}
+    vendors = sorted({v for v in vendor_names(df) if v})
+    return pd.DataFrame({
+        CAPACITY_COLS[0]: vendors,
+        CAPACITY_COLS[1]: [capacities.get(v, DEFAULT_CAPACITY) for v in vendors],
+    })
+
+
+def capacities_from_frame(frame):
+    capacities = {}
+    for vendor, capacity in frame[CAPACITY_COLS].itertuples(index=False):
+        vendor = '' if vendor is None or pd.isna(vendor) else str(vendor).strip()
+        if not vendor:
+            continue
+        capacity = pd.to_numeric(pd.Series([capacity]), errors='coerce').fillna(DEFAULT_CAPACITY).iloc[0]
+        capacities[vendor] = max(1, int(capacity))
+    return capacities
+
+
+def list_schedule(release, duration, priority, pinned, capacity):
+    # 한 업체의 리스트 스케줄링. 입력은 release 오름차순 정렬. 반환: 시작 날짜 번호 목록
+    # pinned(진행 중) 항목은 release 그대로 시작하고 작업대만 차지한다.
+    release, duration, priority = release.tolist(), duration.tolist(), priority.tolist()
+    start = list(release)
+    slots = [_NEVER] * capacity  # 작업대별 비는 시점 (min-heap)
+    for j in np.flatnonzero(pinned).tolist():
+        heapq.heapreplace(slots, max(slots[0], release[j] + duration[j]))
+    queue = np.flatnonzero(~pinned).tolist()
+    ready = []
+    k = 0
+    now = _NEVER  # 현재 시점 (감소하지 않음): 작업대가 비고 대기 항목이 있는 가장 이른 날
+    while k < len(queue) or ready:
+        now = max(now, slots[0])
+        if not ready:
+            now = max(now, release[queue[k]])
+        while k < len(queue) and release[queue[k]] <= now:
+            j = queue[k]
+            heapq.heappush(ready, (priority[j], j))
+            k += 1
+        _, j = heapq.heappop(ready)
+        start[j] = now
+        heapq.heapreplace(slots, now + duration[j])
+    return start
+
+
+def level_manufacturing(df, capacities, contract_delivery_date=None, calendar=None):
+    # 업체 한도에 맞춰 제작 이후 계획 컬럼을 미룬다 (df 수정). calendar 가 있으면 지연/대비 일수는 근무일
+    # 반환: (df, 항목별 결과 DataFrame (LEVEL_COLS), 업체별 요약 DataFrame (VENDOR_SUMMARY_COLS))
+    vendors = vendor_names(df)
+    m_start = date_array(df, '제작 계획 시작').astype('datetime64[D]')
+    m_end = date_array(df, '제작 계획 종료').astype('datetime64[D]')
+    d_end = date_array(df, '납품 계획 종료').astype('datetime64[D]')
+    pinned = ~np.isnat(date_array(df, '제작 실적 시작'))
+    limited = np.array([v in capacities for v in vendors], dtype=bool)
+    rows = np.flatnonzero(limited & ~np.isnat(m_start) & ~np.isnat(m_end))
+
+    release = day_index(m_start[rows], calendar)
+    duration = np.maximum(day_index(m_end[rows], calendar) - release, 0)
+    tail = np.where(np.isnat(d_end[rows]), 0, day_count(m_end[rows], d_end[rows], calendar))
+    priority = -(duration + np.maximum(tail, 0))
+
+    # 업체별로 묶어 release 순 정렬 후 각각 리스트 스케줄링
+    codes, names = pd.factorize(vendors[rows])
+    order = np.lexsort((release, codes))
+    bounds = np.searchsorted(codes[order], np.arange(len(names) + 1))
+    start = release.copy()
+    for g, name in enumerate(names):
+        idx = order[bounds[g]:bounds[g + 1]]
+        start[idx] = list_schedule(release[idx], duration[idx], priority[idx], pinned[rows][idx], capacities[name])
+    shift = np.zeros(len(df), dtype='int64')
+    shift[rows] = start - release
+
+    # 제작/검사/납품 계획을 밀린 날짜 번호만큼 이동 (달력이 있으면 근무일 기준)
+    moved = shift > 0
+    planned = {}
+    for col in SHIFTED_COLS:
+        values = date_array(df, col).astype('datetime64[D]')
+        ok = moved & ~np.isnat(values)
+        values[ok] = index_day(day_index(values[ok], calendar) + shift[ok], calendar)
+        planned[col] = values
+    write_plan_columns(df, planned, np.ones(len(df), dtype=bool))
+
+    new_end = planned['납품 계획 종료']
+    if contract_delivery_date is not None:
+        target = np.datetime64(to_date(contract_delivery_date), 'D')
+        before = np.where(np.isnat(d_end), np.nan, day_count(target, d_end, calendar))
+        after = np.where(np.isnat(new_end), np.nan, day_count(target, new_end, calendar))
+    else:
+        before = after = np.full(len(df), np.nan)
+
+    names_col = df['항목 (Item)'].to_numpy(dtype=object) if '항목 (Item)' in df.columns else np.full(len(df), None, dtype=object)
+    table = pd.DataFrame({
+        'No.': rows + 1,
+        '항목 (Item)': names_col[rows],
+        '제작 업체 (Vendor)': vendors[rows],
+        '제작 시작 (평준화 전)': m_start[rows],
+        '제작 시작 (평준화)': planned['제작 계획 시작'][rows],
+        '제작 지연 (일)': shift[rows],
+        '납품 종료 (평준화)': new_end[rows],
+        '계약 대비 전 (일)': before[rows],
+        '계약 대비 (일)': after[rows],
+    }, columns=LEVEL_COLS)
+    for col in ['제작 시작 (평준화 전)', '제작 시작 (평준화)', '납품 종료 (평준화)']:
+        table[col] = pd.to_datetime(table[col]).dt.date
+
+    flags = table.assign(**{'지연': table['제작 지연 (일)'] > 0, '초과': table['계약 대비 (일)'] > 0})
+    summary = flags.groupby('제작 업체 (Vendor)', sort=True).agg(**{
+        '항목 수': ('No.', 'size'),
+        '지연 항목 수': ('지연', 'sum'),
+        '최대 제작 지연 (일)': ('제작 지연 (일)', 'max'),
+        '계약 초과 항목 수': ('초과', 'sum'),
+    }).reset_index()
+    summary.insert(1, '동시 제작 수 (Capacity)', summary['제작 업체 (Vendor)'].map(capacities))
+    table = table.sort_values(['제작 업체 (Vendor)', '제작 시작 (평준화)'], kind='stable').reset_index(drop=True)
+    return df, table, summary
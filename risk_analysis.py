@@ -0,0 +1,147 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from delay_analysis import phase_slippage, to_date
+from progress_engine import date_array
+from work_calendar import day_count, day_index, index_day
+
+# 일정 위험 분석 (Monte Carlo Schedule Risk)
+# 단계별 기간을 삼각분포(최소/최빈/최대)로 보고 항목별 납품 종료일을 수만 번 모의한다.
+# 최빈값은 계획 기간(Auto Plan 규칙: 구매 15일, 설계 120일, 제작 = 제작 기간(주), 검사 14일, 납품 7일),
+# 최소/최대는 최빈값 대비 단계별 비율(RISK_RANGES, 화면에서 변경 가능).
+# 단계는 순차이므로 모의 납품 종료 = 계획 납품 종료 + 단계별 (표본 - 최빈) 합. 실적 종료된 단계는 실제 지연만 반영 (불확실성 없음).
+# 반복 x 항목 배열을 묶음(chunk) 단위로 만들어 메모리를 제한하고, 항목별 결과는 일 단위 히스토그램에 누적해
+# 분위수(P50/P80/P90)와 계약 납품일 준수 확률을 계산한다. 반복은 고정 크기 조각(시드 분할)으로 나눠
+# 큰 계산은 프로세스 풀에서 돌린다 (워커 수와 관계없이 같은 시드면 같은 결과).
+
+RISK_RANGES = {
+    '구매 (Procurement)': {'min_pct': 80, 'max_pct': 150},
+    '설계 (Design)': {'min_pct': 85, 'max_pct': 140},
+    '제작 (Manufacturing)': {'min_pct': 90, 'max_pct': 160},
+    '검사 (Inspection)': {'min_pct': 90, 'max_pct': 130},
+    '납품 (Delivery)': {'min_pct': 100, 'max_pct': 150},
+}
+PERCENTILES = (50, 80, 90)
+RISK_COLS = ['No.', '항목 (Item)', '계획 납품 종료', 'P50', 'P80', 'P90', '계약 준수 확률 (%)']
+PART_ITERATIONS = 10_000     # 시드 조각당 반복 수 (프로세스 풀 작업 단위)
+CHUNK_CELLS = 2_000_000      # 묶음당 반복 x 항목 수 (float32 배열 하나 8MB)
+PARALLEL_CELLS = 20_000_000  # 반복 x 항목이 이보다 크면 프로세스 풀 사용 (workers=None)
+
+
+def risk_ranges_frame(ranges=RISK_RANGES):
+    # 화면 편집용 표 (단계, 최소 %, 최대 %)
+    return pd.DataFrame([
+        {'단계 (Phase)': phase, '최소 (%)': v['min_pct'], '최대 (%)': v['max_pct']}
+        for phase, v in ranges.items()
+    ])
+
+
+def risk_ranges_from_frame(frame):
+    ranges = {}
+    for phase, low, high in frame[['단계 (Phase)', '최소 (%)', '최대 (%)']].itertuples(index=False):
+        low, high = pd.to_numeric(pd.Series([low, high]), errors='coerce').fillna(100)
+        low = min(max(0.0, float(low)), 100.0)
+        ranges[phase] = {'min_pct': low, 'max_pct': max(100.0, float(high))}
+    return ranges
+
+
+def phase_triangles(df, phases, ranges=RISK_RANGES, calendar=None):
+    # 모의 대상 항목(계획 납품 종료가 있는 행)과 단계별 삼각분포 (최소, 최빈, 최대) [항목 x 단계]
+    # 반환: (행 위치, 기준 날짜 번호 = 계획 납품 종료 + 실적 종료 단계 지연, 최소, 최빈, 최대)
+    d_end = date_array(df, '납품 계획 종료').astype('datetime64[D]')
+    rows = np.flatnonzero(~np.isnat(d_end))
+    sub = df.iloc[rows]
+    slip, _, _ = phase_slippage(sub, phases, calendar)
+    base = day_index(d_end[rows], calendar) + slip.sum(axis=1)
+
+    mode = np.zeros((len(rows), len(phases)), dtype=np.float32)
+    low, high = mode.copy(), mode.copy()
+    for k, (phase_name, p_start, p_end, _, _, a_end) in enumerate(phases):
+        p_s, p_e = date_array(sub, p_start).astype('datetime64[D]'), date_array(sub, p_end).astype('datetime64[D]')
+        duration = np.maximum(day_count(p_s, p_e, calendar), 0)
+        limit = ranges.get(phase_name, {'min_pct': 100, 'max_pct': 100})
+        open_phase = np.isnat(date_array(sub, a_end))
+        mode[:, k] = duration
+        low[:, k] = np.where(open_phase, duration * limit['min_pct'] / 100.0, duration)
+        high[:, k] = np.where(open_phase, duration * limit['max_pct'] / 100.0, duration)
+    return rows, base, low, mode, high
+
+
+def _triangular_deviation(rng, low, mode, high, n):
+    # 항목별 (표본 기간 - 최빈) 의 단계 합 [n x 항목], 역누적분포(inverse CDF) 로 한 번에 추출
+    total = np.zeros((n, low.shape[0]), dtype=np.float32)
+    for k in range(low.shape[1]):
+        a, c, b = low[:, k], mode[:, k], high[:, k]
+        width = b - a
+        if not width.any():
+            continue
+        split = np.divide(c - a, width, out=np.zeros_like(width), where=width > 0)
+        u = rng.random((n, len(a)), dtype=np.float32)
+        left = u < split
+        root = np.sqrt(np.where(left, u * (width * (c - a)), (1 - u) * (width * (b - c))))
+        total += np.where(left, (a - c) + root, (b - c) - root)
+    return total
+
+
+def _simulate_part(low, mode, high, base, lo, width, n, seed):
+    # 시드 조각 하나: 항목별 일 단위 히스토그램 [항목 x width] 과 반복별 프로젝트 완료 날짜 번호
+    rng = np.random.default_rng(seed)
+    m = low.shape[0]
+    counts = np.zeros(m * width, dtype=np.int64)
+    offsets = np.arange(m, dtype=np.int64) * width - lo
+    project = []
+    step = max(1, CHUNK_CELLS // max(m, 1))
+    for done in range(0, n, step):
+        dev = np.rint(_triangular_deviation(rng, low, mode, high, min(step, n - done))).astype(np.int64)
+        counts += np.bincount((dev + offsets).ravel(), minlength=m * width)
+        project.append((dev + base).max(axis=1))
+    return counts.reshape(m, width), np.concatenate(project)
+
+
+def simulate_risk(df, phases, contract_delivery_date=None, iterations=10_000, ranges=RISK_RANGES, seed=0, workers=None, calendar=None):
+    # 반환: (항목별 결과 DataFrame (RISK_COLS), 프로젝트 요약 dict) - 모의 대상 항목이 없으면 (빈 표, None)
+    # 요약: iterations, plan(계획 완료일), P50/P80/P90, probability(계약 준수 확률 %, 계약일 없으면 None)
+    rows, base, low, mode, high = phase_triangles(df, phases, ranges, calendar)
+    if len(rows) == 0 or iterations <= 0:
+        return pd.DataFrame(columns=RISK_COLS), None
+    lo = np.floor((low - mode).sum(axis=1)).astype(np.int64)
+    width = int((np.ceil((high - mode).sum(axis=1)).astype(np.int64) - lo).max()) + 1
+
+    sizes = [min(PART_ITERATIONS, iterations - i) for i in range(0, iterations, PART_ITERATIONS)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if workers is None:
+        workers = (os.cpu_count() or 1) if iterations * len(rows) >= PARALLEL_CELLS else 1
+    args = [(low, mode, high, base, lo, width, n, s) for n, s in zip(sizes, seeds)]
+    if workers <= 1 or len(sizes) == 1:
+        parts = [_simulate_part(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(sizes))) as pool:
+            parts = list(pool.map(_simulate_part, *zip(*args)))
+    counts = sum(p[0] for p in parts)
+    project = np.concatenate([p[1] for p in parts])
+
+    # 히스토그램 누적분포 -> 분위수 (F(x) >= q 인 가장 이른 날), 계약일까지 완료 확률
+    cdf = np.cumsum(counts, axis=1)
+    names = df['항목 (Item)'].to_numpy(dtype=object)[rows] if '항목 (Item)' in df.columns else np.full(len(rows), None, dtype=object)
+    table = pd.DataFrame({
+        'No.': rows + 1,
+        '항목 (Item)': names,
+        '계획 납품 종료': date_array(df, '납품 계획 종료').astype('datetime64[D]')[rows],
+    })
+    summary = {'iterations': iterations, 'plan': pd.Timestamp(table['계획 납품 종료'].max()).date(), 'probability': None}
+    for q in PERCENTILES:
+        k = np.argmax(cdf >= np.ceil(q / 100.0 * iterations), axis=1)
+        table[f'P{q}'] = index_day(base + lo + k, calendar)
+        summary[f'P{q}'] = index_day(np.percentile(project, q, method='inverted_cdf'), calendar).item()
+    if contract_delivery_date is not None:
+        target = int(day_index(np.datetime64(to_date(contract_delivery_date), 'D'), calendar, roll='backward'))
+        within = np.clip(target - base - lo, -1, width - 1)
+        met = np.where(within >= 0, cdf[np.arange(len(rows)), np.maximum(within, 0)], 0)
+        table['계약 준수 확률 (%)'] = met / iterations * 100.0
+        summary['probability'] = float((project <= target).mean() * 100.0)
+    for col in ['계획 납품 종료'] + [f'P{q}' for q in PERCENTILES]:
+        table[col] = pd.to_datetime(table[col]).dt.date
+    return table.reindex(columns=RISK_COLS), summary
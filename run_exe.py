@@ -1,6 +1,11 @@
+import multiprocessing
 import os
 import sys
-import streamlit.web.cli as stcli
+
+from startup import mark_launch
+
+mark_launch()  # 시작 시간 측정 기준 (streamlit import 전, startup.py)
+import streamlit.web.cli as stcli  # noqa: E402
 
 def resolve_path(path):
     if getattr(sys, "frozen", False):
@@ -10,6 +15,8 @@ def resolve_path(path):
     return os.path.join(basedir, path)
 
 if __name__ == "__main__":
+    # 포트폴리오 집계용 프로세스 풀 (PyInstaller 번들에서 필요)
+    multiprocessing.freeze_support()
     app_path = resolve_path("app.py")
     sys.argv = [
         "streamlit",
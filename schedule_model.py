@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+
+# 일정 데이터 모델 (Schedule Data Model)
+# 날짜 컬럼은 datetime64 (일 단위, 결측은 NaT), 금액/가중치/진도율 컬럼은 float 로 유지한다.
+# 외부 입력(업로드, data_editor)은 normalize_schedule 에서 한 번만 검증/변환하고,
+# data_editor 에 넘길 때만 to_editor_frame 으로 date 객체로 바꾼다.
+
+# 단계 정의 (순서 변경: 구매 -> 설계)
+PHASES_INFO = [
+    ('구매 (Procurement)', '구매 계획 시작', '구매 계획 종료', '구매 실적 시작', '구매 진행률 (%)', '구매 실적 종료'),
+    ('설계 (Design)', '설계 계획 시작', '설계 계획 종료', '설계 실적 시작', '설계 진행률 (%)', '설계 실적 종료'),
+    ('제작 (Manufacturing)', '제작 계획 시작', '제작 계획 종료', '제작 실적 시작', '제작 진행률 (%)', '제작 실적 종료'),
+    ('검사 (Inspection)', '검사 계획 시작', '검사 계획 종료', '검사 실적 시작', '검사 진행률 (%)', '검사 실적 종료'),
+    ('납품 (Delivery)', '납품 계획 시작', '납품 계획 종료', '납품 실적 시작', '납품 진행률 (%)', '납품 실적 종료'),
+]
+
+# 단계별 색상 (Pastel Tones, 간트 차트 공용)
+PHASE_COLORS = {
+    '구매 (Procurement)': '#A0C4FF',       # Pastel Blue
+    '설계 (Design)': '#9BF6FF',            # Pastel Cyan
+    '제작 (Manufacturing)': '#FFADAD',     # Pastel Red
+    '검사 (Inspection)': '#FFD6A5',        # Pastel Orange
+    '납품 (Delivery)': '#CAFFBF'           # Pastel Green
+}
+
+PREDECESSOR_COL = '선행 항목 (Predecessors)'
+VENDOR_COL = '제작 업체 (Vendor)'
+
+ALL_DATE_COLS = []
+ALL_PROG_COLS = []
+for p in PHASES_INFO:
+    ALL_DATE_COLS.extend([p[1], p[2], p[3], p[5]])
+    ALL_PROG_COLS.append(p[4])
+
+# 컬럼 순서 (phases_info 순서대로 날짜 컬럼 정렬)
+ORDERED_COLUMNS = ['항목 (Item)', '금액 (Amount)', '제작 기간 (Weeks)', PREDECESSOR_COL, VENDOR_COL, '가중치 (Weight)', '전월 계획 (Plan Prev)', '전월 실적 (Actual Prev)', '금월 계획 (Plan Curr)', '금월 실적 (Actual Curr)']
+for p in PHASES_INFO:
+    ORDERED_COLUMNS.extend([p[1], p[2], p[3], p[4], p[5]])
+
+# 결측 시 0 으로 채우는 숫자 컬럼 / 결측을 그대로 두는 숫자 컬럼
+ZERO_FILLED_COLS = ['금액 (Amount)', '가중치 (Weight)', '전월 계획 (Plan Prev)', '전월 실적 (Actual Prev)', '금월 계획 (Plan Curr)', '금월 실적 (Actual Curr)']
+NULLABLE_NUM_COLS = ['제작 기간 (Weeks)'] + ALL_PROG_COLS
+TEXT_COLS = ['항목 (Item)', PREDECESSOR_COL, VENDOR_COL]
+
+
+def to_float(series):
+    # '1,000' / '50%' 같은 문자열 입력 -> float (해석 불가 시 NaN)
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series.astype(float)
+    s = series.astype(str).str.replace('%', '').str.replace(',', '').str.strip()
+    out = pd.to_numeric(s, errors='coerce').astype(float)
+    return out.where(series.notna(), np.nan)
+
+
+def to_day(series):
+    # 날짜/문자열 -> datetime64[ns] (자정 기준, 결측/해석 불가 시 NaT)
+    if not pd.api.types.is_datetime64_any_dtype(series):
+        series = pd.to_datetime(series, errors='coerce')
+    if getattr(series.dt, 'tz', None) is not None:
+        series = series.dt.tz_localize(None)
+    return series.dt.normalize().astype('datetime64[ns]')
+
+
+def normalize_schedule(df):
+    # 경계 검증: 누락 컬럼 생성, 타입 변환, 컬럼 순서 강제. 반환: (정규화된 DataFrame, 경고 목록)
+    issues = []
+    n = len(df)
+    out = {}
+    for col in ORDERED_COLUMNS:
+        if col in df.columns:
+            s = df[col]
+        elif col in TEXT_COLS:
+            s = pd.Series([None] * n, index=df.index, dtype=object)
+        elif col in ALL_DATE_COLS:
+            s = pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+        else:
+            # 금액, 진행률 컬럼 기본값 0
+            s = pd.Series(0.0 if (col == '금액 (Amount)' or col in ALL_PROG_COLS) else np.nan, index=df.index, dtype=float)
+
+        if col in ALL_DATE_COLS:
+            typed = to_day(s)
+        elif col in ZERO_FILLED_COLS or col in NULLABLE_NUM_COLS:
+            typed = to_float(s)
+        else:
+            out[col] = s.astype(object).where(s.notna(), None)
+            continue
+
+        lost = int((typed.isna() & s.notna() & (s.astype(str).str.strip() != '')).sum())
+        if lost:
+            issues.append(f"'{col}' 컬럼의 값 {lost}개를 해석할 수 없어 비웠습니다.")
+        if col in ZERO_FILLED_COLS:
+            typed = typed.fillna(0.0)
+        out[col] = typed
+
+    return pd.DataFrame(out, index=df.index), issues
+
+
+def is_normalized(df):
+    # 이미 정규화된 프레임인지 (컬럼 순서 + dtype) 빠르게 확인
+    if list(df.columns) != ORDERED_COLUMNS:
+        return False
+    dtypes = df.dtypes
+    return (all(dtypes[c] == 'datetime64[ns]' for c in ALL_DATE_COLS)
+            and all(dtypes[c] == float for c in ZERO_FILLED_COLS + NULLABLE_NUM_COLS))
+
+
+def to_editor_frame(df):
+    # data_editor 용: 날짜 컬럼만 date 객체(object)로 변환
+    editor_df = df.copy()
+    for col in ALL_DATE_COLS:
+        editor_df[col] = editor_df[col].dt.date.astype(object).where(editor_df[col].notna(), None)
+    return editor_df
+
+
+def new_schedule(items_map):
+    # 기본 항목 리스트로 빈 일정 생성 (매핑된 제작 기간 적용, 없으면 0)
+    items = list(items_map.keys())
+    df = pd.DataFrame({
+        '항목 (Item)': items,
+        '제작 기간 (Weeks)': [items_map.get(item, 0) for item in items],
+    })
+    return normalize_schedule(df)[0]
@@ -0,0 +1,269 @@
+import re
+import numpy as np
+import pandas as pd
+from datetime import date
+
+from schedule_model import PREDECESSOR_COL
+from work_calendar import day_index, index_day, workdays_per_week
+
+# 자동 스케줄링 엔진 (Batch Auto Plan)
+# 모든 항목의 단계별 계획 시작/종료일을 datetime64[D] 배열로 한 번에 계산한다.
+
+# 단계별 고정 기간/간격 (일, 근무일 달력을 쓰면 근무일)
+PHASE_OFFSETS = {
+    'procurement': 15,      # 1. 구매 (15일)
+    'design_gap': 3,        # 2. 설계 - 구매 종료 + 3일 후 시작
+    'design': 120,          #    설계 (120일)
+    'manufacturing_gap': 1, # 3. 제작 - 설계 종료 + 1일 후 시작
+    'inspection_gap': 1,    # 4. 검사 - 제작 종료(없으면 설계 종료) + 1일 후 시작
+    'inspection': 14,       #    검사 (14일)
+    'delivery_gap': 7,      # 5. 납품 - 검사 종료 + 7일 후 시작
+    'delivery': 7,          #    납품 (7일)
+}
+
+PLAN_COLS = [
+    '구매 계획 시작', '구매 계획 종료',
+    '설계 계획 시작', '설계 계획 종료',
+    '제작 계획 시작', '제작 계획 종료',
+    '검사 계획 시작', '검사 계획 종료',
+    '납품 계획 시작', '납품 계획 종료',
+]
+
+
+def to_day(value):
+    # date / Timestamp / 문자열 -> numpy datetime64[D]
+    if isinstance(value, pd.Timestamp):
+        value = value.date()
+    elif not isinstance(value, date):
+        value = pd.to_datetime(value).date()
+    return np.datetime64(value, 'D')
+
+
+def parse_weeks(df):
+    # 제작 기간 (Weeks) -> (주 배열, 유효 여부 배열). 빈 값은 0주, 해석 불가한 값은 무효
+    n = len(df)
+    if '제작 기간 (Weeks)' not in df.columns:
+        return np.zeros(n), np.ones(n, dtype=bool)
+    raw = df['제작 기간 (Weeks)']
+    blank = raw.isna().to_numpy() | (raw.astype(str).str.strip() == '').to_numpy()
+    weeks = pd.to_numeric(raw, errors='coerce').to_numpy(dtype=float)
+    valid = blank | ~np.isnan(weeks)
+    return np.where(blank | ~valid, 0.0, weeks), valid
+
+
+def plan_phase_dates(base_start, manuf_weeks, calendar=None):
+    # 단계별 계획일 배열 계산 (모든 배열은 datetime64[D], 제작 없음은 NaT)
+    # 날짜 번호(work_calendar.day_index) 공간에서 더한 뒤 한 번에 날짜로 변환. 달력이 있으면 기간/간격은 근무일
+    o = PHASE_OFFSETS
+    n = len(manuf_weeks)
+    to_dates = lambda idx: index_day(idx, calendar)
+
+    p_start = np.full(n, day_index(base_start, calendar), dtype='int64')
+    p_end = p_start + o['procurement']
+
+    d_start = p_end + o['design_gap']
+    d_end = d_start + o['design']
+
+    has_manuf = manuf_weeks > 0
+    manuf_days = np.trunc(np.where(has_manuf, manuf_weeks, 0) * workdays_per_week(calendar)).astype('int64')
+    m_start = d_end + o['manufacturing_gap']
+    m_end = m_start + manuf_days
+
+    base_for_insp = np.where(has_manuf, m_end, d_end)
+    i_start = base_for_insp + o['inspection_gap']
+    i_end = i_start + o['inspection']
+
+    del_start = i_end + o['delivery_gap']
+    del_end = del_start + o['delivery']
+
+    nat = np.datetime64('NaT')
+    return dict(zip(PLAN_COLS, [
+        to_dates(p_start), to_dates(p_end), to_dates(d_start), to_dates(d_end),
+        np.where(has_manuf, to_dates(m_start), nat), np.where(has_manuf, to_dates(m_end), nat),
+        to_dates(i_start), to_dates(i_end), to_dates(del_start), to_dates(del_end),
+    ]))
+
+
+def auto_schedule(df, start_date, calendar=None):
+    # 전체 항목 일괄 계산 후 컬럼당 한 번씩 대입한다.
+    # 제작 기간을 해석할 수 없는 행은 기존 값을 유지한다 (invalid rows: parse_weeks).
+    # calendar: work_calendar.make_calendar 결과 (None 이면 달력일)
+    base_start = to_day(start_date)
+    manuf_weeks, valid = parse_weeks(df)
+    return write_plan_columns(df, plan_phase_dates(base_start, manuf_weeks, calendar), valid)
+
+
+def write_plan_columns(df, planned, valid):
+    # {컬럼: datetime64[D] 배열} 을 컬럼당 한 번에 대입 (valid 가 False 인 행은 기존 값 유지)
+    for col, values in planned.items():
+        if not valid.all():
+            if col in df.columns:
+                existing = pd.to_datetime(df[col], errors='coerce').to_numpy(dtype='datetime64[D]')
+            else:
+                existing = np.datetime64('NaT')
+            values = np.where(valid, values, existing)
+        df[col] = pd.Series(values, index=df.index, dtype='datetime64[ns]')
+    return df
+
+
+# --- 선행관계 기반 CPM 스케줄링 (Critical Path Method) ---
+# 항목별 5개 단계를 액티비티로, 단계 간 간격과 항목 간 선행관계를 FS(Finish-to-Start) 링크로 본다.
+# 선행 항목 컬럼 예: "Piping Spool" 또는 "Catalyst Structure@납품" (@ 뒤는 이 항목에서 대기하는 단계, 기본은 제작)
+
+PHASE_KEYS = ['구매', '설계', '제작', '검사', '납품']
+PHASE_ALIASES = {
+    '구매': 0, 'proc': 0,
+    '설계': 1, 'design': 1,
+    '제작': 2, 'manuf': 2, 'mfg': 2,
+    '검사': 3, 'insp': 3,
+    '납품': 4, 'deliv': 4,
+}
+DEFAULT_LINK_PHASE = 2
+LINK_LAG_DAYS = 1  # 선행 항목 납품 종료 + 1일 후 시작
+
+
+def parse_predecessors(value):
+    # "A, B@납품" -> [('A', None), ('B', 4)]
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return []
+    links = []
+    for token in re.split(r'[,;\n]', str(value)):
+        token = token.strip()
+        if not token:
+            continue
+        name, _, phase = token.rpartition('@') if '@' in token else (token, '', '')
+        phase_idx = None
+        key = phase.strip().lower()
+        if key:
+            phase_idx = next((idx for alias, idx in PHASE_ALIASES.items() if key.startswith(alias)), None)
+            if phase_idx is None:
+                raise ValueError(f"선행 항목 '{token}' 의 단계 '{phase}' 를 알 수 없습니다. (사용 가능: {', '.join(PHASE_KEYS)})")
+        links.append((name.strip(), phase_idx))
+    return links
+
+
+def critical_path_schedule(df, start_date, contract_delivery_date=None, calendar=None):
+    # 위상 정렬 + Forward/Backward Pass 로 ES/EF/LS/LF 및 Total Float 계산 (O(V+E))
+    # 반환: (계획 컬럼이 갱신된 df, 액티비티별 결과 DataFrame, 경고 목록)
+    # calendar 가 있으면 날짜 번호가 근무일 번호라 기간/간격/여유(Float)가 모두 근무일 단위
+    o = PHASE_OFFSETS
+    base = int(day_index(to_day(start_date), calendar))
+    manuf_weeks, valid = parse_weeks(df)
+    n = len(df)
+    items = df['항목 (Item)'].tolist() if '항목 (Item)' in df.columns else [None] * n
+
+    manuf_days = np.trunc(np.where(manuf_weeks > 0, manuf_weeks, 0) * workdays_per_week(calendar)).astype('int64')
+    has_manuf = manuf_weeks > 0
+
+    # 액티비티 id = 행 위치 * 5 + 단계 (제작 없는 항목은 제작 액티비티 없음)
+    durations = np.zeros(n * 5, dtype='int64')
+    durations[0::5] = o['procurement']
+    durations[1::5] = o['design']
+    durations[2::5] = manuf_days
+    durations[3::5] = o['inspection']
+    durations[4::5] = o['delivery']
+    exists = np.ones(n * 5, dtype=bool)
+    exists[2::5] = has_manuf
+
+    succ = [[] for _ in range(n * 5)]
+    indeg = [0] * (n * 5)
+
+    def link(u, v, lag):
+        succ[u].append((v, lag))
+        indeg[v] += 1
+
+    for r in range(n):
+        a = r * 5
+        link(a, a + 1, o['design_gap'])
+        if has_manuf[r]:
+            link(a + 1, a + 2, o['manufacturing_gap'])
+            link(a + 2, a + 3, o['inspection_gap'])
+        else:
+            link(a + 1, a + 3, o['inspection_gap'])
+        link(a + 3, a + 4, o['delivery_gap'])
+
+    # 항목 간 선행관계
+    warnings = []
+    if PREDECESSOR_COL in df.columns:
+        rows_by_name = {}
+        for r, name in enumerate(items):
+            if name is not None and not pd.isna(name):
+                rows_by_name.setdefault(str(name).strip(), []).append(r)
+        for r, value in enumerate(df[PREDECESSOR_COL].tolist()):
+            for name, phase_idx in parse_predecessors(value):
+                target = DEFAULT_LINK_PHASE if phase_idx is None else phase_idx
+                if target == 2 and not has_manuf[r]:
+                    target = 3  # 제작이 없으면 검사가 대기
+                pred_rows = rows_by_name.get(name)
+                if not pred_rows:
+                    warnings.append(f"'{items[r]}' 의 선행 항목 '{name}' 을(를) 찾을 수 없습니다.")
+                    continue
+                for pr in pred_rows:
+                    link(pr * 5 + 4, r * 5 + target, LINK_LAG_DAYS)
+
+    # 위상 정렬 (Kahn) - 정렬되지 않은 액티비티가 남으면 순환
+    order = [v for v in range(n * 5) if indeg[v] == 0 and exists[v]]
+    indeg_left = list(indeg)
+    head = 0
+    while head < len(order):
+        u = order[head]
+        head += 1
+        for v, _ in succ[u]:
+            indeg_left[v] -= 1
+            if indeg_left[v] == 0:
+                order.append(v)
+    if len(order) < int(exists.sum()):
+        cyclic = sorted({str(items[v // 5]) for v in range(n * 5) if exists[v] and indeg_left[v] > 0})
+        raise ValueError(f"선행관계에 순환이 있습니다: {', '.join(cyclic)}")
+
+    # Forward Pass
+    dur = durations.tolist()
+    es = [base] * (n * 5)
+    for u in order:
+        ef_u = es[u] + dur[u]
+        for v, lag in succ[u]:
+            if ef_u + lag > es[v]:
+                es[v] = ef_u + lag
+    ef = [es[u] + dur[u] for u in range(n * 5)]
+
+    # Backward Pass (기준: 계약 납품일(비근무일이면 직전 근무일), 없으면 프로젝트 완료일)
+    if contract_delivery_date is not None:
+        horizon = int(day_index(to_day(contract_delivery_date), calendar, roll='backward'))
+    else:
+        horizon = max((ef[u] for u in order), default=base)
+    lf = [horizon] * (n * 5)
+    for u in reversed(order):
+        for v, lag in succ[u]:
+            ls_v = lf[v] - dur[v] - lag
+            if ls_v < lf[u]:
+                lf[u] = ls_v
+
+    es = np.array(es, dtype='int64')
+    ef = np.array(ef, dtype='int64')
+    lf = np.array(lf, dtype='int64')
+    ls = lf - durations
+    total_float = ls - es
+
+    # 계획 컬럼 반영 (early dates). 제작 기간을 해석할 수 없는 행은 기존 값 유지
+    exists_2d = exists.reshape(n, 5)
+    starts = np.where(exists_2d, index_day(es, calendar).reshape(n, 5), np.datetime64('NaT'))
+    ends = np.where(exists_2d, index_day(ef, calendar).reshape(n, 5), np.datetime64('NaT'))
+    planned = {}
+    for k in range(5):
+        planned[PLAN_COLS[2 * k]] = starts[:, k]
+        planned[PLAN_COLS[2 * k + 1]] = ends[:, k]
+    write_plan_columns(df, planned, valid)
+
+    idx = np.flatnonzero(exists)
+    cpm_df = pd.DataFrame({
+        '항목 (Item)': [items[v // 5] for v in idx],
+        '단계 (Phase)': [PHASE_KEYS[v % 5] for v in idx],
+        'ES': index_day(es[idx], calendar),
+        'EF': index_day(ef[idx], calendar),
+        'LS': index_day(ls[idx], calendar),
+        'LF': index_day(lf[idx], calendar),
+        'Total Float (일)': total_float[idx],
+    })
+    # 최소 여유(float)를 가진 액티비티가 주공정 (계약 납품일 기준이면 음수일 수 있음)
+    cpm_df['Critical'] = cpm_df['Total Float (일)'] == cpm_df['Total Float (일)'].min()
+    return df, cpm_df, warnings
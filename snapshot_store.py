@@ -0,0 +1,150 @@
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from progress_engine import PROGRESS_COLS
+
+# 월 마감 스냅샷 (Monthly Snapshot Store)
+# 월 마감 시점의 항목별 진도율(가중치, 전월/금월 계획·실적, 월간 진도)과 전체 계획/실적 공정률을
+# 로컬 SQLite 파일에 저장한다. 전월 실적을 날짜에서 다시 계산하지 않고 마감 값 그대로 읽을 수 있다.
+# 항목 표는 (프로젝트, 월, 항목 키) 기본 키의 WITHOUT ROWID 표라 한 달 읽기는 인덱스 범위 읽기 (O(항목 수)).
+# 월간 변화량은 두 달 스냅샷을 항목 키로 조인해서 계산한다 (이력 재계산 없음).
+
+SNAPSHOT_PATH = os.path.join(os.path.expanduser('~'), '.sch_tool_cache', 'snapshots.sqlite')
+
+SNAPSHOT_COLS = ['금액 (Amount)', '가중치 (Weight)'] + PROGRESS_COLS + ['월간 진도 (Monthly Progress)']
+LIST_COLS = ['월 (Month)', '기준일 (As-of)', '계획 공정률 (Plan)', '실적 공정률 (Actual)', '항목 수 (Items)', '저장 시각 (Saved)']
+_DB_COLS = ['amount', 'weight', 'actual_curr', 'actual_prev', 'plan_curr', 'plan_prev', 'monthly']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS months (
+    project TEXT NOT NULL,
+    month TEXT NOT NULL,
+    as_of TEXT NOT NULL,
+    overall_plan REAL,
+    overall_actual REAL,
+    items INTEGER,
+    saved_at TEXT,
+    PRIMARY KEY (project, month)
+);
+CREATE TABLE IF NOT EXISTS items (
+    project TEXT NOT NULL,
+    month TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    pos INTEGER,
+    item TEXT,
+    amount REAL, weight REAL, actual_curr REAL, actual_prev REAL, plan_curr REAL, plan_prev REAL, monthly REAL,
+    PRIMARY KEY (project, month, item_key)
+) WITHOUT ROWID;
+"""
+
+
+def month_key(value):
+    # 날짜 -> 'YYYY-MM'
+    return pd.Timestamp(value).strftime('%Y-%m')
+
+
+def item_keys(names):
+    # 조인 키: 항목 이름 (같은 이름이 여러 번이면 두 번째부터 '이름#2', '이름#3' ...)
+    s = pd.Series(names, dtype=object).fillna('').astype(str).str.strip()
+    n = s.groupby(s).cumcount().to_numpy() + 1
+    return np.where(n > 1, s + '#' + n.astype(str), s)
+
+
+def connect(path=SNAPSHOT_PATH):
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def save_snapshot(df, project_name, as_of, overall_plan, overall_actual, path=SNAPSHOT_PATH):
+    # as_of 가 속한 달의 스냅샷 저장 (같은 달이 이미 있으면 교체). df: update_derived 로 계산된 일정
+    month = month_key(as_of)
+    names = df['항목 (Item)'].fillna('').astype(str).str.strip()
+    valid = (names != '').to_numpy()
+    values = [pd.to_numeric(df[col], errors='coerce').fillna(0).to_numpy(dtype=float)[valid] for col in SNAPSHOT_COLS]
+    rows = zip([project_name] * int(valid.sum()), [month] * int(valid.sum()), item_keys(names[valid]),
+               range(int(valid.sum())), names[valid], *values)
+    with closing(connect(path)) as conn, conn:
+        conn.execute("DELETE FROM items WHERE project = ? AND month = ?", (project_name, month))
+        conn.executemany(f"INSERT INTO items VALUES ({', '.join('?' * (5 + len(_DB_COLS)))})", rows)
+        conn.execute(
+            "INSERT OR REPLACE INTO months VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (project_name, month, pd.Timestamp(as_of).strftime('%Y-%m-%d'), float(overall_plan), float(overall_actual),
+             int(valid.sum()), datetime.now().isoformat(timespec='seconds'))
+        )
+    return month
+
+
+def list_snapshots(project_name, path=SNAPSHOT_PATH):
+    # 저장된 월 목록 (최근 월부터)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=LIST_COLS)
+    with closing(connect(path)) as conn:
+        rows = conn.execute(
+            "SELECT month, as_of, overall_plan, overall_actual, items, saved_at FROM months WHERE project = ? ORDER BY month DESC",
+            (project_name,)
+        ).fetchall()
+    return pd.DataFrame(rows, columns=LIST_COLS)
+
+
+def load_snapshot(project_name, month, path=SNAPSHOT_PATH):
+    # 한 달 스냅샷 읽기 (재계산 없음). 반환: 항목 DataFrame (항목 키 포함, 저장 순서)
+    with closing(connect(path)) as conn:
+        rows = conn.execute(
+            f"SELECT item_key, item, {', '.join(_DB_COLS)} FROM items WHERE project = ? AND month = ? ORDER BY pos",
+            (project_name, month)
+        ).fetchall()
+    if not rows:
+        raise ValueError(f"'{project_name}' 의 {month} 스냅샷이 없습니다.")
+    return pd.DataFrame(rows, columns=['항목 키 (Key)', '항목 (Item)'] + SNAPSHOT_COLS)
+
+
+def previous_month(month):
+    return (pd.Period(month, freq='M') - 1).strftime('%Y-%m')
+
+
+def snapshot_delta(project_name, month, base_month=None, path=SNAPSHOT_PATH):
+    # 두 달 스냅샷을 항목 키로 조인한 월간 변화량 (기본: 직전 달). 한쪽에만 있는 항목도 포함 (신규/삭제)
+    base_month = base_month or previous_month(month)
+    curr = load_snapshot(project_name, month, path)
+    base = load_snapshot(project_name, base_month, path)
+    keep = ['항목 키 (Key)', '항목 (Item)', '가중치 (Weight)', '금월 계획 (Plan Curr)', '금월 실적 (Actual Curr)']
+    joined = curr[keep].merge(base[keep], on='항목 키 (Key)', how='outer', suffixes=('', ' @기준'), indicator=True, sort=False)
+    joined['항목 (Item)'] = joined['항목 (Item)'].fillna(joined['항목 (Item) @기준'])
+    joined['상태 (Change)'] = joined['_merge'].map({'both': '', 'left_only': '신규', 'right_only': '삭제'}).astype(str)
+    for col in ['가중치 (Weight)', '금월 계획 (Plan Curr)', '금월 실적 (Actual Curr)']:
+        joined[f'{col} Δ'] = joined[col].fillna(0) - joined[f'{col} @기준'].fillna(0)
+    cols = ['항목 (Item)', '상태 (Change)', '금월 실적 (Actual Curr) @기준', '금월 실적 (Actual Curr)', '금월 실적 (Actual Curr) Δ',
+            '금월 계획 (Plan Curr) Δ', '가중치 (Weight) Δ']
+    return joined[cols].rename(columns={
+        '금월 실적 (Actual Curr) @기준': f'실적 {base_month}',
+        '금월 실적 (Actual Curr)': f'실적 {month}',
+        '금월 실적 (Actual Curr) Δ': '실적 Δ',
+        '금월 계획 (Plan Curr) Δ': '계획 Δ',
+        '가중치 (Weight) Δ': '가중치 Δ',
+    })
+
+
+def apply_closed_prev(df, project_name, as_of, path=SNAPSHOT_PATH):
+    # '전월 실적' 을 직전 달 마감 스냅샷의 '금월 실적' 으로 고정 (과거 날짜를 고쳐도 전월 값이 바뀌지 않음)
+    # 스냅샷에 없는 항목(신규)은 날짜로 계산한 값 유지. 월간 진도도 다시 계산. 반환: 고정된 항목 수 (스냅샷 없으면 None)
+    base_month = previous_month(month_key(as_of))
+    try:
+        base = load_snapshot(project_name, base_month, path)
+    except ValueError:
+        return None
+    names = df['항목 (Item)'].fillna('').astype(str).str.strip()
+    closed = pd.Series(base['금월 실적 (Actual Curr)'].to_numpy(), index=base['항목 키 (Key)'])
+    values = closed.reindex(item_keys(names)).to_numpy()
+    matched = ~np.isnan(values) & (names != '').to_numpy()
+    prev = pd.to_numeric(df['전월 실적 (Actual Prev)'], errors='coerce').fillna(0).to_numpy(dtype=float)
+    df['전월 실적 (Actual Prev)'] = np.where(matched, values, prev)
+    df['월간 진도 (Monthly Progress)'] = df['금월 실적 (Actual Curr)'] - df['전월 실적 (Actual Prev)']
+    return int(matched.sum())
@@ -0,0 +1,73 @@
+import importlib
+import logging
+import os
+import threading
+import time
+
+# 빠른 시작 (Cold Start)
+# 무거운 라이브러리(plotly, openpyxl)는 그 기능이 처음 쓰일 때 import 한다 (charts.py 함수 안, pandas.ExcelFile).
+# 첫 화면 스크립트가 끝나면 백그라운드 스레드에서 미리 import 해 두어(pre-warm) 업로드/차트 첫 사용도 기다리지 않게 한다.
+# 시작 시간: run_exe.py 가 실행 시각을 환경변수(LAUNCH_ENV)에 남기고, app.py 첫 실행이 끝날 때 첫 화면까지의 시간을 기록한다.
+# 환경변수가 없으면(streamlit run app.py) 이 모듈을 처음 import 한 시각(app.py 첫 실행 시작)부터 잰다.
+# 결과는 진단 패널(app.py)에 표시하고, 콘솔에는 logging(DEBUG, 'startup' 로거)으로만 남긴다 (exe 콘솔에 매번 출력하지 않음).
+# 모듈 전역 상태는 프로세스당 한 번만 채워진다 (Streamlit rerun/세션이 바뀌어도 모듈은 다시 읽지 않음).
+
+LAUNCH_ENV = 'SCHEDULE_LAUNCH_TIME'
+PREWARM_ENV = 'SCHEDULE_PREWARM'  # '0' 이면 pre-warm 하지 않음
+PREWARM_MODULES = ['plotly.graph_objects', 'plotly.express', 'openpyxl']
+
+_imported_at = time.time()
+_log = logging.getLogger(__name__)
+_lock = threading.Lock()
+_state = {'first_paint': None, 'since': None, 'prewarm': {}, 'prewarm_done': False, 'thread': None}
+
+
+def mark_launch():
+    # run_exe.py: 실행 직후 호출 (Streamlit 서버 시작 전)
+    os.environ.setdefault(LAUNCH_ENV, repr(time.time()))
+
+
+def record_first_paint():
+    # 첫 화면까지 걸린 초 (프로세스당 한 번만 기록, 이후 호출은 기록된 값 반환)
+    with _lock:
+        if _state['first_paint'] is None:
+            launched = os.environ.get(LAUNCH_ENV)
+            try:
+                started, since = float(launched), 'launch'
+            except (TypeError, ValueError):
+                started, since = _imported_at, 'script'
+            _state['first_paint'], _state['since'] = time.time() - started, since
+            _log.debug("first paint %.2fs (since %s)", _state['first_paint'], since)
+        return _state['first_paint']
+
+
+def _prewarm(modules):
+    for name in modules:
+        started = time.perf_counter()
+        try:
+            importlib.import_module(name)
+            seconds = time.perf_counter() - started
+        except ImportError:
+            seconds = None
+        with _lock:
+            _state['prewarm'][name] = seconds
+    with _lock:
+        _state['prewarm_done'] = True
+
+
+def start_prewarm(modules=PREWARM_MODULES):
+    # 백그라운드 import 스레드 시작 (프로세스당 한 번, PREWARM_ENV='0' 이면 생략). 반환: 이번 호출에서 시작했는지
+    if os.environ.get(PREWARM_ENV) == '0':
+        return False
+    with _lock:
+        if _state['thread'] is not None:
+            return False
+        _state['thread'] = threading.Thread(target=_prewarm, args=(list(modules),), name='prewarm', daemon=True)
+    _state['thread'].start()
+    return True
+
+
+def startup_status():
+    # {'first_paint': 초 또는 None, 'since': 'launch'/'script', 'prewarm': {모듈: import 초 (실패 None)}, 'prewarm_done': bool}
+    with _lock:
+        return {key: dict(value) if isinstance(value, dict) else value for key, value in _state.items() if key != 'thread'}
@@ -0,0 +1,167 @@
+import html
+
+import numpy as np
+import pandas as pd
+
+from progress_engine import compute_earned_dates, date_array
+from schedule_model import PHASE_COLORS
+
+# 인쇄용 SVG 간트 (Static SVG Gantt)
+# 브라우저/plotly 없이 일정 컬럼에서 바로 정적 SVG 를 만든다 (보고서 인쇄용).
+# create_gantt_chart 와 같은 단계 색상, Today 선, 계약 납품일 선, Earned Schedule 진행선을 그리고
+# 행을 ROWS_PER_PAGE 개씩 나눠 페이지마다 SVG 하나를 만든다 (시간축/범례는 페이지마다 반복).
+
+ROWS_PER_PAGE = 45
+PAGE_WIDTH = 1100
+LABEL_WIDTH = 210
+ROW_HEIGHT = 18
+BAR_HEIGHT = 12
+HEADER_HEIGHT = 56
+FOOTER_HEIGHT = 10
+MAX_TICKS = 24
+LABEL_CHARS = 32
+
+
+def _days(values):
+    # datetime64 -> 1970-01-01 기준 일수 (float, NaT 는 NaN)
+    days = values.astype('datetime64[D]')
+    out = days.astype('int64').astype(float)
+    out[np.isnat(days)] = np.nan
+    return out
+
+
+def _day(value):
+    if value is None or pd.isna(value):
+        return np.nan
+    return float(np.datetime64(pd.Timestamp(value).normalize(), 'D').astype('int64'))
+
+
+def _month_ticks(d0, d1):
+    # 눈금: 월초 (기간이 길면 n 개월 간격)
+    months = np.arange(np.datetime64(int(d0), 'D').astype('datetime64[M]'),
+                       np.datetime64(int(d1), 'D').astype('datetime64[M]') + 1)
+    step = max(1, -(-len(months) // MAX_TICKS))
+    months = months[::step]
+    days = months.astype('datetime64[D]').astype('int64')
+    keep = (days >= d0) & (days <= d1)
+    return days[keep], [str(m)[2:] for m in months[keep]]  # 'YY-MM'
+
+
+def render_svg_gantt(df, phases, title="", today=None, contract_delivery_date=None, rows_per_page=ROWS_PER_PAGE, width=PAGE_WIDTH):
+    # 반환: 페이지별 SVG 문자열 리스트 (그릴 데이터가 없으면 빈 리스트)
+    names = df['항목 (Item)']
+    valid = (names.notna() & (names.astype(str).str.strip() != '')).to_numpy()
+    view = df[valid]
+    n = len(view)
+    if n == 0:
+        return []
+
+    bars = []
+    for phase_name, p_start, p_end, a_start, a_prog, a_end in phases:
+        starts = _days(date_array(view, p_start))
+        ends = _days(date_array(view, p_end))
+        ok = ~np.isnan(starts) & ~np.isnan(ends)
+        bars.append((phase_name, PHASE_COLORS.get(phase_name, '#BBBBBB'), starts, ends, ok))
+    earned = _days(compute_earned_dates(view, phases))
+    has_earned = ~np.isnan(earned)
+    if not any(ok.any() for _, _, _, _, ok in bars) and not has_earned.any():
+        return []
+
+    today_d = _day(pd.Timestamp.now() if today is None else today)
+    delivery_d = _day(contract_delivery_date)
+
+    # 시간축 범위: 모든 막대 + 진행선 + 기준선
+    candidates = [earned[has_earned], np.array([today_d, delivery_d])]
+    for _, _, starts, ends, ok in bars:
+        candidates.extend([starts[ok], ends[ok]])
+    values = np.concatenate(candidates)
+    d0, d1 = np.nanmin(values) - 7, np.nanmax(values) + 7
+    chart_left, chart_right = LABEL_WIDTH, width - 10
+    scale = (chart_right - chart_left) / (d1 - d0)
+
+    def x_of(d):
+        return chart_left + (d - d0) * scale
+
+    labels = [html.escape(s if len(s) <= LABEL_CHARS else s[:LABEL_CHARS - 1] + '…') for s in view['항목 (Item)'].astype(str)]
+    tick_days, tick_labels = _month_ticks(d0, d1)
+    tick_x = x_of(tick_days.astype(float)).tolist()
+
+    # 범례 (페이지 공통)
+    legend = []
+    lx = chart_left
+    for phase_name, color, _, _, _ in bars:
+        legend.append(f'<rect x="{lx}" y="8" width="12" height="10" fill="{color}"/>'
+                      f'<text x="{lx + 16}" y="17">{html.escape(phase_name)}</text>')
+        lx += 26 + 7 * len(phase_name)
+    legend.append(f'<line x1="{lx}" y1="13" x2="{lx + 16}" y2="13" stroke="#FF5733" stroke-width="2"/>'
+                  f'<text x="{lx + 20}" y="17">Actual Progress</text>')
+    legend = ''.join(legend)
+
+    pages = []
+    n_pages = -(-n // rows_per_page)
+    for page in range(n_pages):
+        r0 = page * rows_per_page
+        r1 = min(n, r0 + rows_per_page)
+        rows = r1 - r0
+        height = HEADER_HEIGHT + rows * ROW_HEIGHT + FOOTER_HEIGHT
+        bottom = HEADER_HEIGHT + rows * ROW_HEIGHT
+        parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}" '
+                 f'font-family="Helvetica, Arial, sans-serif" font-size="10" class="svg-gantt">']
+        page_title = f"{title} ({page + 1}/{n_pages})" if title else f"{page + 1}/{n_pages}"
+        parts.append(f'<text x="4" y="17" font-size="12" font-weight="bold">{html.escape(page_title)}</text>')
+        parts.append(legend)
+
+        # 시간축 (월 눈금 + 세로 격자)
+        for x, label in zip(tick_x, tick_labels):
+            parts.append(f'<line x1="{x:.1f}" y1="{HEADER_HEIGHT - 6}" x2="{x:.1f}" y2="{bottom}" stroke="#E0E0E0"/>'
+                         f'<text x="{x + 2:.1f}" y="{HEADER_HEIGHT - 9}" fill="#555">{label}</text>')
+
+        # 행 구분선 + 항목명
+        ys = HEADER_HEIGHT + np.arange(rows) * ROW_HEIGHT
+        parts.extend(f'<line x1="0" y1="{y}" x2="{width}" y2="{y}" stroke="#CCCCCC" stroke-width="0.5"/>'
+                     f'<text x="4" y="{y + 13}">{label}</text>'
+                     for y, label in zip(ys.tolist(), labels[r0:r1]))
+        parts.append(f'<line x1="0" y1="{bottom}" x2="{width}" y2="{bottom}" stroke="#CCCCCC" stroke-width="0.5"/>')
+
+        # 계획 막대 (단계별 색상, opacity 0.5)
+        bar_offset = (ROW_HEIGHT - BAR_HEIGHT) / 2
+        for phase_name, color, starts, ends, ok in bars:
+            idx = np.flatnonzero(ok[r0:r1])
+            if len(idx) == 0:
+                continue
+            xs = x_of(starts[r0:r1][idx])
+            ws = np.maximum(x_of(ends[r0:r1][idx]) - xs, 1.0)
+            yb = ys[idx] + bar_offset
+            parts.append(f'<g fill="{color}" fill-opacity="0.5">')
+            parts.extend(f'<rect x="{x:.1f}" y="{y:.1f}" width="{w:.1f}" height="{BAR_HEIGHT}"/>'
+                         for x, y, w in zip(xs.tolist(), yb.tolist(), ws.tolist()))
+            parts.append('</g>')
+
+        # Earned Schedule 진행선
+        idx = np.flatnonzero(has_earned[r0:r1])
+        if len(idx):
+            px_ = x_of(earned[r0:r1][idx])
+            py_ = ys[idx] + ROW_HEIGHT / 2
+            points = ' '.join(f'{x:.1f},{y:.1f}' for x, y in zip(px_.tolist(), py_.tolist()))
+            parts.append(f'<polyline points="{points}" fill="none" stroke="#FF5733" stroke-width="2"/>')
+            parts.append('<g fill="#FF5733">')
+            parts.extend(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="3"/>' for x, y in zip(px_.tolist(), py_.tolist()))
+            parts.append('</g>')
+
+        # Today / 계약 납품일 선
+        for d, label, dash in ((today_d, 'Today', ''), (delivery_d, '계약 납품일', ' stroke-dasharray="6,4"')):
+            if not np.isnan(d):
+                x = x_of(d)
+                parts.append(f'<line x1="{x:.1f}" y1="{HEADER_HEIGHT - 6}" x2="{x:.1f}" y2="{bottom}" stroke="red" stroke-width="2"{dash}/>'
+                             f'<text x="{x + 3:.1f}" y="{HEADER_HEIGHT + 10}" fill="red">{label}</text>')
+
+        parts.append('</svg>')
+        pages.append(''.join(parts))
+    return pages
+
+
+def svg_gantt_html(pages):
+    # 보고서용: 페이지마다 인쇄 페이지 나눔
+    if not pages:
+        return None
+    return '\n<div class="page-break"></div>\n'.join(f'<div class="svg-gantt-page">{svg}</div>' for svg in pages)
@@ -0,0 +1,82 @@
+import os
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from incremental import update_derived  # noqa: E402
+from progress_engine import PROGRESS_COLS, month_bounds  # noqa: E402
+from schedule_model import PHASES_INFO, new_schedule, normalize_schedule  # noqa: E402
+from scheduler import auto_schedule  # noqa: E402
+
+AS_OF = date(2025, 6, 15)
+DELIVERY = date(2025, 8, 1)
+FIRST, LAST = month_bounds(AS_OF)
+
+
+def base_schedule():
+    # 금액/가중치 0 인 3개 항목, 구매 단계 실적 (1개 지연) -> 균등 가중치 + 지연/납품 초과 알림
+    df = auto_schedule(new_schedule({'A': 8, 'B': 12, 'C': 0}), date(2025, 1, 1))
+    df['구매 실적 시작'] = df['구매 계획 시작']
+    df['구매 실적 종료'] = df['구매 계획 종료'] + pd.to_timedelta([0, 5, 0], unit='D')
+    df['구매 진행률 (%)'] = 100.0
+    return normalize_schedule(df)[0]
+
+
+def apply_editor(df, state):
+    # data_editor 변경 내역을 적용한 편집 결과 (Streamlit 과 같은 위치 규칙: 삭제 후 위치가 아닌 원래 위치)
+    out = df.copy()
+    for pos, values in state.get('edited_rows', {}).items():
+        for col, value in values.items():
+            out.iloc[int(pos), out.columns.get_loc(col)] = value
+    out = out.drop(index=out.index[list(state.get('deleted_rows', []))])
+    if state.get('added_rows'):
+        out = pd.concat([out, pd.DataFrame(state['added_rows'])], ignore_index=True)
+    return normalize_schedule(out.reset_index(drop=True))[0]
+
+
+def derived(cache, df, state):
+    return update_derived(cache, df, state, PHASES_INFO, FIRST, LAST, DELIVERY)
+
+
+STEPS = [
+    {'added_rows': [{'항목 (Item)': 'D', '제작 기간 (Weeks)': 4}]},
+    {'edited_rows': {0: {'가중치 (Weight)': 50}}, 'deleted_rows': [1]},
+    {'edited_rows': {1: {'금액 (Amount)': 1000}}},
+    {'edited_rows': {1: {'금액 (Amount)': 0}, 2: {'구매 실적 종료': pd.Timestamp('2025-02-01')}}},
+    {'deleted_rows': [0], 'added_rows': [{'항목 (Item)': 'E', '금액 (Amount)': 0, '가중치 (Weight)': 10}]},
+    {'edited_rows': {0: {'가중치 (Weight)': 0}, 1: {'가중치 (Weight)': 0}}},
+]
+
+
+def test_incremental_matches_full_recompute():
+    data = base_schedule()
+    cache, _, base_actual, _ = derived(None, data.copy(), None)
+    # 기준 데이터에 실적이 없으면 진도 비교가 0 끼리만 이뤄진다 (컬럼 이름 오타 등)
+    assert base_actual > 0
+    for state in STEPS:
+        edited = apply_editor(data, state)
+        inc_df, full_df = edited.copy(), edited.copy()
+        cache, inc_plan, inc_actual, inc_alerts = derived(cache, inc_df, state)
+        _, full_plan, full_actual, full_alerts = derived(None, full_df, state)
+
+        for col in ['금액 (Amount)', '가중치 (Weight)', '월간 진도 (Monthly Progress)'] + PROGRESS_COLS:
+            np.testing.assert_allclose(inc_df[col].to_numpy(dtype=float), full_df[col].to_numpy(dtype=float), err_msg=col)
+        assert inc_plan == pytest.approx(full_plan)
+        assert inc_actual == pytest.approx(full_actual)
+        pd.testing.assert_frame_equal(inc_alerts, full_alerts, check_dtype=False)  # 빈 열 dtype 은 알림 유무에 따라 다름
+        # 적용(submit) 후 다음 편집의 기준 데이터
+        data = inc_df
+
+
+def test_alerts_recomputed_when_delivery_changes():
+    data = base_schedule()
+    cache, *_ = derived(None, data.copy(), None)
+    state = {'edited_rows': {0: {'제작 기간 (Weeks)': 9}}}
+    edited = apply_editor(data, state)
+    _, _, _, alerts = update_derived(cache, edited.copy(), state, PHASES_INFO, FIRST, LAST, date(2030, 1, 1))
+    _, _, _, full = update_derived(None, edited.copy(), None, PHASES_INFO, FIRST, LAST, date(2030, 1, 1))
+    pd.testing.assert_frame_equal(alerts, full, check_dtype=False)
@@ -0,0 +1,107 @@
+import hashlib
+import io
+import os
+import pickle
+from collections import OrderedDict
+
+import pandas as pd
+
+# 업로드 파일 캐시 (Upload Cache)
+# 파일 내용(bytes)의 해시를 키로 파싱 결과(일정 DataFrame + ProjectInfo)를 저장한다.
+# 1차: 프로세스 메모리 LRU, 2차: 디스크 pickle (세션을 다시 열어도 재사용). 둘 다 크기 제한 + LRU 제거.
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.sch_tool_cache', 'uploads')
+MEMORY_MAX_ENTRIES = 8
+DISK_MAX_BYTES = 200 * 1024 * 1024
+
+_memory = OrderedDict()
+stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0}
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def parse_workbook(data, name):
+    # 일정 시트(첫 번째 시트)와 ProjectInfo 시트를 읽는다 (csv 는 일정만)
+    if name.lower().endswith('.csv'):
+        return pd.read_csv(io.BytesIO(data)), None
+    xl = pd.ExcelFile(io.BytesIO(data))
+    schedule_df = xl.parse(0)  # Assume data is first sheet or 'Schedule'
+    meta_df = xl.parse('ProjectInfo') if 'ProjectInfo' in xl.sheet_names else None
+    return schedule_df, meta_df
+
+
+def _remember(key, entry):
+    _memory[key] = entry
+    _memory.move_to_end(key)
+    while len(_memory) > MEMORY_MAX_ENTRIES:
+        _memory.popitem(last=False)
+        stats['evictions'] += 1
+
+
+def _disk_path(key):
+    return os.path.join(CACHE_DIR, f"{key}.pkl")
+
+
+def _trim_disk():
+    # 오래 사용하지 않은 파일(mtime 기준)부터 삭제
+    try:
+        files = [os.path.join(CACHE_DIR, f) for f in os.listdir(CACHE_DIR) if f.endswith('.pkl')]
+        files = sorted(((os.path.getmtime(f), os.path.getsize(f), f) for f in files))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in files)
+    for _, size, path in files:
+        if total <= DISK_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+            total -= size
+            stats['evictions'] += 1
+        except OSError:
+            pass
+
+
+def load_upload(data, name):
+    # 반환: (일정 DataFrame, ProjectInfo DataFrame 또는 None). 호출 측이 수정해도 되도록 복사본을 돌려준다.
+    key = content_hash(data) + ('.csv' if name.lower().endswith('.csv') else '')
+
+    if key in _memory:
+        stats['memory_hits'] += 1
+        _memory.move_to_end(key)
+        schedule_df, meta_df = _memory[key]
+        return schedule_df.copy(), (meta_df.copy() if meta_df is not None else None)
+
+    path = _disk_path(key)
+    if os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+            os.utime(path)  # LRU 갱신
+            stats['disk_hits'] += 1
+            _remember(key, entry)
+            schedule_df, meta_df = entry
+            return schedule_df.copy(), (meta_df.copy() if meta_df is not None else None)
+        except Exception:
+            pass  # 손상된 캐시는 무시하고 다시 파싱
+
+    stats['misses'] += 1
+    entry = parse_workbook(data, name)
+    _remember(key, entry)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        _trim_disk()
+    except OSError:
+        pass  # 디스크 캐시는 선택 사항
+    schedule_df, meta_df = entry
+    return schedule_df.copy(), (meta_df.copy() if meta_df is not None else None)
+
+
+def cache_summary():
+    hits = stats['memory_hits'] + stats['disk_hits']
+    return f"hit {hits} (메모리 {stats['memory_hits']} / 디스크 {stats['disk_hits']}) · miss {stats['misses']} · 제거 {stats['evictions']}"
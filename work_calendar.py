@@ -0,0 +1,82 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+
+# 근무일 달력 (Working-Day Calendar)
+# 근무 요일(weekmask) + 휴일 목록(로컬 파일)으로 numpy busdaycalendar 를 만든다.
+# 일정 계산은 날짜를 정수 '날짜 번호'로 바꿔 더하기/빼기만 하고 마지막에 날짜로 되돌린다:
+#   달력 없음(None): 1970-01-01 기준 일수 (기존 달력일 계산과 동일)
+#   달력 있음: 1970-01-01 이후 근무일 번호 (np.busday_count / np.busday_offset, 배열 단위 C 연산)
+# 지연 일수, 납품일 초과 일수, 단축 기간도 같은 달력으로 센다 (day_count).
+
+WEEKDAY_LABELS = ['월', '화', '수', '목', '금', '토', '일']
+DEFAULT_WEEKMASK = '1111100'
+HOLIDAY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'holidays.csv')
+_EPOCH = np.datetime64('1970-01-01', 'D')
+
+
+def load_holidays(source=HOLIDAY_FILE):
+    # 휴일 파일 읽기: 한 줄에 'YYYY-MM-DD[,설명]' ('#' 주석, 빈 줄 무시). source: 경로 또는 bytes
+    # 반환: 정렬된 datetime64[D] 배열
+    if isinstance(source, (bytes, bytearray)):
+        text = bytes(source).decode('utf-8-sig')
+    else:
+        with io.open(source, encoding='utf-8-sig') as f:
+            text = f.read()
+    days = []
+    for line_no, line in enumerate(text.splitlines(), 1):
+        value = line.split('#', 1)[0].split(',', 1)[0].strip()
+        if not value:
+            continue
+        try:
+            days.append(np.datetime64(pd.Timestamp(value).date(), 'D'))
+        except (ValueError, TypeError):
+            raise ValueError(f"휴일 파일 {line_no}행의 날짜를 해석할 수 없습니다: '{value}'")
+    return np.unique(np.array(days, dtype='datetime64[D]'))
+
+
+def make_calendar(weekmask=DEFAULT_WEEKMASK, holidays=()):
+    # weekmask: '1111100' (월~일) 또는 요일 라벨 목록 ['월', '화', ...]
+    if not isinstance(weekmask, str):
+        weekmask = ''.join('1' if label in weekmask else '0' for label in WEEKDAY_LABELS)
+    if '1' not in weekmask:
+        raise ValueError("근무 요일을 하나 이상 선택해야 합니다.")
+    return np.busdaycalendar(weekmask=weekmask, holidays=np.asarray(holidays, dtype='datetime64[D]'))
+
+
+def workdays_per_week(calendar=None):
+    # 주 단위 기간(제작 기간 Weeks) -> 날짜 번호 환산 계수
+    return 7 if calendar is None else int(calendar.weekmask.sum())
+
+
+def day_index(dates, calendar=None, roll='forward'):
+    # 날짜(NaT 없음) -> 날짜 번호 (int64). 휴일/비근무일은 roll='forward' 면 다음 근무일, 'backward' 면 이전 근무일 번호
+    days = np.asarray(dates, dtype='datetime64[D]')
+    if calendar is None:
+        return days.astype('int64')
+    if roll == 'backward':
+        return np.busday_count(_EPOCH, days + 1, busdaycal=calendar) - 1
+    return np.busday_count(_EPOCH, days, busdaycal=calendar)
+
+
+def index_day(index, calendar=None):
+    # 날짜 번호 -> datetime64[D]
+    index = np.asarray(index, dtype='int64')
+    if calendar is None:
+        return index.astype('datetime64[D]')
+    return np.busday_offset(_EPOCH, index, roll='forward', busdaycal=calendar)
+
+
+def day_count(start, end, calendar=None):
+    # end - start 일수 (달력이 있으면 [start, end) 의 근무일 수, end < start 면 음수). 어느 한쪽이 NaT 면 0
+    start = np.asarray(start, dtype='datetime64[D]')
+    end = np.asarray(end, dtype='datetime64[D]')
+    start, end = np.broadcast_arrays(start, end)
+    ok = ~np.isnat(start) & ~np.isnat(end)
+    if calendar is None:
+        return np.where(ok, (end - start).astype('int64'), 0)
+    counts = np.zeros(start.shape, dtype='int64')
+    counts[ok] = np.busday_count(start[ok], end[ok], busdaycal=calendar)
+    return counts
@@ -0,0 +1,262 @@
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+
+from xlsx_stream import EXCEL_EPOCH, column_letter, xml_text
+
+# 엑셀 템플릿 채우기 (XLSX Template Patcher)
+# 서식이 무거운 보고서 템플릿(스타일/그림/이름 정의가 많은 파일)을 openpyxl 로 열고 다시 쓰지 않고,
+# zip 안의 시트 XML 중 값이 바뀌는 시트만 정규식으로 고쳐 쓴다. 나머지 파일(스타일, 그림, 다른 시트)은 그대로 복사.
+# 항목 수가 템플릿 칸보다 많으면 블록의 마지막 칸(step 행)을 복제해 행을 끼워 넣고,
+# 아래쪽 행/병합/수식/조건부 서식 참조를 밀어 내린다 (블록 끝에서 끝나는 범위는 늘린다, 엑셀의 행 삽입과 같은 규칙).
+# 다른 시트에서 밀려난 행을 가리키는 참조는 고치지 않는다 (호출 측에서 그런 셀은 값으로 덮어쓴다).
+#
+# 셀 값: None/NaN -> 값 지우기 (서식 유지), '=...' -> 수식, str -> 문자열, 숫자, 날짜 -> 일련번호
+# 공유 수식의 기준 셀(ref 가 있는 셀)은 수식으로만 바꿀 수 있다 (값을 쓰면 같은 수식을 쓰는 셀이 깨지므로 건너뜀).
+
+_ROW_RE = re.compile(r'<row\b([^>]*?)(?:/>|>(.*?)</row>)', re.S)
+_CELL_RE = re.compile(r'<c\b([^>]*?)(?:/>|>(.*?)</c>)', re.S)
+_ATTR_R_RE = re.compile(r'\br="([A-Z]+)?(\d+)"')
+_REF_RE = re.compile(r"(?<![A-Za-z0-9_.!'\"$])(\$?)([A-Z]{1,3})(\$?)(\d+)(?::(\$?)([A-Z]{1,3})(\$?)(\d+))?(?![0-9A-Za-z_(!])")
+_FORMULA_RE = re.compile(r'(<(f|formula\d?)\b[^>]*(?<!/)>)(.*?)(</\2>)', re.S)
+_SQREF_RE = re.compile(r'(<(?:mergeCell|dimension|conditionalFormatting|dataValidation|hyperlink)\b[^>]*?\b(?:ref|sqref)=")([^"]*)(")')
+_SHARED_REF_RE = re.compile(r'(<f\b[^>]*?\bref=")([^"]*)(")')
+_MERGE_RE = re.compile(r'<mergeCell ref="([A-Z]+)(\d+):([A-Z]+)(\d+)"/>')
+_CELL_REF_RE = re.compile(r'([A-Z]+)(\d+)')
+_ROW_NUM_RE = re.compile(r'\br="(\d+)"')
+_CELL_ROW_RE = re.compile(r'(<c\b[^>]*?\br="[A-Z]+)\d+"')
+_F_OPEN_RE = re.compile(r'<f\b[^>]*>')
+_CELL_TYPE_RE = re.compile(r'\s+(?:t|cm|vm)="[^"]*"')
+_SPANS_RE = re.compile(r'\s+spans="[^"]*"')
+_SHARED_MASTER_RE = re.compile(r'<f t="shared" ref="[^"]*" (si="\d+")>[^<]*</f>')
+_ARRAY_FORMULA_RE = re.compile(r'<f t="array"[^>]*>.*?</f>', re.S)
+_CACHED_VALUE_RE = re.compile(r'(<f\b[^>]*?(?:/>|(?<!/)>[^<]*</f>))<v>[^<]*</v>')
+
+
+def column_index(letters):
+    # 'A' -> 0, 'AB' -> 27
+    idx = 0
+    for ch in letters:
+        idx = idx * 26 + ord(ch) - 64
+    return idx - 1
+
+
+def _row_number(attrs):
+    return int(_ROW_NUM_RE.search(attrs).group(1))
+
+
+def _shift_refs(text, last, extra, translate=0):
+    # last 행 아래 참조를 extra 만큼 내리고, last 에서 끝나는 범위는 extra 만큼 늘린다.
+    # translate: 복제한 행의 상대 참조($ 없는 행) 이동량
+    def shift_one(absolute, row, is_end=False, start_row=None):
+        row = int(row)
+        if translate and not absolute:
+            return row + translate
+        if row > last or (is_end and row == last and start_row is not None and start_row <= last):
+            return row + extra
+        return row
+
+    def replace(m):
+        c1, col1, r1_abs, r1 = m.group(1), m.group(2), m.group(3), m.group(4)
+        new1 = shift_one(r1_abs, r1)
+        if m.group(6) is None:
+            return f'{c1}{col1}{r1_abs}{new1}'
+        c2, col2, r2_abs, r2 = m.group(5), m.group(6), m.group(7), m.group(8)
+        new2 = shift_one(r2_abs, r2, is_end=True, start_row=int(r1))
+        return f'{c1}{col1}{r1_abs}{new1}:{c2}{col2}{r2_abs}{new2}'
+
+    return _REF_RE.sub(replace, text)
+
+
+def _shift_formulas(xml, last, extra, translate=0):
+    return _FORMULA_RE.sub(lambda m: m.group(1) + _shift_refs(m.group(3), last, extra, translate) + m.group(4), xml)
+
+
+def _cell_value_xml(value):
+    # 반환: (t 속성 또는 None, 내용 XML)
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None, ''
+    if isinstance(value, str):
+        if value.startswith('='):
+            return None, f'<f>{escape(value[1:])}</f>'
+        return 'inlineStr', f'<is>{xml_text(value)}</is>'
+    if isinstance(value, (pd.Timestamp, np.datetime64)) or hasattr(value, 'isoformat'):
+        value = pd.Timestamp(value)
+        if pd.isna(value):
+            return None, ''
+        return None, f'<v>{int((np.datetime64(value.normalize(), "D") - EXCEL_EPOCH).astype("int64"))}</v>'
+    if isinstance(value, (bool, np.bool_)):
+        return 'b', f'<v>{int(value)}</v>'
+    return None, f'<v>{repr(float(value)) if isinstance(value, (float, np.floating)) else int(value)}</v>'
+
+
+def _set_cell(attrs, body, value):
+    # 기존 셀(속성, 내용)에 값 쓰기. 반환: 새 셀 XML 또는 None (공유 수식 기준 셀이라 건너뜀)
+    body = body or ''
+    f_open = _F_OPEN_RE.search(body)
+    shared_master = f_open is not None and 't="shared"' in f_open.group(0) and 'ref="' in f_open.group(0)
+    kind, content = _cell_value_xml(value)
+    if shared_master:
+        if not content.startswith('<f>'):
+            return None
+        # 기준 셀의 수식 문장만 바꾼다 (같은 수식을 쓰는 셀은 상대 위치로 따라온다)
+        content = f_open.group(0) + content[3:]
+    attrs = _CELL_TYPE_RE.sub('', attrs)
+    if kind:
+        attrs += f' t="{kind}"'
+    return f'<c{attrs}>{content}</c>' if content else f'<c{attrs}/>'
+
+
+def _renumber_row(attrs, body, r):
+    # 행 번호 바꾸기 (행 속성과 각 셀의 r 속성)
+    return _ROW_NUM_RE.sub(f'r="{r}"', attrs), _CELL_ROW_RE.sub(lambda m: f'{m.group(1)}{r}"', body)
+
+
+def _patch_rows(sheet_data, cells, clone_block=None):
+    # sheet_data: <sheetData> 내용. cells: {(행, 열 이름): 값}
+    # clone_block: (마지막 칸 첫 행, 마지막 칸 끝 행, 추가 행 수) -> 끝 행 뒤에 마지막 칸을 복제해 끼워 넣는다
+    rows = [(m.group(1), m.group(2) or '') for m in _ROW_RE.finditer(sheet_data)]
+    out = {}
+    templates = {}
+    for attrs, body in rows:
+        r = _row_number(attrs)
+        if clone_block is not None:
+            first, last, extra = clone_block
+            if first <= r <= last:
+                templates[r] = (attrs, body)
+            if r > last:
+                r += extra
+                attrs, body = _renumber_row(attrs, body, r)
+            body = _shift_formulas(body, last, extra)
+        out[r] = (attrs, body)
+
+    if clone_block is not None:
+        first, last, extra = clone_block
+        step = last - first + 1
+        for offset in range(step, extra + step, step):
+            for src, (attrs, body) in templates.items():
+                new_r = src + offset
+                attrs, body = _renumber_row(attrs, body, new_r)
+                # 공유 수식의 기준 셀은 복제하지 않고 같은 그룹의 셀로 (ref 범위는 늘어남)
+                body = _SHARED_MASTER_RE.sub(r'<f t="shared" \1/>', body)
+                body = _ARRAY_FORMULA_RE.sub('', body)
+                body = _CACHED_VALUE_RE.sub(r'\1', body)  # 복제 행의 수식 캐시 값은 버린다 (열 때 다시 계산)
+                out[new_r] = (attrs, _shift_formulas(body, last, extra, translate=offset))
+
+    by_row = {}
+    for (r, col), value in cells.items():
+        by_row.setdefault(r, {})[col] = value
+    for r, updates in by_row.items():
+        attrs, body = out.get(r, (f' r="{r}"', ''))
+        existing = {}
+        for m in _CELL_RE.finditer(body):
+            col = _ATTR_R_RE.search(m.group(1)).group(1)
+            existing[col] = (m.group(1), m.group(2), m.group(0))
+        for col, value in updates.items():
+            cell_attrs, cell_body, raw = existing.get(col, (f' r="{col}{r}"', '', None))
+            new = _set_cell(cell_attrs, cell_body, value)
+            existing[col] = (cell_attrs, cell_body, raw if new is None else new)
+        body = ''.join(existing[col][2] for col in sorted(existing, key=lambda c: (len(c), c)) if existing[col][2] is not None)
+        attrs = _SPANS_RE.sub('', attrs)
+        out[r] = (attrs, body)
+
+    return ''.join(f'<row{attrs}>{body}</row>' if body else f'<row{attrs}/>' for _, (attrs, body) in sorted(out.items()))
+
+
+def patch_sheet(xml, cells, block=None):
+    # block: (첫 행, 칸 수, 칸당 행 수, 항목 수) 또는 None. 반환: 고친 시트 XML
+    clone_block = None
+    if block is not None:
+        first_row, slots, step, n_items = block
+        if n_items > slots:
+            last = first_row + slots * step - 1
+            clone_block = (last - step + 1, last, (n_items - slots) * step)
+
+    start = xml.index('<sheetData')
+    data_open = xml.index('>', start) + 1
+    if xml[data_open - 2] == '/':
+        head, data, tail = xml[:start] + '<sheetData>', '', '</sheetData>' + xml[data_open:]
+    else:
+        end = xml.index('</sheetData>')
+        head, data, tail = xml[:data_open], xml[data_open:end], xml[end:]
+
+    if clone_block is not None:
+        first, last, extra = clone_block
+        shift = lambda m: m.group(1) + _shift_refs(m.group(2), last, extra) + m.group(3)
+        head = _SQREF_RE.sub(shift, head)
+        tail = _SQREF_RE.sub(shift, tail)
+        tail = _shift_formulas(tail, last, extra)  # 조건부 서식/데이터 유효성 수식 (<formula>)
+        # 마지막 칸 안의 병합 셀은 새 칸마다 복제
+        step = last - first + 1
+        clones = []
+        for m in _MERGE_RE.finditer(tail):
+            r1, r2 = int(m.group(2)), int(m.group(4))
+            if first <= r1 and r2 <= last:
+                clones.extend(f'<mergeCell ref="{m.group(1)}{r1 + o}:{m.group(3)}{r2 + o}"/>' for o in range(step, extra + step, step))
+        if clones:
+            tail = re.sub(r'<mergeCells count="(\d+)">',
+                          lambda m: f'<mergeCells count="{int(m.group(1)) + len(clones)}">' + ''.join(clones), tail, count=1)
+        data = _SHARED_REF_RE.sub(shift, data)
+
+    refs = [_CELL_REF_RE.match(ref).groups() for ref in cells]
+    cells = {(int(r), col): value for (col, r), value in zip(refs, cells.values())}
+    return head + _patch_rows(data, cells, clone_block) + tail
+
+
+def block_extra_rows(block):
+    # 항목 수가 칸 수보다 많을 때 블록 아래 행이 밀려나는 행 수
+    first_row, slots, step, n_items = block
+    return max(0, n_items - slots) * step
+
+
+def _sheet_paths(zf):
+    # 시트 이름(앞뒤 공백 제거) -> zip 안 경로
+    workbook = zf.read('xl/workbook.xml').decode('utf-8')
+    rels = zf.read('xl/_rels/workbook.xml.rels').decode('utf-8')
+    targets = {m.group(1): m.group(2) for m in re.finditer(r'<Relationship\b[^>]*?Id="([^"]+)"[^>]*?Target="([^"]+)"', rels)}
+    targets.update({m.group(2): m.group(1) for m in re.finditer(r'<Relationship\b[^>]*?Target="([^"]+)"[^>]*?Id="([^"]+)"', rels)})
+    paths = {}
+    for m in re.finditer(r'<sheet\b[^>]*?name="([^"]*)"[^>]*?r:id="([^"]+)"', workbook):
+        name = m.group(1).replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').strip()
+        target = targets[m.group(2)].lstrip('/')
+        paths[name] = target if target.startswith('xl/') else 'xl/' + target
+    return paths
+
+
+def patch_workbook(template, target, sheets):
+    # template/target: 경로 또는 file-like. sheets: {시트 이름: (셀 dict {'A1': 값}, block 또는 None)}
+    # 수식 결과는 엑셀이 열 때 다시 계산한다 (fullCalcOnLoad, calcChain 제거)
+    with zipfile.ZipFile(template) as zin:
+        paths = _sheet_paths(zin)
+        missing = [name for name in sheets if name.strip() not in paths]
+        if missing:
+            raise ValueError(f"템플릿에 시트가 없습니다: {', '.join(missing)}")
+        patched = {paths[name.strip()]: spec for name, spec in sheets.items()}
+
+        with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as zout:
+            for info in zin.infolist():
+                name = info.filename
+                if name == 'xl/calcChain.xml':
+                    continue
+                data = zin.read(name)
+                if name in patched:
+                    cells, block = patched[name]
+                    data = patch_sheet(data.decode('utf-8'), cells, block).encode('utf-8')
+                elif name == 'xl/workbook.xml':
+                    text = data.decode('utf-8')
+                    if 'fullCalcOnLoad' not in text:
+                        text = re.sub(r'<calcPr\b', '<calcPr fullCalcOnLoad="1"', text, count=1)
+                    data = text.encode('utf-8')
+                elif name == 'xl/_rels/workbook.xml.rels':
+                    data = re.sub(rb'<Relationship\b[^>]*?calcChain[^>]*?/>', b'', data)
+                elif name == '[Content_Types].xml':
+                    data = re.sub(rb'<Override\b[^>]*?calcChain[^>]*?/>', b'', data)
+                zout.writestr(zipfile.ZipInfo(name, date_time=info.date_time), data, compress_type=info.compress_type)
+
+
+def column_range(first, last):
+    # 'I', 'AL' -> ['I', 'J', ..., 'AL']
+    return [column_letter(i) for i in range(column_index(first), column_index(last) + 1)]
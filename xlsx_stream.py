@@ -0,0 +1,151 @@
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+
+# 스트리밍 엑셀 쓰기 (Streaming XLSX Writer)
+# legacy_import 의 스트리밍 리더와 짝을 이루는 최소 xlsx 작성기.
+# 셀 XML 을 컬럼 단위(벡터 연산)로 만들고 CHUNK_ROWS 행씩 zip 스트림에 바로 기록하므로
+# 메모리 사용량은 행 수와 무관하게 일정하다. 날짜는 YYYY-MM-DD 서식, 헤더는 굵게.
+
+CHUNK_ROWS = 5000
+EXCEL_EPOCH = np.datetime64('1899-12-30', 'D')
+
+# cellXfs 인덱스: 0 기본, 1 날짜 (numFmt 164), 2 굵게 (헤더)
+STYLE_DATE = 1
+STYLE_HEADER = 2
+
+_ILLEGAL_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '{sheets}</Types>'
+)
+SHEET_CONTENT_TYPE = ('<Override PartName="/xl/worksheets/sheet{i}.xml" '
+                      'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>')
+ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="YYYY-MM-DD"/></numFmts>'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font><font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="3"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+WORKSHEET_OPEN = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                  '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">')
+SHEET_HEAD = WORKSHEET_OPEN + '<sheetData>'
+SHEET_TAIL = '</sheetData></worksheet>'
+
+
+def column_letter(idx):
+    # 0 -> 'A', 27 -> 'AB'
+    letters = ''
+    idx += 1
+    while idx:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def xml_text(value):
+    value = _ILLEGAL_XML.sub('', str(value))
+    space = ' xml:space="preserve"' if value != value.strip() else ''
+    return f'<t{space}>{escape(value)}</t>'
+
+
+def _cells(s, refs):
+    # 컬럼 하나 -> 행별 셀 XML 문자열 배열 (결측은 빈 문자열)
+    out = np.full(len(s), '', dtype=object)
+    present = s.notna().to_numpy()
+    if not present.any():
+        return out
+    if pd.api.types.is_datetime64_any_dtype(s):
+        serial = (s.to_numpy(dtype='datetime64[D]')[present] - EXCEL_EPOCH).astype('int64').astype(str)
+        out[present] = '<c r="' + refs[present] + f'" s="{STYLE_DATE}"><v>' + serial.astype(object) + '</v></c>'
+    elif pd.api.types.is_bool_dtype(s):
+        flags = np.where(s.to_numpy()[present].astype(bool), '1', '0').astype(object)
+        out[present] = '<c r="' + refs[present] + '" t="b"><v>' + flags + '</v></c>'
+    elif pd.api.types.is_numeric_dtype(s):
+        values = s.to_numpy(dtype=float)[present]
+        finite = np.isfinite(values)
+        idx = np.flatnonzero(present)[finite]
+        out[idx] = '<c r="' + refs[idx] + '"><v>' + values[finite].astype(str).astype(object) + '</v></c>'
+    else:
+        texts = pd.Series(s.to_numpy(dtype=object)[present]).map(xml_text).to_numpy(dtype=object)
+        out[present] = '<c r="' + refs[present] + '" t="inlineStr"><is>' + texts + '</is></c>'
+    return out
+
+
+def text_cell(ref, value, style=None):
+    s = f' s="{style}"' if style is not None else ''
+    return f'<c r="{ref}"{s} t="inlineStr"><is>{xml_text(value)}</is></c>'
+
+
+def write_rows(stream, df, first_row=1, first_col=0):
+    # DataFrame 값을 first_row 행부터 CHUNK_ROWS 행씩 기록 (헤더 제외)
+    letters = [column_letter(first_col + i) for i in range(len(df.columns))]
+    for start in range(0, len(df), CHUNK_ROWS):
+        chunk = df.iloc[start:start + CHUNK_ROWS]
+        row_nums = np.arange(first_row + start, first_row + start + len(chunk)).astype(str).astype(object)
+        columns = [_cells(chunk[col], letter + row_nums) for letter, col in zip(letters, chunk.columns)]
+        rows = '<row r="' + row_nums + '">'
+        for cells in columns:
+            rows = rows + cells
+        stream.write(''.join((rows + '</row>').tolist()).encode('utf-8'))
+
+
+def _write_sheet(stream, df):
+    stream.write(SHEET_HEAD.encode('utf-8'))
+    header = ''.join(text_cell(f'{column_letter(i)}1', col, STYLE_HEADER) for i, col in enumerate(df.columns))
+    stream.write(f'<row r="1">{header}</row>'.encode('utf-8'))
+    write_rows(stream, df, first_row=2)
+    stream.write(SHEET_TAIL.encode('utf-8'))
+
+
+def write_xlsx(target, sheets, styles=STYLES):
+    # sheets: [(시트 이름, DataFrame 또는 write(stream) 함수), ...]. target: 파일 경로 또는 file-like
+    # 함수를 넘기면 시트 XML 전체를 직접 기록한다 (서식/조건부 서식이 필요한 시트). styles: styles.xml 내용
+    with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', CONTENT_TYPES.format(
+            sheets=''.join(SHEET_CONTENT_TYPE.format(i=i + 1) for i in range(len(sheets)))))
+        zf.writestr('_rels/.rels', ROOT_RELS)
+        zf.writestr('xl/workbook.xml',
+                    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>'
+                    + ''.join(f'<sheet name="{escape(name, {chr(34): "&quot;"})}" sheetId="{i + 1}" r:id="rId{i + 1}"/>'
+                              for i, (name, _) in enumerate(sheets))
+                    + '</sheets></workbook>')
+        zf.writestr('xl/_rels/workbook.xml.rels',
+                    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                    + ''.join(f'<Relationship Id="rId{i + 1}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+                              f'Target="worksheets/sheet{i + 1}.xml"/>' for i in range(len(sheets)))
+                    + f'<Relationship Id="rId{len(sheets) + 1}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+                    '</Relationships>')
+        zf.writestr('xl/styles.xml', styles)
+        for i, (_, content) in enumerate(sheets):
+            with zf.open(f'xl/worksheets/sheet{i + 1}.xml', 'w') as stream:
+                if callable(content):
+                    content(stream)
+                else:
+                    _write_sheet(stream, content)